@@ -0,0 +1,132 @@
+"""level1.ipynb の lambda 式の配列版（NumPy）
+
+ノートブックの lambda 式は1回の呼び出しで1つの値しか扱わない。ここでは
+同じ計算を配列をまとめて受け取って配列を返す関数として提供する。
+大きな列（np.memmap で開いたファイルなど）は apply_chunked() で
+決まった件数ずつ処理すれば、一時配列のメモリはブロック1つ分で済む。
+"""
+import numpy as np
+
+
+# 税率（%）
+TAX_RATE_PERCENT = 10
+
+# apply_chunked() で一度に処理する件数
+CHUNK_SIZE = 1 << 20
+
+
+def add_two_numbers_array(x, y):
+    """要素ごとの和（add_two_numbers の配列版）
+
+    Args:
+        x: 数値の配列
+        y: 数値の配列（x と同じ形かブロードキャストできる形）
+
+    Returns:
+        numpy.ndarray: x + y
+    """
+    return np.add(x, y)
+
+
+def square_array(x):
+    """要素ごとの2乗（square の配列版）
+
+    整数の配列は NumPy の整数型のまま計算するため、Python の int と違って
+    型の範囲を超えるとあふれる。
+
+    Args:
+        x: 数値の配列
+
+    Returns:
+        numpy.ndarray: x ** 2
+    """
+    return np.square(x)
+
+
+def add_tax_array(price, exact=False):
+    """要素ごとの税込み価格（add_tax の配列版）
+
+    既定では add_tax と同じく浮動小数点数で price * 1.1 を計算する。
+    exact=True では価格を最小単位（円やセント）の整数として受け取り、
+    税込み価格を最小単位に四捨五入した整数で返す。これは
+    Decimal(price) * Decimal('1.1') を ROUND_HALF_UP で整数に丸めた値と同じで、
+    浮動小数点数の誤差が出ない。
+
+    Args:
+        price: 価格の配列
+        exact: True で整数の最小単位による正確な計算をする
+
+    Returns:
+        numpy.ndarray: 税込み価格（exact=True では int64）
+
+    Raises:
+        TypeError: exact=True で価格が整数の配列でない場合
+    """
+    if not exact:
+        return np.multiply(price, 1.1)
+
+    price = np.asarray(price)
+    if not np.issubdtype(price.dtype, np.integer):
+        raise TypeError("exact=True では価格を整数（最小単位）の配列で渡す必要があります")
+    # 100 倍した税込み価格を、0.5 を絶対値の大きい方へ丸めて 100 で割る
+    scaled = np.abs(price.astype(np.int64)) * (100 + TAX_RATE_PERCENT)
+    return np.sign(price) * ((scaled + 50) // 100)
+
+
+def is_even_array(n):
+    """要素ごとの偶奇判定（is_even の配列版）
+
+    Args:
+        n: 数値の配列
+
+    Returns:
+        numpy.ndarray: 偶数なら True の真偽値配列
+    """
+    return np.remainder(n, 2) == 0
+
+
+def get_grade_array(score):
+    """要素ごとのグレード判定（get_grade の配列版）
+
+    Args:
+        score: 点数の配列
+
+    Returns:
+        numpy.ndarray: 'A'、'B'、'C' の文字列配列
+    """
+    score = np.asarray(score)
+    return np.select([score >= 80, score >= 60], ['A', 'B'], default='C')
+
+
+def apply_chunked(func, *columns, out=None, chunk_size=CHUNK_SIZE):
+    """列を chunk_size 件ずつ func に通して out に書き込む
+
+    func が作る一時配列はブロック1つ分の大きさで済むため、列が np.memmap の
+    ファイルでも全体をメモリに読み込まずに処理できる。
+
+    Args:
+        func: 配列を受け取って同じ長さの配列を返す関数（このモジュールの *_array 関数など）
+        *columns: 同じ長さの1次元配列
+        out: 書き込み先の配列（省略時は最初のブロックの結果の型で確保する）
+        chunk_size: 一度に処理する件数
+
+    Returns:
+        numpy.ndarray: 結果の配列（out を渡した場合は out）
+
+    Raises:
+        ValueError: 列が1つもない場合、または列の長さがそろっていない場合
+    """
+    if not columns:
+        raise ValueError("列を1つ以上渡す必要があります")
+    length = len(columns[0])
+    if any(len(column) != length for column in columns):
+        raise ValueError("列の長さをそろえる必要があります")
+    for start in range(0, length, chunk_size):
+        stop = min(start + chunk_size, length)
+        result = func(*(column[start:stop] for column in columns))
+        if out is None:
+            out = np.empty(length, dtype=np.asarray(result).dtype)
+        out[start:stop] = result
+    if out is None:
+        out = np.asarray(func(*columns))
+    return out
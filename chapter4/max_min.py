@@ -0,0 +1,219 @@
+"""get_max_min の大きなデータ向けの版（1パスの最大値・最小値）
+
+ノートブックの get_max_min = lambda *args: (max(args), min(args)) は
+すべての値をタプルに展開してから2回走査する。ここでは値を決まった件数
+ずつ読んで、そのブロックの最大値と最小値をまとめて求め、途中結果を
+合わせていく。データ全体を1回読むだけで、使うメモリは1ブロック分で済む。
+
+- max_min: 任意の iterable（ジェネレータやファイルの行など）
+- max_min_chunks: 配列やリストのブロックを順に返す iterable
+- max_min_array: NumPy 配列と np.memmap（workers でプロセス並列）
+- max_min_file: .npy ファイルや生のバイナリファイル（メモリマップで読む）
+
+同じ値が複数あるときは max() / min() と同じく先に現れたものを返す。
+NumPy 配列では NaN があれば NaN を返す（NumPy の規則）。
+"""
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+# 一般の iterable を読む1ブロックの件数
+BATCH_SIZE = 1 << 16
+
+# 配列を処理する1ブロックの要素数
+CHUNK_SIZE = 1 << 22
+
+# まだ値を読んでいないことを表す印
+_EMPTY = object()
+
+
+def _is_array_nan(value):
+    """NumPy の配列から求めた値が NaN かどうか（自分自身と等しくない値は NaN だけ）
+
+    Python の値は max() / min() と同じ比較で扱うため NaN とみなさない。
+    """
+    return isinstance(value, np.generic) and value != value
+
+
+def merge(results):
+    """ブロックごとの (最大値, 最小値) を合わせる
+
+    NumPy の配列のブロックから求めた結果が NaN なら、NumPy の max() / min() と
+    同じくそこで NaN を返す。Python の値は比較演算子でそのまま比べる。
+
+    Args:
+        results: (最大値, 最小値) の iterable（先に現れたブロックの順）
+
+    Returns:
+        tuple: (最大値, 最小値)
+
+    Raises:
+        ValueError: results が空の場合
+    """
+    results = iter(results)
+    try:
+        high, low = next(results)
+    except StopIteration:
+        raise ValueError("最大値・最小値を求める値がありません") from None
+    if _is_array_nan(high) or _is_array_nan(low):
+        return high, low
+    for block_high, block_low in results:
+        if _is_array_nan(block_high) or _is_array_nan(block_low):
+            return block_high, block_low
+        # 等しいときは先の値を残す（max() / min() と同じ）
+        if block_high > high:
+            high = block_high
+        if block_low < low:
+            low = block_low
+    return high, low
+
+
+def max_min(values, batch_size=BATCH_SIZE):
+    """任意の iterable の (最大値, 最小値) を1パスで求める
+
+    Args:
+        values: 比較できる値の iterable（NumPy 配列なら max_min_array を使う）
+        batch_size: 一度に読む件数
+
+    Returns:
+        tuple: (max(values), min(values)) と同じ組
+
+    Raises:
+        ValueError: values が空の場合
+    """
+    if isinstance(values, np.ndarray):
+        return max_min_array(values)
+    iterator = iter(values)
+    batches = iter(lambda: list(itertools.islice(iterator, batch_size)), [])
+    return max_min_chunks(batches)
+
+
+def max_min_chunks(chunks):
+    """ブロック（配列やリスト）を順に返す iterable の (最大値, 最小値)
+
+    空のブロックは読み飛ばす。リストなどのブロックは前のブロックまでの結果から
+    続けて max() / min() で畳み込むため、ブロックの分け方によらず全体に
+    max() / min() を1回かけたのと同じ結果になる（NaN を含む場合も）。
+    NumPy の配列のブロックに NaN があれば NaN を返す。
+
+    Args:
+        chunks: ブロックの iterable
+
+    Returns:
+        tuple: (最大値, 最小値)
+
+    Raises:
+        ValueError: 値が1つもない場合
+    """
+    high = low = _EMPTY
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        if isinstance(chunk, np.ndarray):
+            block_high, block_low = chunk.max(), chunk.min()
+            if _is_array_nan(block_high) or _is_array_nan(block_low):
+                return block_high, block_low
+            highs, lows = (block_high,), (block_low,)
+        else:
+            highs = lows = chunk
+        if high is _EMPTY:
+            high, low = max(highs), min(lows)
+        else:
+            # 等しいときは先の値を残す（max() / min() と同じ）
+            high = max(itertools.chain((high,), highs))
+            low = min(itertools.chain((low,), lows))
+    if high is _EMPTY:
+        raise ValueError("最大値・最小値を求める値がありません")
+    return high, low
+
+
+def _array_blocks(array, start, stop, chunk_size):
+    """平らにした配列の [start, stop) をブロックごとに返す"""
+    flat = array.reshape(-1)
+    for block_start in range(start, stop, chunk_size):
+        yield flat[block_start:min(block_start + chunk_size, stop)]
+
+
+def _reduce_partition(task):
+    """ワーカープロセスでファイルの一部の (最大値, 最小値) を求める（プールから呼ばれる）"""
+    filename, dtype, offset, size, start, stop, chunk_size = task
+    array = np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=(size,))
+    return max_min_chunks(_array_blocks(array, start, stop, chunk_size))
+
+
+def _file_offset(array):
+    """np.memmap（またはそのスライス）の先頭のファイル内の位置
+
+    スライスの filename と offset は元の np.memmap のものなので、
+    元の配列の先頭からのずれを足す。ファイルに対応しない配列では None。
+    """
+    if not isinstance(array, np.memmap) or array.filename is None or not array.flags.c_contiguous:
+        return None
+    root = array
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if not isinstance(root, np.memmap):
+        return None
+    return root.offset + (array.ctypes.data - root.ctypes.data)
+
+
+def max_min_array(array, chunk_size=CHUNK_SIZE, workers=1):
+    """NumPy 配列の全要素の (最大値, 最小値)
+
+    workers が2以上の場合は、np.memmap の元のファイルを区間に分けて
+    ワーカープロセスがそれぞれ開いて求め、最後に途中結果を合わせる。
+    workers が None の場合は、ファイルに対応しない配列なら1プロセスで求める。
+
+    Args:
+        array: 数値の配列または np.memmap（多次元なら全要素が対象）
+        chunk_size: 一度に処理する要素数
+        workers: ワーカープロセス数（None で CPU コア数）
+
+    Returns:
+        tuple: (最大値, 最小値)
+
+    Raises:
+        ValueError: 配列が空の場合、またはファイルに対応しない配列を workers を指定して並列で処理しようとした場合
+    """
+    size = array.size
+    offset = _file_offset(array)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if offset is not None else 1
+    if workers == 1 or size <= chunk_size:
+        return max_min_chunks(_array_blocks(array, 0, size, chunk_size))
+
+    if offset is None:
+        raise ValueError("並列で処理できるのはファイルに対応した連続な np.memmap だけです")
+    bounds = np.linspace(0, size, workers + 1, dtype=np.int64).tolist()
+    tasks = [(array.filename, array.dtype.str, offset, size, start, stop, chunk_size)
+             for start, stop in zip(bounds, bounds[1:]) if start < stop]
+    with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+        return merge(pool.map(_reduce_partition, tasks))
+
+
+def max_min_file(path, dtype=None, chunk_size=CHUNK_SIZE, workers=1):
+    """数値ファイルの (最大値, 最小値) をメモリマップで読んで求める
+
+    Args:
+        path: .npy ファイル、または dtype の値を並べただけの生のバイナリファイル
+        dtype: 生のバイナリファイルの型（.npy では省略する）
+        chunk_size: 一度に処理する要素数
+        workers: ワーカープロセス数（None で CPU コア数）
+
+    Returns:
+        tuple: (最大値, 最小値)
+
+    Raises:
+        ValueError: 生のバイナリファイルで dtype を省略した場合、または値がない場合
+    """
+    path = os.fspath(path)
+    if path.endswith('.npy'):
+        array = np.load(path, mmap_mode='r')
+    elif dtype is None:
+        raise ValueError("生のバイナリファイルには dtype を指定する必要があります")
+    else:
+        array = np.memmap(path, dtype=dtype, mode='r')
+    return max_min_array(array, chunk_size=chunk_size, workers=workers)
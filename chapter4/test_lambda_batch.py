@@ -0,0 +1,91 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+
+from lambda_batch import (
+    add_tax_array, add_two_numbers_array, apply_chunked, get_grade_array, is_even_array, square_array,
+)
+
+
+# ノートブックの lambda 式（配列版の検算用）
+add_two_numbers = lambda x, y: x + y  # noqa: E731
+square = lambda x: x ** 2  # noqa: E731
+add_tax = lambda price: price * 1.1  # noqa: E731
+is_even = lambda n: n % 2 == 0  # noqa: E731
+get_grade = lambda score: "A" if score >= 80 else "B" if score >= 60 else "C"  # noqa: E731
+
+
+class TestArrayVersions:
+    """配列版とノートブックの lambda 式の一致を確かめるテストクラス"""
+
+    def test_add_two_numbers(self):
+        """add_two_numbers_array は要素ごとに add_two_numbers と一致する"""
+        x = np.array([5, 0, -2, 10**9])
+        y = np.array([3, 0, 3, 7])
+        assert add_two_numbers_array(x, y).tolist() == [add_two_numbers(a, b) for a, b in zip(x.tolist(), y.tolist())]
+
+    def test_square(self):
+        """square_array は要素ごとに square と一致する"""
+        x = np.arange(-50, 50)
+        assert square_array(x).tolist() == [square(v) for v in x.tolist()]
+
+    def test_add_tax(self):
+        """add_tax_array は要素ごとに add_tax と同じ浮動小数点数になる"""
+        price = np.array([1000.0, 100.0, 0.0, 19.99, 123456.78])
+        assert add_tax_array(price).tolist() == [add_tax(p) for p in price.tolist()]
+
+    def test_add_tax_exact_matches_decimal(self):
+        """exact=True は Decimal で計算して ROUND_HALF_UP で丸めた値と一致する"""
+        cents = np.arange(-2000, 2000)
+        expected = [int((Decimal(c) * Decimal('1.1')).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+                    for c in cents.tolist()]
+        assert add_tax_array(cents, exact=True).tolist() == expected
+        assert add_tax_array(np.array([1000]), exact=True).tolist() == [1100]
+
+    def test_add_tax_exact_requires_integers(self):
+        """exact=True で整数以外の配列を渡すと TypeError を発生させる"""
+        with pytest.raises(TypeError):
+            add_tax_array(np.array([1.5]), exact=True)
+
+    def test_is_even(self):
+        """is_even_array は要素ごとに is_even と一致する（負の数を含む）"""
+        n = np.arange(-10, 11)
+        assert is_even_array(n).tolist() == [is_even(v) for v in n.tolist()]
+
+    def test_get_grade(self):
+        """get_grade_array は境界値を含めて get_grade と一致する"""
+        score = np.array([0, 59, 59.5, 60, 79, 80, 85, 100])
+        assert get_grade_array(score).tolist() == [get_grade(s) for s in score.tolist()]
+
+
+class TestApplyChunked:
+    """ブロックごとの処理のテストクラス"""
+
+    def test_matches_whole_array(self):
+        """ブロックに分けても配列全体で計算した場合と同じ結果になる"""
+        score = np.random.default_rng(0).integers(0, 101, 10007)
+        result = apply_chunked(get_grade_array, score, chunk_size=1000)
+        assert (result == get_grade_array(score)).all()
+
+    def test_two_columns_into_memmap(self, tmp_path):
+        """ファイルの列を読み書きしてもメモリに全体を載せずに処理できる"""
+        x = np.lib.format.open_memmap(tmp_path / "x.npy", mode='w+', dtype=np.int64, shape=(5000,))
+        x[:] = np.arange(5000)
+        out = np.lib.format.open_memmap(tmp_path / "out.npy", mode='w+', dtype=np.int64, shape=(5000,))
+        apply_chunked(add_two_numbers_array, x, x, out=out, chunk_size=512)
+        assert (out == 2 * np.arange(5000)).all()
+
+    def test_rejects_mismatched_lengths(self):
+        """列の長さがそろっていないと ValueError を発生させる"""
+        with pytest.raises(ValueError):
+            apply_chunked(add_two_numbers_array, np.zeros(3), np.zeros(4))
+
+    def test_rejects_no_columns(self):
+        """列を1つも渡さないと ValueError を発生させる"""
+        with pytest.raises(ValueError, match="列を1つ以上"):
+            apply_chunked(square_array)
+
+    def test_empty_column(self):
+        """空の列は空の結果になる"""
+        assert len(apply_chunked(square_array, np.array([], dtype=np.int64))) == 0
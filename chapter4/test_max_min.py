@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from max_min import BATCH_SIZE, max_min, max_min_array, max_min_chunks, max_min_file, merge
+
+
+# ノートブックの lambda 式（検算用）
+get_max_min = lambda *args: (max(args), min(args))  # noqa: E731
+
+
+class TestMaxMin:
+    """1パスの最大値・最小値のテストクラス"""
+
+    def test_matches_get_max_min(self):
+        """ノートブックの get_max_min と同じ結果になる"""
+        assert max_min([1, 5, 3, 9, 2]) == get_max_min(1, 5, 3, 9, 2)
+        assert max_min((10, 20)) == get_max_min(10, 20)
+
+    def test_generator_across_batches(self):
+        """ジェネレータをブロックに分けて読んでも同じ結果になる"""
+        values = [(i * 7919) % 1000 - 500 for i in range(10000)]
+        assert max_min((v for v in values), batch_size=64) == get_max_min(*values)
+
+    def test_ties_keep_first_value(self):
+        """等しい値が複数あるときは max() / min() と同じく先の値を返す"""
+        high, low = max_min([1, 2.0, 2, 1.0], batch_size=1)
+        assert (high, low) == (2, 1)
+        assert type(high) is float and type(low) is int
+
+    @pytest.mark.parametrize('batch_size', [1, 2, 3, BATCH_SIZE])
+    def test_nan_matches_builtin_at_any_batch_size(self, batch_size):
+        """Python の値の NaN はブロックの大きさによらず max() / min() と同じ結果になる"""
+        for values in ([1.0, 2.0, float('nan'), 5.0], [float('nan'), 3.0, 1.0], [4.0, 0.5, float('nan')]):
+            high, low = max_min(values, batch_size=batch_size)
+            expected_high, expected_low = get_max_min(*values)
+            assert repr(high) == repr(expected_high)
+            assert repr(low) == repr(expected_low)
+
+    def test_empty_raises(self):
+        """値がなければ ValueError を発生させる"""
+        with pytest.raises(ValueError):
+            max_min(iter([]))
+        with pytest.raises(ValueError):
+            merge([])
+
+    def test_chunks(self):
+        """ブロックの iterable から求められ、空のブロックは読み飛ばす"""
+        chunks = [np.array([3, 8]), [], [-4, 6], np.array([7])]
+        assert max_min_chunks(chunks) == (8, -4)
+
+
+class TestMaxMinArray:
+    """配列・ファイル版のテストクラス"""
+
+    @pytest.fixture
+    def values(self):
+        return np.random.default_rng(1).integers(-10**6, 10**6, 100003)
+
+    def test_array_in_chunks(self, values):
+        """配列をブロックに分けても全体の最大値・最小値と一致する"""
+        assert max_min_array(values, chunk_size=1000) == (values.max(), values.min())
+
+    def test_npy_file(self, tmp_path, values):
+        """.npy ファイルをメモリマップで読んで求められる"""
+        path = tmp_path / "values.npy"
+        np.save(path, values)
+        assert max_min_file(path, chunk_size=4096) == (values.max(), values.min())
+
+    def test_raw_file_in_parallel(self, tmp_path, values):
+        """生のバイナリファイルを区間に分けてプロセス並列で求められる"""
+        path = tmp_path / "values.bin"
+        values.astype('<i8').tofile(path)
+        assert max_min_file(path, dtype='<i8', chunk_size=4096, workers=3) == (values.max(), values.min())
+
+    def test_raw_file_requires_dtype(self, tmp_path):
+        """生のバイナリファイルで dtype を省略すると ValueError を発生させる"""
+        path = tmp_path / "values.bin"
+        np.arange(10).tofile(path)
+        with pytest.raises(ValueError):
+            max_min_file(path)
+
+    def test_nan_after_first_chunk(self):
+        """最初のブロック以外に NaN があっても NumPy と同じく NaN を返す"""
+        values = np.arange(100, dtype=float)
+        values[70] = np.nan
+        high, low = max_min_array(values, chunk_size=16)
+        assert np.isnan(high) and np.isnan(low)
+
+    def test_sliced_memmap_in_parallel(self, tmp_path, values):
+        """np.memmap のスライスでもスライスの範囲だけを並列で求める"""
+        path = tmp_path / "values.npy"
+        np.save(path, values)
+        view = np.load(path, mmap_mode='r')[50000:]
+        expected = (values[50000:].max(), values[50000:].min())
+        assert max_min_array(view, chunk_size=4096, workers=3) == expected
+
+    def test_parallel_requires_memmap(self, values):
+        """ファイルに対応しない配列は並列で処理できない"""
+        with pytest.raises(ValueError):
+            max_min_array(values, chunk_size=1000, workers=2)
+
+    def test_default_workers_falls_back_to_serial(self, values):
+        """workers=None ではファイルに対応しない配列を1プロセスで求める"""
+        assert max_min_array(values, chunk_size=1000, workers=None) == (values.max(), values.min())
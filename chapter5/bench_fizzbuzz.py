@@ -0,0 +1,19 @@
+"""FizzBuzz の性能ベンチマーク（pytest-benchmark）"""
+from fizzbuzz import fizzbuzz, fizzbuzz_range
+from run_fizzbuzz import format_lines
+
+
+class TestFizzBuzzBenchmarks:
+    """FizzBuzz のベンチマーク"""
+
+    def test_fizzbuzz_100k(self, benchmark):
+        """fizzbuzz を1から10万まで"""
+        benchmark(lambda: [fizzbuzz(i) for i in range(1, 100001)])
+
+    def test_fizzbuzz_range_100k(self, benchmark):
+        """fizzbuzz_range で1から10万まで"""
+        benchmark(fizzbuzz_range, 1, 100001)
+
+    def test_format_lines_100k(self, benchmark):
+        """出力形式のバイト列を1から10万まで"""
+        benchmark(format_lines, 1, 100001)
@@ -0,0 +1,126 @@
+"""Pong の性能ベンチマーク（pytest-benchmark）
+
+通常のテストとは分けて `make bench` で実行する。保存済みのベースラインと
+比べて、最小値が閾値（Makefile の BENCH_FAIL、既定は 25%）を超えて
+遅くなったら失敗する。
+"""
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+import pygame
+
+from pong import Ball, PongGame
+from pong_chaos import ChaosSimulation
+from pong_core import HelperItem
+from pong_env import VectorPongEnv
+
+
+def _load_items_and_effects(sim):
+    """アイテム3個と全効果が有効な状態にする（効果は切れないようにする）"""
+    sim.effect_duration = 10 ** 9
+    sim.item_lifetime = 10 ** 9
+    for player in ('left', 'right'):
+        for item_type in sim.item_types:
+            sim._apply_item_effect(player, item_type)
+    for x, item_type in zip((300, 400, 500), sim.item_types):
+        item = HelperItem(x, 150, item_type, sim.item_lifetime)
+        item.expires_at = sim.tick + item.lifetime - 1
+        sim.item_timers.schedule(item.expires_at, item)
+        sim.helper_items.append(item)
+
+
+def _run_python(code):
+    """別プロセスの Python でコードを実行する（ダミーのビデオドライバ）"""
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    subprocess.run([sys.executable, '-c', code], check=True, env=env,
+                   cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def game(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    game = PongGame(seed=0)
+    yield game
+    pygame.quit()
+
+
+class TestPongBenchmarks:
+    """Pong のベンチマーク"""
+
+    def test_ball_update(self, benchmark):
+        """Ball.update を1万回"""
+        ball = Ball(400, 300, 5, 3)
+
+        def run():
+            for _ in range(10000):
+                ball.update(800, 600)
+
+        benchmark(run)
+
+    def test_game_update_with_items_and_effects(self, benchmark, game):
+        """アイテムと効果が有効な状態で PongGame.update を1000ティック
+
+        毎ラウンド同じ状態から始めるため、計測前にスナップショットへ戻す
+        （アイテムの取得や得点で状態が変わり、ラウンドごとに仕事量が違わないように）。
+        """
+        _load_items_and_effects(game)
+        state = game.snapshot()
+
+        def setup():
+            game.restore(state)
+
+        def run():
+            for _ in range(1000):
+                game.update()
+
+        benchmark.pedantic(run, setup=setup, rounds=30)
+
+    def test_draw_full(self, benchmark, game):
+        """全画面描画（ダミーのビデオドライバ）"""
+        _load_items_and_effects(game)
+        benchmark(game.draw)
+
+    def test_draw_dirty_rects(self, benchmark, game):
+        """ダーティ矩形描画（ダミーのビデオドライバ）"""
+        game.dirty_rects = True
+        _load_items_and_effects(game)
+        game.draw()
+        benchmark(game.draw)
+
+    def test_chaos_update_500_balls(self, benchmark):
+        """カオスモード（ボール500個）の更新を60ティック"""
+        sim = ChaosSimulation(n_balls=500, seed=0)
+        sim.step(60)
+        benchmark(sim.step, 60)
+
+    def test_vector_env_step_256_games(self, benchmark):
+        """ベクトル化環境（256試合）を60ステップ"""
+        env = VectorPongEnv(256, seed=0)
+        env.reset()
+        actions = np.arange(256) % 3
+
+        def run():
+            for _ in range(60):
+                env.step(actions)
+
+        benchmark(run)
+
+
+class TestStartupBenchmarks:
+    """起動時間のベンチマーク（新しいプロセスで計測する）"""
+
+    def test_interpreter_baseline(self, benchmark):
+        """比較用: 何もしない Python の起動"""
+        benchmark.pedantic(_run_python, args=('pass',), rounds=5)
+
+    def test_import_pong(self, benchmark):
+        """pong の import まで（pygame は読み込まない）"""
+        benchmark.pedantic(_run_python, args=('import pong',), rounds=5)
+
+    def test_first_frame(self, benchmark):
+        """PongGame を作って最初のフレームを描くまで"""
+        code = "import pong; game = pong.PongGame(seed=0); game.update(); game.draw()"
+        benchmark.pedantic(_run_python, args=(code,), rounds=5)
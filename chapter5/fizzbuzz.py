@@ -1,3 +1,171 @@
+import functools
+import math
+
+
+# 周期表（ホイール）を作る周期の上限。これより大きい周期は余りごとの語をキャッシュする
+MAX_WHEEL_SIZE = 1 << 16
+
+# 範囲をまとめて作るときの1ブロックの大きさ（15 の倍数）
+BLOCK_SIZE = 15 * 4096
+
+
+class FizzBuzzRules:
+    """(割る数, 語) の規則の並びを周期表（ホイール）に展開した FizzBuzz
+    
+    n の結果は、n を割り切る割る数の語を規則の順につなげたもの（どれも
+    割り切らなければ数字そのもの）。結果は割る数の最小公倍数 period を
+    周期とするため、余りごとの語を表にしておけば1件は表の参照1回で済む。
+    周期が MAX_WHEEL_SIZE を超える場合は表を作らず、1件ずつの呼び出しでは
+    余りごとの語を大きさに上限のあるキャッシュに入れて使い、範囲では
+    規則ごとに倍数の位置へ語を足していく。
+    """
+    
+    def __init__(self, rules, max_wheel_size=MAX_WHEEL_SIZE, cache_size=4096):
+        """規則の展開
+        
+        Args:
+            rules: (割る数, 語) の並び（語はこの順につなげる）
+            max_wheel_size: 周期表を作る周期の上限
+            cache_size: 周期表を作らない場合のキャッシュの件数
+            
+        Raises:
+            TypeError: 割る数が整数でない、または語が文字列でない場合
+            ValueError: 割る数が1以上でない場合
+        """
+        rules = tuple((divisor, word) for divisor, word in rules)
+        for divisor, word in rules:
+            if not isinstance(divisor, int) or not isinstance(word, str):
+                raise TypeError("規則は (整数, 文字列) の組である必要があります")
+            if divisor < 1:
+                raise ValueError("割る数は1以上の整数である必要があります")
+        self.rules = rules
+        self.period = math.lcm(*(divisor for divisor, _ in rules))
+        
+        if self.period <= max_wheel_size:
+            # 同じ語は1つの文字列オブジェクトを共有する
+            words = {}
+            wheel = (words.setdefault(word, word) for word in map(self._compute_word, range(self.period)))
+            self.wheel = tuple(wheel)
+            self._number_positions = tuple(r for r, word in enumerate(self.wheel) if not word)
+            self._word = None
+        else:
+            self.wheel = None
+            self._number_positions = None
+            self._word = functools.lru_cache(maxsize=cache_size)(self._compute_word)
+    
+    def _compute_word(self, r):
+        """余りが r の数の語（数字をそのまま出す場合は空文字列）"""
+        return "".join(word for divisor, word in self.rules if r % divisor == 0)
+    
+    def __call__(self, n):
+        """n の結果
+        
+        Args:
+            n: 0以上の整数
+            
+        Returns:
+            str: n の結果
+            
+        Raises:
+            TypeError: 引数が整数でない場合
+            ValueError: 引数が負の数の場合
+        """
+        _validate_input(n)
+        wheel = self.wheel
+        if wheel is not None:
+            return wheel[n % self.period] or str(n)
+        return self._word(n % self.period) or str(n)
+    
+    def range(self, start, stop):
+        """start 以上 stop 未満の結果のリスト
+        
+        Args:
+            start: 範囲の先頭（0以上の整数）
+            stop: 範囲の終わり（0以上の整数、この値は含まない）
+            
+        Returns:
+            list: [self(n) for n in range(start, stop)] と同じリスト
+            
+        Raises:
+            TypeError: 引数が整数でない場合
+            ValueError: 引数が負の数の場合
+        """
+        _validate_input(start)
+        _validate_input(stop)
+        return self._block(start, stop)
+    
+    def iter_range(self, start, stop):
+        """start 以上 stop 未満の結果を BLOCK_SIZE 個ずつ作って順に返すイテレータ
+        
+        入力の検証は呼び出した時点で1回だけ行う。
+        
+        Args:
+            start: 範囲の先頭（0以上の整数）
+            stop: 範囲の終わり（0以上の整数、この値は含まない）
+            
+        Returns:
+            iterator: self(n) と同じ結果を順に返すイテレータ
+            
+        Raises:
+            TypeError: 引数が整数でない場合
+            ValueError: 引数が負の数の場合
+        """
+        _validate_input(start)
+        _validate_input(stop)
+        return self._iter_blocks(start, stop)
+    
+    def _iter_blocks(self, start, stop):
+        """範囲をブロックに分けて結果を順に返す"""
+        for block_start in range(start, stop, BLOCK_SIZE):
+            yield from self._block(block_start, min(block_start + BLOCK_SIZE, stop))
+    
+    def _block(self, start, stop):
+        """start 以上 stop 未満の結果のリスト（検証済みの範囲）"""
+        period = self.period
+        size = stop - start
+        if size <= 0:
+            return []
+        if self.wheel is None:
+            return self._block_by_divisors(start, stop)
+        
+        wheel = self.wheel
+        if 16 * len(self._number_positions) > size:
+            # 周期が範囲に比べて長いときは1件ずつ埋める
+            return [wheel[n % period] or str(n) for n in range(start, stop)]
+        # 周期表を範囲の先頭の位置から並べる（余分な要素は作らない）
+        offset = start % period
+        tiled = list(wheel[offset:offset + size])
+        remaining = size - len(tiled)
+        if remaining:
+            tiled += wheel * (remaining // period)
+            tiled += wheel[:remaining % period]
+        # 数字の位置だけを周期ごとのスライスでまとめて埋める
+        for r in self._number_positions:
+            first = (r - start) % period
+            tiled[first::period] = map(str, range(start + first, stop, period))
+        return tiled
+    
+    def _block_by_divisors(self, start, stop):
+        """周期表がない場合の start 以上 stop 未満の結果のリスト
+        
+        範囲を順に走査すると余りは周期に達するまで重ならず、余りごとの
+        キャッシュは当たらない。代わりに規則ごとに倍数の位置へスライスで
+        語を足していく（手間は範囲の大きさ / 割る数の合計）。
+        """
+        words = [""] * (stop - start)
+        for divisor, word in self.rules:
+            first = -start % divisor
+            words[first::divisor] = [w + word for w in words[first::divisor]]
+        return [word or str(n) for word, n in zip(words, range(start, stop))]
+
+
+# 3 → "Fizz"、5 → "Buzz" の規則（fizzbuzz 関数はこの規則のプリセット）
+FIZZBUZZ = FizzBuzzRules([(3, "Fizz"), (5, "Buzz")])
+
+# 15 で割った余りごとの語（数字をそのまま出す位置は空文字列）
+CYCLE = FIZZBUZZ.wheel
+
+
 def fizzbuzz(n):
     """FizzBuzz の実装
     
@@ -13,13 +181,8 @@ def fizzbuzz(n):
     """
     _validate_input(n)
     
-    result = ""
-    if n % 3 == 0:
-        result += "Fizz"
-    if n % 5 == 0:
-        result += "Buzz"
-    
-    return result if result else str(n)
+    # FIZZBUZZ の周期表を1回引くだけ（FIZZBUZZ(n) と同じ結果）
+    return CYCLE[n % 15] or str(n)
 
 
 def _validate_input(n):
@@ -28,4 +191,46 @@ def _validate_input(n):
         raise TypeError("引数は整数である必要があります")
     
     if n < 0:
-        raise ValueError("引数は0以上の整数である必要があります")
\ No newline at end of file
+        raise ValueError("引数は0以上の整数である必要があります")
+
+
+def _multiples(k, x):
+    """0 以上 x 未満の k の倍数の個数"""
+    return (x + k - 1) // k
+
+
+def iter_fizzbuzz_range(start, stop):
+    """start 以上 stop 未満の FizzBuzz の結果を順に返すイテレータ
+    
+    入力の検証は最初に1回だけ行い、結果は BLOCK_SIZE 個ずつまとめて作る。
+    使うメモリは範囲の大きさによらず1ブロック分になる。
+    
+    Args:
+        start: 範囲の先頭（0以上の整数）
+        stop: 範囲の終わり（0以上の整数、この値は含まない）
+        
+    Returns:
+        iterator: fizzbuzz(n) と同じ結果を順に返すイテレータ
+        
+    Raises:
+        TypeError: 引数が整数でない場合
+        ValueError: 引数が負の数の場合
+    """
+    return FIZZBUZZ.iter_range(start, stop)
+
+
+def fizzbuzz_range(start, stop):
+    """start 以上 stop 未満の FizzBuzz の結果のリスト
+    
+    Args:
+        start: 範囲の先頭（0以上の整数）
+        stop: 範囲の終わり（0以上の整数、この値は含まない）
+        
+    Returns:
+        list: [fizzbuzz(n) for n in range(start, stop)] と同じリスト
+        
+    Raises:
+        TypeError: 引数が整数でない場合
+        ValueError: 引数が負の数の場合
+    """
+    return FIZZBUZZ.range(start, stop)
\ No newline at end of file
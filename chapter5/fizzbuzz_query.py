@@ -0,0 +1,111 @@
+"""FizzBuzz の結果についての問い合わせ（文字列を作らずに O(1) で答える）
+
+分類は 'Fizz'、'Buzz'、'FizzBuzz'、'number'（数字がそのまま出るもの）の4つ。
+範囲の件数は 3・5・15 の倍数の個数から包除原理で求め、k 番目の数は
+周期 15 の中での位置から求める。どれも fizzbuzz と同じく 0 は 'FizzBuzz' で、
+引数の検証も同じ規則に従う。
+"""
+from fizzbuzz import CYCLE, _multiples, _validate_input
+
+
+CATEGORIES = ('Fizz', 'Buzz', 'FizzBuzz', 'number')
+
+# 分類ごとの 15 で割った余りの一覧（昇順）
+_RESIDUES = {name: tuple(r for r, word in enumerate(CYCLE) if (word or 'number') == name) for name in CATEGORIES}
+
+
+def _validate_category(name):
+    """分類名の検証"""
+    if name not in _RESIDUES:
+        raise ValueError(f"分類は {', '.join(CATEGORIES)} のいずれかである必要があります")
+
+
+def category(n):
+    """n の分類
+
+    Args:
+        n: 0以上の整数
+
+    Returns:
+        str: 'Fizz'、'Buzz'、'FizzBuzz'、'number' のいずれか
+
+    Raises:
+        TypeError: 引数が整数でない場合
+        ValueError: 引数が負の数の場合
+    """
+    _validate_input(n)
+    return CYCLE[n % 15] or 'number'
+
+
+def counts(start, stop):
+    """start 以上 stop 未満の分類ごとの件数
+
+    Args:
+        start: 範囲の先頭（0以上の整数）
+        stop: 範囲の終わり（0以上の整数、この値は含まない）
+
+    Returns:
+        dict: 分類名 -> 件数
+
+    Raises:
+        TypeError: 引数が整数でない場合
+        ValueError: 引数が負の数の場合
+    """
+    _validate_input(start)
+    _validate_input(stop)
+    stop = max(start, stop)
+    threes = _multiples(3, stop) - _multiples(3, start)
+    fives = _multiples(5, stop) - _multiples(5, start)
+    fifteens = _multiples(15, stop) - _multiples(15, start)
+    return {
+        'Fizz': threes - fifteens,
+        'Buzz': fives - fifteens,
+        'FizzBuzz': fifteens,
+        'number': (stop - start) - threes - fives + fifteens,
+    }
+
+
+def count(name, start, stop):
+    """start 以上 stop 未満で分類が name の件数
+
+    Args:
+        name: 分類名
+        start: 範囲の先頭（0以上の整数）
+        stop: 範囲の終わり（0以上の整数、この値は含まない）
+
+    Returns:
+        int: 件数
+
+    Raises:
+        TypeError: 範囲が整数でない場合
+        ValueError: 範囲が負の数の場合、または分類名が不正な場合
+    """
+    _validate_category(name)
+    return counts(start, stop)[name]
+
+
+def nth(name, k, start=0):
+    """start 以上で分類が name の k 番目の数
+
+    Args:
+        name: 分類名
+        k: 何番目か（1始まり）
+        start: 数え始める数（0以上の整数、既定は 0）
+
+    Returns:
+        int: k 番目の数
+
+    Raises:
+        TypeError: 引数が整数でない場合
+        ValueError: 引数が負の数の場合、k が 0 の場合、または分類名が不正な場合
+    """
+    _validate_category(name)
+    _validate_input(k)
+    _validate_input(start)
+    if k == 0:
+        raise ValueError("k は1以上の整数である必要があります")
+    residues = _RESIDUES[name]
+    # 0 から数えた通し番号に直して、周期と周期内の位置に分ける
+    index = count(name, 0, start) + k - 1
+    cycles, position = divmod(index, len(residues))
+    return 15 * cycles + residues[position]
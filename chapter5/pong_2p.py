@@ -1,19 +1,82 @@
 #!/usr/bin/env python3
-"""Pong 2Pモードの実行スクリプト"""
+"""Pong 2Pモードの実行スクリプト
+
+引数なしでは1台のキーボードを2人で使う。--peer を指定すると UDP で
+相手とつないでネット対戦する（ロールバックネットコード）。
+"""
+import argparse
 
 from pong import PongGame
+from pong_core import PongSimulation
+from pong_net import RollbackSession, UdpTransport
+
+
+class NetplayGame(PongGame):
+    """ネット対戦用の PongGame（自分のパドルは W/S キーで操作）"""
+
+    def __init__(self, transport, local_side='left', input_delay=2, seed=0, **kwargs):
+        """ゲームの初期化
+
+        Args:
+            transport: 相手とつながったトランスポート
+            local_side: 自分のパドル（'left' または 'right'）
+            input_delay: 入力遅延（ティック数）
+            seed: 乱数シード（相手と同じ値にする）
+            **kwargs: PongGame に渡す引数
+        """
+        super().__init__(cpu_mode=False, seed=seed, **kwargs)
+        self.transport = transport
+        # ロールバックの再シミュレーションでは描画用の処理を通さずに進める
+        self.session = RollbackSession(self, transport, local_side, input_delay,
+                                       step=lambda left, right: PongSimulation.update(self, left, right))
+
+    def update(self, left_input=None, right_input=None):
+        """自分の入力でセッションを1ティック進める（相手を待つ間は止まる）"""
+        scores = (self.left_score, self.right_score)
+        previous = self._positions()
+        if self.session.advance(self.left_input):
+            self._previous_positions = previous if scores == (self.left_score, self.right_score) else None
 
+    def run(self, max_speed=False):
+        """ゲームメインループ（終了時に通信を閉じる）"""
+        try:
+            super().run(max_speed)
+        finally:
+            self.transport.close()
 
-def main():
+
+def _parse_address(text):
+    """'host:port' を (host, port) に変換"""
+    host, _, port = text.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def main(argv=None):
     """2プレイヤーモードでPongゲームを起動"""
+    parser = argparse.ArgumentParser(description="Pong 2Pモード")
+    parser.add_argument('--peer', metavar='HOST:PORT', help="ネット対戦の相手のアドレス")
+    parser.add_argument('--port', type=int, default=50505, help="ネット対戦で待ち受けるポート")
+    parser.add_argument('--side', choices=('left', 'right'), default='left', help="自分のパドル")
+    parser.add_argument('--delay', type=int, default=2, help="入力遅延（ティック数）")
+    parser.add_argument('--seed', type=int, default=0, help="乱数シード（相手と同じ値にする）")
+    args = parser.parse_args(argv)
+
+    if args.peer:
+        print(f"Starting Pong Net Play as {args.side} player (port {args.port} -> {args.peer})...")
+        print("Your paddle: W/S keys")
+        transport = UdpTransport(('0.0.0.0', args.port), _parse_address(args.peer))
+        game = NetplayGame(transport, args.side, args.delay, args.seed)
+        game.run()
+        return
+
     print("Starting Pong in 2-Player Mode...")
     print("Player 1: W/S keys")
     print("Player 2: UP/DOWN arrow keys")
     print("Press ESC or close window to quit")
-    
+
     game = PongGame(cpu_mode=False)
     game.run()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
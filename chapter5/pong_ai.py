@@ -0,0 +1,222 @@
+"""Pong の CPU 対戦相手（ボール軌道の予測と難易度つきコントローラー）"""
+import math
+
+
+def fold_y(y, low, high):
+    """上下の壁での反射を折り返しで求める
+
+    壁の間を往復する運動は、区間 [low, high] を周期 2 * (high - low) で
+    折り返した位置に等しい。
+
+    Args:
+        y: 壁がないとしたときの Y 座標
+        low: ボール中心が取りうる最小の Y 座標
+        high: ボール中心が取りうる最大の Y 座標
+
+    Returns:
+        float: 反射を考慮した Y 座標
+    """
+    span = high - low
+    if span <= 0:
+        return low
+    offset = (y - low) % (2 * span)
+    if offset > span:
+        offset = 2 * span - offset
+    return low + offset
+
+
+def _ticks_to_wall(y, velocity_y, low, high):
+    """従来の判定でボールが次に壁に当たるまでのティック数（当たらなければ None）
+
+    Ball.update は1ティック動いた後で壁を越えていれば壁の位置に戻すため、
+    当たるのは Y が low 以下（または high 以上）になる最初の整数ティック。
+    """
+    if velocity_y < 0:
+        return max(1, math.ceil((y - low) / -velocity_y))
+    if velocity_y > 0:
+        return max(1, math.ceil((high - y) / velocity_y))
+    return None
+
+
+def predict_ball(sim, target_x):
+    """ボールが X = target_x に到達する位置と時間を予測
+
+    スイープ判定では壁で正確に反射するため、到達位置は折り返しで O(1) で
+    求まる。従来の判定では壁を越えたティックにボールを壁の位置に戻す
+    （越えた分だけ反射が遅れる）ため、壁に当たるティックごとに区切って
+    同じ動きをたどる（手間は反射の回数に比例する）。
+
+    減速効果は X・Y 両方の速度に同じ倍率でかかるため軌跡の形は変わらず、
+    到達するまでのティック数だけが変わる。期限の来る減速効果はその時点で
+    速度が戻るものとして区間ごとに計算する（効果の数は高々数個）。
+
+    Args:
+        sim: PongSimulation
+        target_x: 予測する X 座標（パドル面にボール中心が触れる位置）
+
+    Returns:
+        tuple: (到達時の Y 座標, 到達までのティック数)。遠ざかっている場合は None
+    """
+    ball = sim.ball
+    dx = target_x - ball.x
+    if ball.velocity_x == 0 or dx * ball.velocity_x <= 0:
+        return None
+    low = ball.radius
+    high = sim.height - ball.radius
+    expiries = sorted((effect.expires_at - sim.tick, effect.multiplier)
+                      for effect in sim.ball_speed_effects if effect.expires_at > sim.tick)
+
+    if sim.swept_collisions:
+        # 到達位置（軌跡は速度の大きさによらない）
+        y = fold_y(ball.y + ball.velocity_y * (dx / ball.velocity_x), low, high)
+        wall_low = wall_high = None
+    else:
+        y = ball.y
+        wall_low, wall_high = low, high
+
+    # 減速効果の期限と（従来の判定では）壁に当たるティックで区切って進める
+    x = ball.x
+    velocity_x = ball.velocity_x
+    velocity_y = ball.velocity_y
+    ticks = 0.0
+    while True:
+        until_target = (target_x - x) / velocity_x
+        until_expiry = expiries[0][0] - ticks if expiries else None
+        until_wall = None if wall_low is None else _ticks_to_wall(y, velocity_y, wall_low, wall_high)
+
+        step = min((t for t in (until_expiry, until_wall) if t is not None), default=None)
+        # 到達と同じティックに壁に当たる場合は、壁の位置に戻してから到達する
+        if step is None or until_target < step - 1e-9:
+            if wall_low is not None:
+                y += velocity_y * until_target
+            return y, ticks + until_target
+        x += velocity_x * step
+        ticks += step
+        if step == until_wall:
+            y = wall_low if velocity_y < 0 else wall_high
+            velocity_y = -velocity_y
+        elif wall_low is not None:
+            y += velocity_y * step
+        # 同じティックに壁と期限が重なった場合は、動いた後で速度が戻る
+        while expiries and expiries[0][0] - ticks <= 0:
+            multiplier = expiries.pop(0)[1]
+            velocity_x /= multiplier
+            velocity_y /= multiplier
+
+
+class CpuController:
+    """パドルを動かす CPU コントローラー（既定は右パドル）
+
+    難易度は予測の誤差と反応の遅れで決まる。anticipate が False の場合は
+    従来どおり現在のボール位置を追いかける（'classic'）。
+    """
+
+    DIFFICULTIES = {
+        'classic': {'anticipate': False, 'prediction_error': 30, 'reaction_delay': (5, 15),
+                    'speed': 4, 'speed_jitter': 1, 'miss_chance': 0.03},
+        'easy': {'anticipate': True, 'prediction_error': 60, 'reaction_delay': (15, 30),
+                 'speed': 3, 'speed_jitter': 1, 'miss_chance': 0.05},
+        'normal': {'anticipate': True, 'prediction_error': 30, 'reaction_delay': (8, 16),
+                   'speed': 4, 'speed_jitter': 1, 'miss_chance': 0.03},
+        'hard': {'anticipate': True, 'prediction_error': 8, 'reaction_delay': (2, 6),
+                 'speed': 6, 'speed_jitter': 0.5, 'miss_chance': 0.0},
+    }
+
+    def __init__(self, anticipate=False, prediction_error=30, reaction_delay=(5, 15),
+                 speed=4, speed_jitter=1, miss_chance=0.03, move_threshold=20, side='right'):
+        """コントローラーの初期化
+
+        Args:
+            anticipate: Trueでボールの到達位置を予測して先回りする
+            prediction_error: 目標位置に加える誤差の最大値（ピクセル）
+            reaction_delay: 目標を見直す間隔の範囲（基準ティックレートでのフレーム数）
+            speed: パドルの移動速度
+            speed_jitter: 移動速度のばらつきの最大値
+            miss_chance: 基準ティックあたりのミス（ランダムな動き）の確率
+            move_threshold: 目標との差がこれ以下なら動かない
+            side: 操作するパドル（'right' または 'left'）
+        """
+        self.anticipate = anticipate
+        self.prediction_error = prediction_error
+        self.reaction_delay = reaction_delay
+        self.speed = speed
+        self.speed_jitter = speed_jitter
+        self.miss_chance = miss_chance
+        self.move_threshold = move_threshold
+        self.side = side
+
+        # 内部状態
+        self.delay_remaining = 0
+        self.target_y = None
+
+    @classmethod
+    def from_difficulty(cls, name, **overrides):
+        """難易度名からコントローラーを作る
+
+        Args:
+            name: 'classic', 'easy', 'normal', 'hard' のいずれか
+            **overrides: 難易度の設定を上書きする引数
+
+        Raises:
+            ValueError: 未知の難易度の場合
+        """
+        if name not in cls.DIFFICULTIES:
+            raise ValueError(f"未知の難易度です: {name}")
+        return cls(**{**cls.DIFFICULTIES[name], **overrides})
+
+    def update(self, sim):
+        """CPU制御の更新（1ティック分）
+
+        Args:
+            sim: 操作する PongSimulation
+        """
+        rng = sim.rng
+        paddle = sim.right_paddle if self.side == 'right' else sim.left_paddle
+        if self.target_y is None:
+            self.target_y = sim.height // 2
+
+        # 反応遅延の処理
+        self.delay_remaining -= 1
+        if self.delay_remaining <= 0:
+            # 誤差を加えて予測を困難にする
+            self.target_y = self._aim(sim) + rng.uniform(-self.prediction_error, self.prediction_error)
+            low, high = self.reaction_delay
+            self.delay_remaining = sim.base_frames_to_ticks(rng.randint(low, high))
+
+        # パドルの中央位置
+        paddle_center = paddle.y + paddle.height // 2
+
+        # CPUの移動判定
+        target_diff = self.target_y - paddle_center
+        if abs(target_diff) > self.move_threshold:
+            # ランダムな速度変動
+            actual_speed = (self.speed + rng.uniform(-self.speed_jitter, self.speed_jitter)) * sim.speed_scale
+
+            if target_diff > 0:  # 下に移動
+                if paddle.y < sim.height - paddle.height:
+                    paddle.move_down(actual_speed)
+            else:  # 上に移動
+                if paddle.y > 0:
+                    paddle.move_up(actual_speed)
+
+        # 時々ランダムな動きを追加（ミスを演出）
+        if rng.random() < self.miss_chance * sim.speed_scale:
+            if rng.choice([True, False]):
+                if paddle.y > 0:
+                    paddle.move_up(rng.uniform(2, 4) * sim.speed_scale)
+            else:
+                if paddle.y < sim.height - paddle.height:
+                    paddle.move_down(rng.uniform(2, 4) * sim.speed_scale)
+
+    def _aim(self, sim):
+        """誤差を加える前の目標 Y 座標"""
+        if not self.anticipate:
+            return sim.ball.y
+        if self.side == 'right':
+            target_x = sim.right_paddle.x - sim.ball.radius
+        else:
+            target_x = sim.left_paddle.x + sim.left_paddle.width + sim.ball.radius
+        prediction = predict_ball(sim, target_x)
+        if prediction is None:
+            return sim.height / 2  # 遠ざかっている間は中央で待つ
+        return prediction[0]
@@ -0,0 +1,498 @@
+"""NumPy による Pong の一括シミュレーション
+
+N 試合分の状態を構造体配列（struct-of-arrays）として保持し、
+1ステップで全試合をまとめて進める。各処理は pong_core.PongSimulation の
+update() をマスク付きの配列演算に置き換えたもので、同じシードなら
+スカラー版と同じ結果になる。
+"""
+import numpy as np
+
+from pong_core import INPUT_NONE
+
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_TO_UNIT = 2.0 ** -53
+
+# アイテム種類と所有者の番号（配列内での表現）
+ITEM_BIG_PADDLE = 0
+ITEM_SLOW_BALL = 1
+ITEM_FAST_PADDLE = 2
+OWNER_NEUTRAL = 0
+OWNER_LEFT = 1
+OWNER_RIGHT = 2
+
+_LEFT = 0
+_RIGHT = 1
+
+
+def _mix64(z):
+    """splitmix64 の最終ミキサー（Python int 版）"""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _mix64_array(z):
+    """splitmix64 の最終ミキサー（uint64 配列版）"""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _stream_key(seed, game_index):
+    """シードと試合番号から乱数ストリームの鍵を求める"""
+    return _mix64((seed * _GOLDEN + game_index) & _MASK64)
+
+
+class CounterRandom:
+    """カウンタ方式の乱数生成器（random.Random の一部互換）
+
+    n 回目の乱数は (シード, 試合番号, n) だけで決まるため、
+    BatchPongEngine の i 番目の試合と全く同じ乱数列を再現できる。
+    """
+
+    def __init__(self, seed, game_index=0):
+        """乱数生成器の初期化
+
+        Args:
+            seed: 乱数シード
+            game_index: 試合番号（BatchPongEngine の配列インデックス）
+        """
+        self.key = _stream_key(seed, game_index)
+        self.counter = 0
+
+    def random(self):
+        """[0, 1) の一様乱数"""
+        self.counter += 1
+        return (_mix64((self.key + self.counter * _GOLDEN) & _MASK64) >> 11) * _TO_UNIT
+
+    def uniform(self, a, b):
+        """[a, b) の一様乱数"""
+        return a + (b - a) * self.random()
+
+    def randint(self, a, b):
+        """a 以上 b 以下の整数乱数"""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        """シーケンスから1つ選ぶ"""
+        return seq[int(self.random() * len(seq))]
+
+    def getstate(self):
+        """内部状態 (key, counter) を返す（PongSimulation.snapshot() 用）"""
+        return self.key, self.counter
+
+    def setstate(self, state):
+        """getstate() で取り出した状態に戻す"""
+        self.key, self.counter = state
+
+
+def scalar_rng(seed, game_index):
+    """BatchPongEngine の試合と同じ乱数列を持つスカラー版用の乱数生成器
+
+    Args:
+        seed: BatchPongEngine に渡したシード
+        game_index: 試合番号
+
+    Returns:
+        CounterRandom: PongSimulation(rng=...) に渡す乱数生成器
+    """
+    return CounterRandom(seed, game_index)
+
+
+class BatchPongEngine:
+    """N 試合を同時に進める Pong エンジン"""
+
+    def __init__(self, n_games, width=800, height=600, cpu_mode=True, seed=0):
+        """エンジンの初期化
+
+        Args:
+            n_games: 同時に進める試合数
+            width: 画面の幅
+            height: 画面の高さ
+            cpu_mode: CPUモード（Trueで右パドルがCPU制御）
+            seed: 乱数シード（試合 i は scalar_rng(seed, i) と同じ乱数列になる）
+        """
+        n = n_games
+        self.n_games = n
+        self.width = width
+        self.height = height
+        self.cpu_mode = cpu_mode
+        self.tick = 0
+
+        # 乱数ストリーム（試合ごとの鍵と消費カウンタ）
+        base = np.uint64((seed * _GOLDEN) & _MASK64)
+        self._rng_key = _mix64_array(base + np.arange(n, dtype=np.uint64))
+        self._rng_counter = np.zeros(n, dtype=np.uint64)
+        self._everyone = np.ones(n, dtype=bool)
+
+        # ボール
+        self.ball_radius = 10
+        self.ball_x = np.full(n, float(width // 2))
+        self.ball_y = np.full(n, float(height // 2))
+        self.ball_vx = np.full(n, 5.0)
+        self.ball_vy = np.full(n, 3.0)
+        self.ball_owner = np.zeros(n, dtype=np.int8)
+
+        # パドル（行 0 が左、行 1 が右）
+        self.paddle_x = (10, width - 20)
+        self.paddle_width = 10
+        self.paddle_original_height = 80
+        self.big_paddle_factor = 1.5
+        self.paddle_y = np.full((2, n), float(height // 2 - 40))
+        self.paddle_height = np.full((2, n), float(self.paddle_original_height))
+
+        # スコア
+        self.left_score = np.zeros(n, dtype=np.int64)
+        self.right_score = np.zeros(n, dtype=np.int64)
+
+        # CPU制御（CpuController の 'classic' 難易度と同じ動き）
+        self.cpu_speed = 4
+        self.cpu_reaction_delay = np.zeros(n, dtype=np.int64)
+        self.cpu_target_y = np.full(n, float(height // 2))
+
+        # おたすけアイテム（試合ごとに最大 max_items 個、有効なものを先頭に詰める）
+        self.max_items = 3
+        self.item_radius = 15
+        self.item_lifetime = 600
+        self.item_spawn_interval = 300
+        self.item_spawn_timer = 0
+        self.item_x = np.zeros((n, self.max_items))
+        self.item_y = np.zeros((n, self.max_items))
+        self.item_type = np.zeros((n, self.max_items), dtype=np.int8)
+        self.item_life = np.zeros((n, self.max_items), dtype=np.int64)
+        self.item_active = np.zeros((n, self.max_items), dtype=bool)
+
+        # アイテム効果の残り時間（試合 × プレイヤー × 種類、0 は無効）
+        self.effect_duration = 600
+        self.effect_timer = np.zeros((n, 2, 3), dtype=np.int64)
+
+        # ボール速度効果のスタック（残り時間を追加順に先頭から詰める）
+        self.ball_original_velocity_x = 5.0
+        self.ball_original_velocity_y = 3.0
+        self.slow_multiplier = 0.75
+        stack_size = self.max_items + self.effect_duration // self.item_spawn_interval + 2
+        self.speed_effect_timer = np.zeros((n, stack_size), dtype=np.int64)
+        self.speed_effect_count = np.zeros(n, dtype=np.int64)
+
+    def reset_games(self, mask):
+        """マスクされた試合を初期状態に戻す（乱数列はそのまま続ける）
+
+        アイテムの出現タイマーとティックは全試合で共通のため戻さない。
+
+        Args:
+            mask: 戻す試合の真偽値配列
+        """
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return
+        self.ball_x[rows] = float(self.width // 2)
+        self.ball_y[rows] = float(self.height // 2)
+        self.ball_vx[rows] = self.ball_original_velocity_x
+        self.ball_vy[rows] = self.ball_original_velocity_y
+        self.ball_owner[rows] = OWNER_NEUTRAL
+        self.paddle_y[:, rows] = float(self.height // 2 - 40)
+        self.paddle_height[:, rows] = float(self.paddle_original_height)
+        self.left_score[rows] = 0
+        self.right_score[rows] = 0
+        self.cpu_reaction_delay[rows] = 0
+        self.cpu_target_y[rows] = float(self.height // 2)
+        self.item_active[rows] = False
+        self.effect_timer[rows] = 0
+        self.speed_effect_timer[rows] = 0
+        self.speed_effect_count[rows] = 0
+
+    def step(self, n=1, left_input=INPUT_NONE, right_input=INPUT_NONE):
+        """同じ入力で全試合を n ステップ進める
+
+        Args:
+            n: 進めるステップ数
+            left_input: 左パドルの入力（スカラーまたは長さ n_games の配列）
+            right_input: 右パドルの入力（CPUモードでは無視される）
+        """
+        for _ in range(n):
+            self.update(left_input, right_input)
+
+    def update(self, left_input=INPUT_NONE, right_input=INPUT_NONE):
+        """全試合を1ステップ更新（PongSimulation.update と同じ順序）
+
+        Args:
+            left_input: 左パドルの入力（スカラーまたは長さ n_games の配列）
+            right_input: 右パドルの入力（CPUモードでは無視される）
+        """
+        self.tick += 1
+
+        # プレイヤー入力によるパドル移動
+        self._move_paddles(_LEFT, left_input)
+        if not self.cpu_mode:
+            self._move_paddles(_RIGHT, right_input)
+
+        self._update_balls()
+
+        if self.cpu_mode:
+            self._update_cpu()
+
+        self._update_helper_items()
+        self._update_effect_timers()
+        self._check_paddle_hits()
+        self._check_scores()
+
+    def _draw(self, mask):
+        """マスクされた試合だけ乱数を1つ消費する
+
+        Args:
+            mask: 乱数を使う試合の真偽値配列
+
+        Returns:
+            ndarray: 全試合分の [0, 1) 乱数（マスク外の値は使わない）
+        """
+        rows = np.flatnonzero(mask)
+        counter = self._rng_counter[rows] + np.uint64(1)
+        self._rng_counter[rows] = counter
+        bits = _mix64_array(self._rng_key[rows] + counter * np.uint64(_GOLDEN))
+        values = np.zeros(self.n_games)
+        values[rows] = (bits >> np.uint64(11)).astype(np.float64) * _TO_UNIT
+        return values
+
+    def _move_paddles(self, player, direction):
+        """プレイヤー入力でパドルを移動（画面外には出ない）"""
+        direction = np.broadcast_to(np.asarray(direction), (self.n_games,))
+        if not direction.any():
+            return
+        paddle_y = self.paddle_y[player]
+        fast = self.effect_timer[:, player, ITEM_FAST_PADDLE] > 0
+        speed = np.where(fast, 8, 5)
+
+        up = (direction < 0) & (paddle_y > 0)
+        down = (direction > 0) & (paddle_y < self.height - self.paddle_height[player])
+        paddle_y[up] -= speed[up]
+        paddle_y[down] += speed[down]
+
+    def _update_balls(self):
+        """ボールの移動と上下の壁での反射"""
+        r = self.ball_radius
+        self.ball_x += self.ball_vx
+        self.ball_y += self.ball_vy
+
+        top = self.ball_y - r <= 0
+        bottom = ~top & (self.ball_y + r >= self.height)
+        self.ball_y[top] = r
+        self.ball_y[bottom] = self.height - r
+        bounced = top | bottom
+        self.ball_vy[bounced] = -self.ball_vy[bounced]
+
+    def _update_cpu(self):
+        """CPU制御の更新"""
+        everyone = self._everyone
+        paddle_y = self.paddle_y[_RIGHT]
+        paddle_height = self.paddle_height[_RIGHT]
+
+        # 反応遅延の処理
+        self.cpu_reaction_delay -= 1
+        react = self.cpu_reaction_delay <= 0
+        if react.any():
+            u = self._draw(react)
+            np.copyto(self.cpu_target_y, self.ball_y + (-30 + 60 * u), where=react)
+            u = self._draw(react)
+            np.copyto(self.cpu_reaction_delay, 5 + (u * 11).astype(np.int64), where=react)
+
+        # パドルの中央位置と移動判定
+        paddle_center = paddle_y + paddle_height // 2
+        target_diff = self.cpu_target_y - paddle_center
+        move = np.abs(target_diff) > 20
+        if move.any():
+            actual_speed = self.cpu_speed + (-1 + 2 * self._draw(move))
+            down = move & (target_diff > 0) & (paddle_y < self.height - paddle_height)
+            up = move & (target_diff <= 0) & (paddle_y > 0)
+            np.add(paddle_y, actual_speed, out=paddle_y, where=down)
+            np.subtract(paddle_y, actual_speed, out=paddle_y, where=up)
+
+        # 時々ランダムな動きを追加（ミスを演出）
+        miss = self._draw(everyone) < 0.03
+        if miss.any():
+            go_up = (self._draw(miss) * 2).astype(np.int64) == 0
+            up = miss & go_up & (paddle_y > 0)
+            down = miss & ~go_up & (paddle_y < self.height - paddle_height)
+            jitter = 2 + 2 * self._draw(up | down)
+            np.subtract(paddle_y, jitter, out=paddle_y, where=up)
+            np.add(paddle_y, jitter, out=paddle_y, where=down)
+
+    def _update_helper_items(self):
+        """おたすけアイテムの生成・寿命・衝突判定"""
+        # 全試合のタイマーは同期しているので1つで足りる
+        self.item_spawn_timer += 1
+        if self.item_spawn_timer >= self.item_spawn_interval:
+            self._spawn_helper_items()
+            self.item_spawn_timer = 0
+
+        active = self.item_active
+        if not active.any():
+            return
+
+        # 既存アイテムの寿命
+        self.item_life[active] -= 1
+        expired = active & (self.item_life <= 0)
+        if expired.any():
+            active &= ~expired
+            self._compact_items()
+
+        self._check_item_collisions()
+
+    def _spawn_helper_items(self):
+        """アイテム数が上限未満の試合にアイテムを1つ生成"""
+        count = self.item_active.sum(axis=1)
+        spawn = count < self.max_items
+        if not spawn.any():
+            return
+        x = 200 + (self._draw(spawn) * (self.width - 400 + 1)).astype(np.int64)
+        y = 100 + (self._draw(spawn) * (self.height - 200 + 1)).astype(np.int64)
+        item_type = (self._draw(spawn) * 3).astype(np.int8)
+
+        rows = np.flatnonzero(spawn)
+        slots = count[spawn]
+        self.item_x[rows, slots] = x[spawn]
+        self.item_y[rows, slots] = y[spawn]
+        self.item_type[rows, slots] = item_type[spawn]
+        self.item_life[rows, slots] = self.item_lifetime
+        self.item_active[rows, slots] = True
+
+    def _compact_items(self):
+        """有効なアイテムを生成順のまま先頭に詰める"""
+        order = np.argsort(~self.item_active, axis=1, kind='stable')
+        for name in ('item_x', 'item_y', 'item_type', 'item_life', 'item_active'):
+            setattr(self, name, np.take_along_axis(getattr(self, name), order, axis=1))
+
+    def _check_item_collisions(self):
+        """アイテムとパドル・ボールの衝突判定（スロット順に逐次処理）"""
+        removed = np.zeros_like(self.item_active)
+        half_width = self.paddle_width / 2
+        for slot in range(self.max_items):
+            alive = self.item_active[:, slot]
+            if not alive.any():
+                continue
+            item_x = self.item_x[:, slot]
+            item_y = self.item_y[:, slot]
+            item_type = self.item_type[:, slot]
+
+            # ボールとの衝突判定（ニュートラルの場合は効果なし）
+            reach = self.ball_radius + self.item_radius
+            hit_ball = alive & ((self.ball_x - item_x) ** 2 + (self.ball_y - item_y) ** 2 < reach * reach)
+            self._apply_item_effects(hit_ball & (self.ball_owner == OWNER_LEFT), _LEFT, item_type)
+            self._apply_item_effects(hit_ball & (self.ball_owner == OWNER_RIGHT), _RIGHT, item_type)
+            remaining = alive & ~hit_ball
+
+            # 左右のパドルとの衝突
+            for player in (_LEFT, _RIGHT):
+                half_height = self.paddle_height[player] / 2
+                hit_paddle = (remaining &
+                              (np.abs(item_x - (self.paddle_x[player] + half_width)) < self.item_radius + half_width) &
+                              (np.abs(item_y - (self.paddle_y[player] + half_height)) < self.item_radius + half_height))
+                self._apply_item_effects(hit_paddle, player, item_type)
+                remaining &= ~hit_paddle
+
+            removed[:, slot] = alive & ~remaining
+
+        if removed.any():
+            self.item_active &= ~removed
+            self._compact_items()
+
+    def _apply_item_effects(self, mask, player, item_type):
+        """アイテム効果の適用
+
+        Args:
+            mask: 効果を受ける試合の真偽値配列
+            player: 0（左）または 1（右）
+            item_type: 試合ごとのアイテム種類
+        """
+        if not mask.any():
+            return
+
+        big = mask & (item_type == ITEM_BIG_PADDLE)
+        self.paddle_height[player][big] = int(self.paddle_original_height * self.big_paddle_factor)
+
+        slow = mask & (item_type == ITEM_SLOW_BALL)
+        if slow.any():
+            # ボール速度を減速し、スタックに積む
+            self.ball_vx[slow] *= self.slow_multiplier
+            self.ball_vy[slow] *= self.slow_multiplier
+            rows = np.flatnonzero(slow)
+            slots = self.speed_effect_count[slow]
+            if (slots >= self.speed_effect_timer.shape[1]).any():
+                raise RuntimeError("ボール速度効果のスタックが上限を超えました")
+            self.speed_effect_timer[rows, slots] = self.effect_duration
+            self.speed_effect_count[slow] += 1
+
+        rows = np.flatnonzero(mask)
+        self.effect_timer[rows, player, item_type[mask]] = self.effect_duration
+
+    def _update_effect_timers(self):
+        """効果時間の更新と期限切れ効果の解除"""
+        timers = self.effect_timer
+        running = timers > 0
+        if running.any():
+            timers[running] -= 1
+            expired = running & (timers == 0)
+            # パドル拡大の解除
+            for player in (_LEFT, _RIGHT):
+                restore = expired[:, player, ITEM_BIG_PADDLE]
+                self.paddle_height[player][restore] = self.paddle_original_height
+
+        # ボール速度効果の管理（スタックベース）
+        if not self.speed_effect_count.any():
+            return
+        stack = self.speed_effect_timer
+        for slot in range(stack.shape[1]):
+            valid = slot < self.speed_effect_count
+            if not valid.any():
+                break
+            stack[valid, slot] -= 1
+            expired = valid & (stack[:, slot] <= 0)
+            # 効果を逆転させて元に戻す（追加順に1つずつ）
+            self.ball_vx[expired] /= self.slow_multiplier
+            self.ball_vy[expired] /= self.slow_multiplier
+
+        # 期限切れは常にスタックの先頭側に並ぶので、残りを前に詰める
+        valid = np.arange(stack.shape[1]) < self.speed_effect_count[:, None]
+        keep = valid & (stack > 0)
+        order = np.argsort(~keep, axis=1, kind='stable')
+        self.speed_effect_timer = np.take_along_axis(np.where(keep, stack, 0), order, axis=1)
+        self.speed_effect_count = keep.sum(axis=1)
+
+    def _check_paddle_hits(self):
+        """パドルとの衝突判定（簡易版）"""
+        r = self.ball_radius
+        left_y = self.paddle_y[_LEFT]
+        hit_left = ((self.ball_x - r <= self.paddle_x[_LEFT] + self.paddle_width) &
+                    (self.ball_y >= left_y) &
+                    (self.ball_y <= left_y + self.paddle_height[_LEFT]))
+        self.ball_vx[hit_left] = np.abs(self.ball_vx[hit_left])
+        self.ball_owner[hit_left] = OWNER_LEFT
+
+        right_y = self.paddle_y[_RIGHT]
+        hit_right = ((self.ball_x + r >= self.paddle_x[_RIGHT]) &
+                     (self.ball_y >= right_y) &
+                     (self.ball_y <= right_y + self.paddle_height[_RIGHT]))
+        self.ball_vx[hit_right] = -np.abs(self.ball_vx[hit_right])
+        self.ball_owner[hit_right] = OWNER_RIGHT
+
+    def _check_scores(self):
+        """得点判定とボールのリセット"""
+        right_point = self.ball_x < 0
+        left_point = ~right_point & (self.ball_x > self.width)
+        self.right_score += right_point
+        self.left_score += left_point
+
+        reset = right_point | left_point
+        if not reset.any():
+            return
+        # すべてのボール速度効果をクリアし、方向を保持して元の速度に戻す
+        self.speed_effect_timer[reset] = 0
+        self.speed_effect_count[reset] = 0
+        direction_x = np.where(self.ball_vx[reset] > 0, 1, -1)
+        direction_y = np.where(self.ball_vy[reset] > 0, 1, -1)
+        self.ball_x[reset] = float(self.width // 2)
+        self.ball_y[reset] = float(self.height // 2)
+        self.ball_vx[reset] = self.ball_original_velocity_x * -direction_x
+        self.ball_vy[reset] = self.ball_original_velocity_y * direction_y
+        self.ball_owner[reset] = OWNER_NEUTRAL
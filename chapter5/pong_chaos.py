@@ -0,0 +1,302 @@
+"""Pong のカオスモード（大量のボールとアイテム、pygame 非依存）
+
+ボールとアイテムを数百個ずつ同時に動かす。衝突判定は一様グリッドの
+空間ハッシュで近くにある組だけを調べるため、コストはボール数 N と
+アイテム数 M の積ではなく、近くにいる組の数に比例する。
+エンジンの負荷テストとしても使う。
+"""
+from pong_core import Ball, PongSimulation
+
+
+# 片側だけの隣接セル（組を重複なく列挙するため）
+_HALF_NEIGHBORS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+class SpatialHash:
+    """一様グリッドの空間ハッシュ
+
+    セルの大きさを判定距離以上にしておけば、触れ合う物体どうしは
+    同じセルか隣接する8セルのどれかに入っている。
+    """
+
+    def __init__(self, cell_size):
+        """空間ハッシュの初期化
+
+        Args:
+            cell_size: セルの一辺（判定する距離以上にする）
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def __len__(self):
+        return sum(len(cell) for cell in self.cells.values())
+
+    def clear(self):
+        """すべての物体を取り除く"""
+        self.cells.clear()
+
+    def insert(self, obj, x, y):
+        """物体を位置 (x, y) のセルに登録
+
+        Args:
+            obj: 登録する物体
+            x: X座標
+            y: Y座標
+        """
+        size = self.cell_size
+        key = (int(x // size), int(y // size))
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [obj]
+        else:
+            cell.append(obj)
+
+    def query(self, x, y):
+        """位置 (x, y) のセルと隣接8セルの物体
+
+        Returns:
+            list: 判定の候補
+        """
+        size = self.cell_size
+        cx = int(x // size)
+        cy = int(y // size)
+        cells = self.cells
+        found = []
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                cell = cells.get((cx + ox, cy + oy))
+                if cell:
+                    found.extend(cell)
+        return found
+
+    def query_rect(self, left, top, right, bottom):
+        """矩形に重なるセルとその周囲1セルの物体
+
+        Returns:
+            list: 判定の候補
+        """
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for cx in range(int(left // size) - 1, int(right // size) + 2):
+            for cy in range(int(top // size) - 1, int(bottom // size) + 2):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.extend(cell)
+        return found
+
+    def pairs(self):
+        """同じセルか隣接セルにある物体の組を1回ずつ列挙
+
+        Yields:
+            tuple: (物体, 物体)
+        """
+        cells = self.cells
+        for (cx, cy), cell in cells.items():
+            n = len(cell)
+            for i in range(n):
+                a = cell[i]
+                for j in range(i + 1, n):
+                    yield a, cell[j]
+            for ox, oy in _HALF_NEIGHBORS:
+                other = cells.get((cx + ox, cy + oy))
+                if other:
+                    for a in cell:
+                        for b in other:
+                            yield a, b
+
+
+class ChaosSimulation(PongSimulation):
+    """たくさんのボールとアイテムを同時に扱うシミュレーション
+
+    ボールどうしは弾性衝突する。減速アイテムは、ボールで取った場合は
+    そのボールを、パドルで取った場合は場のすべてのボールを、得点されて
+    打ち直されるまで減速させる（期限つきの速度効果は1個のボール用のため）。
+    CPU は自陣に向かってくるボールのうち一番近いものを追う。
+    """
+
+    def __init__(self, n_balls=100, max_items=100, item_spawn_seconds=0.05, **kwargs):
+        """シミュレーションの初期化
+
+        Args:
+            n_balls: ボールの数
+            max_items: 同時に出現できるアイテム数
+            item_spawn_seconds: アイテムの出現間隔（秒）
+            **kwargs: PongSimulation に渡す引数
+        """
+        if kwargs.get('swept_collisions'):
+            raise ValueError("カオスモードはスイープ判定に対応していません")
+        super().__init__(**kwargs)
+        self.max_items = max_items
+        self.item_spawn_interval = max(1, self.seconds_to_ticks(item_spawn_seconds))
+
+        self.balls = [self.ball]
+        for _ in range(n_balls - 1):
+            ball = Ball(self.width // 2, self.height // 2, 0, 0)
+            self._launch(ball)
+            self.balls.append(ball)
+
+        # 判定距離の最大（ボールとアイテムの半径の和）をセルの大きさにする
+        self.ball_grid = SpatialHash(self.ball.radius + 15)
+        self._build_grid()
+
+    def snapshot(self):
+        """現在の状態を平坦なタプルとして取り出す（すべてのボールを含む）
+
+        PongSimulation.snapshot() の状態に、各ボールの状態と CPU が追っている
+        ボールの番号を加える。
+
+        Returns:
+            tuple: 状態のスナップショット
+        """
+        balls = tuple((ball.x, ball.y, ball.velocity_x, ball.velocity_y, ball.owner) for ball in self.balls)
+        return super().snapshot(), balls, self.balls.index(self.ball)
+
+    def restore(self, state):
+        """snapshot() で取り出した状態に戻す
+
+        Args:
+            state: snapshot() の戻り値
+        """
+        base, balls, tracked = state
+        super().restore(base)
+        self.balls = [Ball(x, y, velocity_x, velocity_y, self.ball.radius) for x, y, velocity_x, velocity_y, _ in balls]
+        for ball, (*_, owner) in zip(self.balls, balls):
+            ball.set_owner(owner)
+        self.ball = self.balls[tracked]
+        self._build_grid()
+
+    def _launch(self, ball):
+        """ボールを中央付近からランダムな向きに打ち出す"""
+        rng = self.rng
+        ball.x = self.width / 2 + rng.uniform(-50, 50)
+        ball.y = rng.uniform(ball.radius, self.height - ball.radius)
+        ball.velocity_x = self.ball_original_velocity_x * rng.choice((-1, 1))
+        ball.velocity_y = self.ball_original_velocity_y * rng.uniform(-1, 1)
+        ball.set_owner('neutral')
+
+    def _build_grid(self):
+        """ボールの位置で空間ハッシュを作り直す"""
+        grid = self.ball_grid
+        grid.clear()
+        insert = grid.insert
+        for ball in self.balls:
+            insert(ball, ball.x, ball.y)
+
+    def _move_ball(self):
+        """すべてのボールを動かして空間ハッシュを作り直す"""
+        width = self.width
+        height = self.height
+        for ball in self.balls:
+            ball.update(width, height)
+        self._build_grid()
+
+    def _update_cpu(self):
+        """自陣に一番近い、向かってくるボールを CPU に追わせる"""
+        threat = None
+        for ball in self.balls:
+            if ball.velocity_x > 0 and (threat is None or ball.x > threat.x):
+                threat = ball
+        self.ball = threat or self.balls[0]
+        super()._update_cpu()
+
+    def _check_item_collisions(self):
+        """アイテムとボール・パドルの衝突判定（近くのボールだけを調べる）"""
+        query = self.ball_grid.query
+        for item in self.helper_items[:]:
+            reach = self.ball.radius + item.radius
+            reach_squared = reach * reach
+            for ball in query(item.x, item.y):
+                dx = ball.x - item.x
+                dy = ball.y - item.y
+                if dx * dx + dy * dy < reach_squared:
+                    self._apply_ball_item(ball, item)
+                    self._remove_helper_item(item)
+                    break
+            else:
+                player = self._paddle_touching_item(item)
+                if player is not None:
+                    self._apply_item_effect(player, item.item_type)
+                    self._remove_helper_item(item)
+
+    def _apply_ball_item(self, ball, item):
+        """ボールが取ったアイテムの効果（ニュートラルのボールは効果なし）"""
+        player = ball.owner
+        if player == 'neutral':
+            return
+        if item.item_type == 'slow_ball':
+            self.items_collected[player] += 1
+            ball.velocity_x *= self.slow_ball_multiplier
+            ball.velocity_y *= self.slow_ball_multiplier
+        else:
+            self._apply_item_effect(player, item.item_type)
+
+    def _apply_item_effect(self, player, item_type):
+        """アイテム効果の適用（減速は場のすべてのボールにかける）"""
+        if item_type != 'slow_ball':
+            super()._apply_item_effect(player, item_type)
+            return
+        self.items_collected[player] += 1
+        multiplier = self.slow_ball_multiplier
+        for ball in self.balls:
+            ball.velocity_x *= multiplier
+            ball.velocity_y *= multiplier
+
+    def _check_paddle_hits(self):
+        """ボールどうしとボールとパドルの衝突判定"""
+        self._collide_balls()
+        grid = self.ball_grid
+        radius = self.ball.radius
+        margin = 2 * grid.cell_size  # 1ティックで裏側まで抜けたボールも拾う
+
+        left_paddle = self.left_paddle
+        face = left_paddle.x + left_paddle.width
+        top = left_paddle.y
+        bottom = left_paddle.y + left_paddle.height
+        for ball in grid.query_rect(-margin, top, face + radius, bottom):
+            if ball.x - radius <= face and top <= ball.y <= bottom:
+                if ball.velocity_x < 0:
+                    self.paddle_hits += 1
+                ball.velocity_x = abs(ball.velocity_x)
+                ball.set_owner('left')
+
+        right_paddle = self.right_paddle
+        face = right_paddle.x
+        top = right_paddle.y
+        bottom = right_paddle.y + right_paddle.height
+        for ball in grid.query_rect(face - radius, top, self.width + margin, bottom):
+            if ball.x + radius >= face and top <= ball.y <= bottom:
+                if ball.velocity_x > 0:
+                    self.paddle_hits += 1
+                ball.velocity_x = -abs(ball.velocity_x)
+                ball.set_owner('right')
+
+    def _collide_balls(self):
+        """近くにあるボールどうしの弾性衝突（同じ質量として法線方向の速度を交換）"""
+        reach = 2 * self.ball.radius
+        reach_squared = reach * reach
+        for a, b in self.ball_grid.pairs():
+            dx = b.x - a.x
+            dy = b.y - a.y
+            distance_squared = dx * dx + dy * dy
+            if distance_squared >= reach_squared or distance_squared == 0:
+                continue
+            dot = (b.velocity_x - a.velocity_x) * dx + (b.velocity_y - a.velocity_y) * dy
+            if dot >= 0:
+                continue  # 離れていく組
+            k = dot / distance_squared
+            a.velocity_x += k * dx
+            a.velocity_y += k * dy
+            b.velocity_x -= k * dx
+            b.velocity_y -= k * dy
+
+    def _check_score(self):
+        """左右の端を越えたボールごとに得点して打ち直す"""
+        width = self.width
+        for ball in self.balls:
+            if ball.x < 0:
+                self.right_score += 1
+                self._launch(ball)
+            elif ball.x > width:
+                self.left_score += 1
+                self._launch(ball)
@@ -0,0 +1,128 @@
+"""Pong の連続衝突判定（スイープ判定）
+
+1ティックの移動を線分として扱い、壁・パドル・アイテムに当たる時刻を
+ティック内の割合 t（0〜1）で正確に求める。ボールが速くても、ティックの
+刻みが粗くても、10px のパドルをすり抜けない。得点が入るまでの軌道は
+ティックレートによらず同じになる。得点の判定とボールのリセットは
+ティックの終わりに行うため、得点が入った後の位置はティックレートで変わる。
+
+パドルの当たり判定は従来の判定と同じ形（ボール中心の Y がパドルの範囲内で、
+ボールの縁がパドルの面に触れたら反射）で、角の丸みは考えない。
+"""
+
+
+def sweep_circle(x, y, dx, dy, cx, cy, radius):
+    """点 (x, y) が (dx, dy) だけ動く間に円に入る最初の時刻
+
+    ボールとアイテムの判定では radius に両者の半径の和を渡す。
+    平方根は実際に当たる場合だけ計算し、それ以外は距離の2乗で棄却する。
+
+    Args:
+        x: 開始位置の X 座標
+        y: 開始位置の Y 座標
+        dx: X 方向の移動量
+        dy: Y 方向の移動量
+        cx: 円の中心の X 座標
+        cy: 円の中心の Y 座標
+        radius: 円の半径
+
+    Returns:
+        float: 当たる時刻 t（0〜1）。当たらない場合は None
+    """
+    fx = x - cx
+    fy = y - cy
+    c = fx * fx + fy * fy - radius * radius
+    if c < 0:
+        return 0.0  # 開始時点ですでに重なっている
+    b = fx * dx + fy * dy
+    if b >= 0:
+        return None  # 離れていく（または動いていない）
+    a = dx * dx + dy * dy
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None  # 最接近でも届かない
+    t = (-b - discriminant ** 0.5) / a
+    return t if t <= 1.0 else None
+
+
+def sweep_walls(y, dy, radius, height):
+    """上下の壁にボールの縁が触れる時刻
+
+    Args:
+        y: ボール中心の Y 座標
+        dy: Y 方向の移動量
+        radius: ボールの半径
+        height: 画面の高さ
+
+    Returns:
+        tuple: (時刻 t, 'top' または 'bottom')。当たらない場合は None
+    """
+    if dy < 0:
+        end = y + dy
+        if end <= radius:
+            return max(0.0, (radius - y) / dy), 'top'
+    elif dy > 0:
+        end = y + dy
+        if end >= height - radius:
+            return max(0.0, (height - radius - y) / dy), 'bottom'
+    return None
+
+
+def sweep_paddle(x, y, dx, dy, radius, paddle, side):
+    """パドルの面にボールの縁が触れる時刻
+
+    Args:
+        x: ボール中心の X 座標
+        y: ボール中心の Y 座標
+        dx: X 方向の移動量
+        dy: Y 方向の移動量
+        radius: ボールの半径
+        paddle: 判定する Paddle
+        side: 'left'（右向きの面）または 'right'（左向きの面）
+
+    Returns:
+        float: 当たる時刻 t（0〜1）。当たらない場合は None
+    """
+    if side == 'left':
+        if dx >= 0:
+            return None
+        face = paddle.x + paddle.width + radius
+        if x + dx > face or x < paddle.x:
+            return None  # 面に届かない、またはすでに裏側にいる
+        t = max(0.0, (face - x) / dx)
+    else:
+        if dx <= 0:
+            return None
+        face = paddle.x - radius
+        if x + dx < face or x > paddle.x + paddle.width:
+            return None
+        t = max(0.0, (face - x) / dx)
+
+    hit_y = y + dy * t
+    if paddle.y <= hit_y <= paddle.y + paddle.height:
+        return t
+    return None
+
+
+def first_contact(x, y, dx, dy, radius, height, left_paddle, right_paddle):
+    """移動中に最初に当たる面を求める
+
+    Args:
+        x: ボール中心の X 座標
+        y: ボール中心の Y 座標
+        dx: X 方向の移動量
+        dy: Y 方向の移動量
+        radius: ボールの半径
+        height: 画面の高さ
+        left_paddle: 左パドル
+        right_paddle: 右パドル
+
+    Returns:
+        tuple: (時刻 t, 'top' / 'bottom' / 'left' / 'right')。当たらない場合は None
+    """
+    best = sweep_walls(y, dy, radius, height)
+    for paddle, side in ((left_paddle, 'left'), (right_paddle, 'right')):
+        t = sweep_paddle(x, y, dx, dy, radius, paddle, side)
+        if t is not None and (best is None or t < best[0]):
+            best = (t, side)
+    return best
@@ -0,0 +1,725 @@
+"""Pong ゲームのシミュレーションコア（pygame 非依存）
+
+ゲームロジックのみを扱うため、ディスプレイのないバッチ環境でも
+フレームレートの制限なしにシミュレーションを進められる。
+"""
+import heapq
+import random
+
+from pong_ai import CpuController
+from pong_collision import first_contact, sweep_circle
+
+
+# パドル入力（1ステップごとに指定する）
+INPUT_UP = -1
+INPUT_NONE = 0
+INPUT_DOWN = 1
+
+# 速度・時間の定数はこのティックレートを基準にしている
+BASE_TICK_RATE = 60
+
+# スイープ判定で1ティックに処理する反射の上限（壁とパドルの間で挟まった場合の保険）
+MAX_BOUNCES_PER_TICK = 8
+
+
+class Ball:
+    """ボールクラス"""
+
+    __slots__ = ('x', 'y', 'velocity_x', 'velocity_y', 'radius', 'owner')
+
+    # 所有者ごとの色（全インスタンスで共有）
+    COLORS = {
+        'neutral': (255, 255, 255),  # 白
+        'left': (255, 100, 100),     # 赤っぽい
+        'right': (100, 100, 255)     # 青っぽい
+    }
+
+    def __init__(self, x, y, velocity_x, velocity_y, radius=10):
+        """ボールの初期化
+
+        Args:
+            x: X座標
+            y: Y座標
+            velocity_x: X方向の速度
+            velocity_y: Y方向の速度
+            radius: 半径
+        """
+        self.x = float(x)
+        self.y = float(y)
+        self.velocity_x = float(velocity_x)
+        self.velocity_y = float(velocity_y)
+        self.radius = radius
+        self.owner = 'neutral'  # 'neutral', 'left', 'right'
+
+    def update(self, screen_width=800, screen_height=600):
+        """ボールの位置を更新し、壁との衝突をチェック
+
+        Args:
+            screen_width: 画面の幅
+            screen_height: 画面の高さ
+        """
+        self.x += self.velocity_x
+        self.y += self.velocity_y
+
+        # 上下の壁との衝突判定
+        if self.y - self.radius <= 0:
+            self.y = self.radius
+            self.velocity_y = -self.velocity_y
+        elif self.y + self.radius >= screen_height:
+            self.y = screen_height - self.radius
+            self.velocity_y = -self.velocity_y
+
+    def get_color(self):
+        """ボールの色を所有者に基づいて取得"""
+        return self.COLORS.get(self.owner, (255, 255, 255))
+
+    def set_owner(self, owner):
+        """ボールの所有者を設定"""
+        self.owner = owner
+
+
+class Paddle:
+    """パドルクラス"""
+
+    __slots__ = ('x', 'y', 'width', 'height')
+
+    def __init__(self, x, y, width, height):
+        """パドルの初期化
+
+        Args:
+            x: X座標
+            y: Y座標
+            width: 幅
+            height: 高さ
+        """
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def move_up(self, speed):
+        """パドルを上に移動
+
+        Args:
+            speed: 移動速度
+        """
+        self.y -= speed
+
+    def move_down(self, speed):
+        """パドルを下に移動
+
+        Args:
+            speed: 移動速度
+        """
+        self.y += speed
+
+
+class HelperItem:
+    """おたすけアイテムクラス"""
+
+    __slots__ = ('x', 'y', 'radius', 'item_type', 'active', 'lifetime', 'expires_at', 'color')
+
+    # アイテムの色を種類によって変える（全インスタンスで共有）
+    colors = {
+        'big_paddle': (0, 255, 0),    # 緑：パドル拡大
+        'slow_ball': (0, 0, 255),     # 青：ボール減速
+        'fast_paddle': (255, 255, 0)  # 黄：パドル高速化
+    }
+
+    def __init__(self, x, y, item_type, lifetime=600):
+        """アイテムの初期化
+
+        Args:
+            x: X座標
+            y: Y座標
+            item_type: アイテムの種類 ('big_paddle', 'slow_ball', 'fast_paddle')
+            lifetime: 消えるまでのティック数（期限は PongSimulation のスケジューラが管理する）
+        """
+        self.x = x
+        self.y = y
+        self.radius = 15
+        self.item_type = item_type
+        self.active = True
+        self.lifetime = lifetime  # 既定は10秒（60ティック * 10）
+        self.expires_at = None  # 消えるティック（スケジューラに登録したときに決まる）
+        self.color = self.colors.get(item_type, (255, 255, 255))
+
+
+class SpeedEffect:
+    """ボールの速度効果（スタックの1要素）"""
+
+    __slots__ = ('effect_type', 'multiplier', 'expires_at', 'player')
+
+    def __init__(self, effect_type, multiplier, expires_at, player):
+        """速度効果の初期化
+
+        Args:
+            effect_type: 効果の種類（'slow'）
+            multiplier: 速度にかける倍率
+            expires_at: 効果が切れるティック
+            player: 効果を得たプレイヤー
+        """
+        self.effect_type = effect_type
+        self.multiplier = multiplier
+        self.expires_at = expires_at
+        self.player = player
+
+
+class TickScheduler:
+    """ティック番号をキーにした期限イベントのスケジューラ（最小ヒープ）
+
+    毎ティック全タイマーを減らす代わりに期限のティックを登録しておき、
+    そのティックが来たものだけを取り出す。1ティックあたりの処理は
+    登録数によらず、先頭を見るだけで済む。
+    """
+
+    def __init__(self):
+        """スケジューラの初期化"""
+        self._heap = []
+        self._sequence = 0  # 同じティックのイベントは登録順に取り出す
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, tick, event):
+        """イベントを登録
+
+        Args:
+            tick: イベントが発火するティック
+            event: 発火時に返すオブジェクト
+        """
+        heapq.heappush(self._heap, (tick, self._sequence, event))
+        self._sequence += 1
+
+    def pop_due(self, tick):
+        """指定ティックまでに期限が来たイベントを登録順に取り出す
+
+        Args:
+            tick: 現在のティック
+
+        Returns:
+            list: 発火したイベント
+        """
+        heap = self._heap
+        if not heap or heap[0][0] > tick:
+            return []
+        due = []
+        while heap and heap[0][0] <= tick:
+            due.append(heapq.heappop(heap)[2])
+        return due
+
+
+class PongSimulation:
+    """Pongのゲームロジック（描画・入力デバイスに依存しない）"""
+
+    def __init__(self, width=800, height=600, cpu_mode=True, rng=None, tick_rate=BASE_TICK_RATE, seed=None,
+                 cpu_controller=None, swept_collisions=False):
+        """シミュレーションの初期化
+
+        Args:
+            width: 画面の幅
+            height: 画面の高さ
+            cpu_mode: CPUモード（Trueで右パドルがCPU制御）
+            rng: 乱数生成器（random.Random 互換。省略時は seed から作る）
+            tick_rate: 1秒あたりのティック数（速度と時間はこれに合わせて換算する）
+            seed: 乱数シード（64ビット以下の非負整数。省略時はランダムに決める）
+            cpu_controller: 右パドルの CpuController または難易度名（省略時は 'classic'）
+            swept_collisions: Trueでボールの移動を連続的に判定する（高速でもすり抜けない）
+        """
+        self.width = width
+        self.height = height
+
+        # ゲームごとに独立した乱数列を持つ（同じシードなら同じ試合になる）
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = rng if rng is not None else random.Random(self.seed)
+
+        # ティックレートの換算（1ティックあたりの移動量と、時間のティック数）
+        self.tick_rate = tick_rate
+        self.speed_scale = BASE_TICK_RATE / tick_rate
+
+        # ゲームオブジェクトの初期化
+        self.ball = Ball(width // 2, height // 2, 5 * self.speed_scale, 3 * self.speed_scale)
+        self.left_paddle = Paddle(10, height // 2 - 40, 10, 80)
+        self.right_paddle = Paddle(width - 20, height // 2 - 40, 10, 80)
+
+        # ゲーム状態
+        self.running = True
+        self.left_score = 0
+        self.right_score = 0
+        self.cpu_mode = cpu_mode
+        self.tick = 0
+
+        # 衝突判定の方式（False は従来の移動後の位置での判定）
+        self.swept_collisions = swept_collisions
+        self._ball_path = []  # このティックのボールの移動線分 (x, y, dx, dy, 所有者)
+
+        # 試合の集計（チューニング用）
+        self.paddle_hits = 0
+        self.items_collected = {'left': 0, 'right': 0}
+
+        # CPU制御（難易度は予測誤差と反応の遅れで決まる）
+        if cpu_controller is None:
+            cpu_controller = 'classic'
+        if isinstance(cpu_controller, str):
+            cpu_controller = CpuController.from_difficulty(cpu_controller)
+        self.cpu_controller = cpu_controller
+
+        # おたすけアイテム関連
+        self.helper_items = []
+        self.item_spawn_timer = 0
+        self.item_spawn_interval = self.seconds_to_ticks(5)  # 5秒間隔でアイテム出現
+        self.item_lifetime = self.seconds_to_ticks(10)
+        self.item_timers = TickScheduler()  # アイテムが消えるティック
+        self.item_types = ['big_paddle', 'slow_ball', 'fast_paddle']
+        self.max_items = 3  # 同時に出現できるアイテム数
+
+        # アイテム効果の状態
+        self.left_paddle_original_height = 80
+        self.right_paddle_original_height = 80
+        self.active_effects = {'left': {}, 'right': {}}  # 各プレイヤーのアクティブ効果（種類 → 終了ティック）
+        self.effect_duration = self.seconds_to_ticks(10)  # 10秒間
+        self.effect_timers = TickScheduler()  # 効果が切れるティック
+        self.big_paddle_factor = 1.5  # big_paddle のパドル拡大率
+        self.slow_ball_multiplier = 0.75  # slow_ball の速度倍率
+
+        # ボール速度の保存（効果の正確な復元のため）
+        self.ball_original_velocity_x = 5.0 * self.speed_scale
+        self.ball_original_velocity_y = 3.0 * self.speed_scale
+        self.ball_speed_effects = []  # アクティブな速度効果のスタック
+        self._speed_effect_epoch = 0  # ボールリセットで古い速度効果の期限イベントを無効にする
+
+    def seconds_to_ticks(self, seconds):
+        """秒数をこのシミュレーションのティック数に換算
+
+        Args:
+            seconds: 秒数
+
+        Returns:
+            int: ティック数
+        """
+        return round(seconds * self.tick_rate)
+
+    def effect_remaining(self, player, effect_type):
+        """効果の残りティック数（無効なら 0）
+
+        Args:
+            player: 'left' または 'right'
+            effect_type: 効果の種類
+        """
+        expires_at = self.active_effects[player].get(effect_type)
+        return 0 if expires_at is None else expires_at - self.tick
+
+    def base_frames_to_ticks(self, frames):
+        """基準ティックレートでのフレーム数をティック数に換算"""
+        return max(1, round(frames * self.tick_rate / BASE_TICK_RATE))
+
+    def snapshot(self):
+        """現在の状態を平坦なタプルとして取り出す
+
+        タプルは不変なので、そのまま保持・共有できる。設定（画面サイズ、
+        ティックレート、効果の倍率など）は含まないため、同じ設定の
+        シミュレーションにだけ restore() できる。
+
+        Returns:
+            tuple: 状態のスナップショット
+        """
+        ball = self.ball
+        left_paddle = self.left_paddle
+        right_paddle = self.right_paddle
+        controller = self.cpu_controller
+        return (
+            self.tick, self.left_score, self.right_score, self.running, self.item_spawn_timer,
+            self.paddle_hits, self.items_collected['left'], self.items_collected['right'],
+            self._speed_effect_epoch,
+            ball.x, ball.y, ball.velocity_x, ball.velocity_y, ball.owner,
+            left_paddle.y, left_paddle.height, right_paddle.y, right_paddle.height,
+            tuple((item.x, item.y, item.item_type, item.lifetime, item.expires_at) for item in self.helper_items),
+            tuple(self.active_effects['left'].items()),
+            tuple(self.active_effects['right'].items()),
+            tuple((e.effect_type, e.multiplier, e.expires_at, e.player) for e in self.ball_speed_effects),
+            controller.delay_remaining, controller.target_y,
+            self.rng.getstate(),
+        )
+
+    def restore(self, state):
+        """snapshot() で取り出した状態に戻す
+
+        期限イベントのスケジューラは、有効なアイテム・効果から作り直す
+        （取り直しで無効になった古いイベントは発火しても何もしないため不要）。
+
+        Args:
+            state: snapshot() の戻り値
+        """
+        (self.tick, self.left_score, self.right_score, self.running, self.item_spawn_timer,
+         self.paddle_hits, items_left, items_right, self._speed_effect_epoch,
+         ball_x, ball_y, velocity_x, velocity_y, owner,
+         left_y, left_height, right_y, right_height,
+         items, left_effects, right_effects, speed_effects,
+         delay_remaining, target_y, rng_state) = state
+
+        ball = self.ball
+        ball.x, ball.y, ball.velocity_x, ball.velocity_y, ball.owner = ball_x, ball_y, velocity_x, velocity_y, owner
+        self.left_paddle.y, self.left_paddle.height = left_y, left_height
+        self.right_paddle.y, self.right_paddle.height = right_y, right_height
+        self.items_collected = {'left': items_left, 'right': items_right}
+        self.cpu_controller.delay_remaining = delay_remaining
+        self.cpu_controller.target_y = target_y
+        self.rng.setstate(rng_state)
+
+        self.item_timers = TickScheduler()
+        self.helper_items = []
+        for x, y, item_type, lifetime, expires_at in items:
+            item = HelperItem(x, y, item_type, lifetime)
+            item.expires_at = expires_at
+            self.helper_items.append(item)
+            if expires_at is not None:
+                self.item_timers.schedule(expires_at, item)
+
+        self.effect_timers = TickScheduler()
+        self.active_effects = {'left': dict(left_effects), 'right': dict(right_effects)}
+        for player, effects in self.active_effects.items():
+            for effect_type, expires_at in effects.items():
+                self.effect_timers.schedule(expires_at, ('player', player, effect_type, expires_at))
+        self.ball_speed_effects = [SpeedEffect(*values) for values in speed_effects]
+        for speed_effect in self.ball_speed_effects:
+            self.effect_timers.schedule(speed_effect.expires_at,
+                                        ('ball_speed', self._speed_effect_epoch, speed_effect))
+
+    def step(self, n=1, left_input=INPUT_NONE, right_input=INPUT_NONE):
+        """同じ入力でシミュレーションを n ステップ進める
+
+        フレームレートの制限はなく、呼び出し側の速度で進む。
+
+        Args:
+            n: 進めるステップ数
+            left_input: 左パドルの入力（INPUT_UP / INPUT_NONE / INPUT_DOWN）
+            right_input: 右パドルの入力（CPUモードでは無視される）
+        """
+        update = self.update
+        for _ in range(n):
+            update(left_input, right_input)
+
+    def update(self, left_input=INPUT_NONE, right_input=INPUT_NONE):
+        """ゲーム状態を1ステップ更新
+
+        Args:
+            left_input: 左パドルの入力（INPUT_UP / INPUT_NONE / INPUT_DOWN）
+            right_input: 右パドルの入力（CPUモードでは無視される）
+        """
+        self.tick += 1
+
+        # プレイヤー入力によるパドル移動
+        if left_input:
+            self._move_paddle('left', left_input)
+        if right_input and not self.cpu_mode:
+            self._move_paddle('right', right_input)
+
+        self._move_ball()
+
+        # CPU制御
+        if self.cpu_mode:
+            self._update_cpu()
+
+        # おたすけアイテムの更新
+        self._update_helper_items()
+
+        # 効果時間の更新（毎フレーム実行）
+        self._update_effect_timers()
+
+        # パドルとの衝突判定（スイープ判定では移動中に済んでいる）
+        if not self.swept_collisions:
+            self._check_paddle_hits()
+
+        # スコア判定
+        self._check_score()
+
+    def _move_ball(self):
+        """ボールを1ティック分動かす（スイープ判定ではパドルとの反射も行う）"""
+        if self.swept_collisions:
+            self._sweep_ball()
+        else:
+            self.ball.update(self.width, self.height)
+
+    def _check_score(self):
+        """ボールが左右の端を越えたら得点してボールを戻す"""
+        ball = self.ball
+        if ball.x < 0:
+            self.right_score += 1
+            self._reset_ball()
+        elif ball.x > self.width:
+            self.left_score += 1
+            self._reset_ball()
+
+    def _check_paddle_hits(self):
+        """移動後の位置でのパドルとの衝突判定（簡易版）"""
+        ball = self.ball
+        left_paddle = self.left_paddle
+        if (ball.x - ball.radius <= left_paddle.x + left_paddle.width and
+            ball.y >= left_paddle.y and
+            ball.y <= left_paddle.y + left_paddle.height):
+            if ball.velocity_x < 0:
+                self.paddle_hits += 1
+            ball.velocity_x = abs(ball.velocity_x)
+            ball.set_owner('left')  # 左プレイヤーの所有に
+
+        right_paddle = self.right_paddle
+        if (ball.x + ball.radius >= right_paddle.x and
+            ball.y >= right_paddle.y and
+            ball.y <= right_paddle.y + right_paddle.height):
+            if ball.velocity_x > 0:
+                self.paddle_hits += 1
+            ball.velocity_x = -abs(ball.velocity_x)
+            ball.set_owner('right')  # 右プレイヤーの所有に
+
+    def _sweep_ball(self):
+        """ボールを1ティック分動かし、途中で当たった壁・パドルで反射させる
+
+        当たった時刻までの線分を self._ball_path に残し、アイテムとの
+        判定に使う。
+        """
+        ball = self.ball
+        path = self._ball_path
+        path.clear()
+        remaining = 1.0
+        for _ in range(MAX_BOUNCES_PER_TICK):
+            dx = ball.velocity_x * remaining
+            dy = ball.velocity_y * remaining
+            contact = first_contact(ball.x, ball.y, dx, dy, ball.radius, self.height,
+                                    self.left_paddle, self.right_paddle)
+            t = 1.0 if contact is None else contact[0]
+            path.append((ball.x, ball.y, dx * t, dy * t, ball.owner))
+            ball.x += dx * t
+            ball.y += dy * t
+            if contact is None:
+                return
+            remaining *= 1.0 - t
+
+            surface = contact[1]
+            if surface == 'top':
+                ball.velocity_y = abs(ball.velocity_y)
+            elif surface == 'bottom':
+                ball.velocity_y = -abs(ball.velocity_y)
+            elif surface == 'left':
+                self.paddle_hits += 1
+                ball.velocity_x = abs(ball.velocity_x)
+                ball.set_owner('left')
+            else:
+                self.paddle_hits += 1
+                ball.velocity_x = -abs(ball.velocity_x)
+                ball.set_owner('right')
+
+    def _move_paddle(self, player, direction):
+        """プレイヤー入力でパドルを移動（画面外には出ない）
+
+        Args:
+            player: 'left' または 'right'
+            direction: INPUT_UP または INPUT_DOWN
+        """
+        paddle = self.left_paddle if player == 'left' else self.right_paddle
+        # パドル移動速度（fast_paddle効果を考慮）
+        speed = (8 if 'fast_paddle' in self.active_effects[player] else 5) * self.speed_scale
+
+        if direction < 0:
+            if paddle.y > 0:
+                paddle.move_up(speed)
+        elif direction > 0:
+            if paddle.y < self.height - paddle.height:
+                paddle.move_down(speed)
+
+    def _update_cpu(self):
+        """CPU制御の更新"""
+        self.cpu_controller.update(self)
+
+    def _reset_ball(self):
+        """ボールをリセット"""
+        # すべてのボール速度効果をクリアして元の速度に戻す
+        self.ball_speed_effects.clear()
+        self._speed_effect_epoch += 1
+
+        # 方向を保持して元の速度に戻す
+        direction_x = 1 if self.ball.velocity_x > 0 else -1
+        direction_y = 1 if self.ball.velocity_y > 0 else -1
+
+        self.ball.x = float(self.width // 2)
+        self.ball.y = float(self.height // 2)
+        self.ball.velocity_x = self.ball_original_velocity_x * -direction_x  # 方向転換
+        self.ball.velocity_y = self.ball_original_velocity_y * direction_y
+        self.ball.set_owner('neutral')  # ニュートラルに戻す
+
+    def _update_helper_items(self):
+        """おたすけアイテムの更新処理"""
+        # アイテムの生成タイマー
+        self.item_spawn_timer += 1
+        if self.item_spawn_timer >= self.item_spawn_interval:
+            self._spawn_helper_item()
+            self.item_spawn_timer = 0
+
+        # 寿命の尽きたアイテムを削除（取得済みのものは無視）
+        for item in self.item_timers.pop_due(self.tick):
+            if item.active:
+                item.active = False
+                self.helper_items.remove(item)
+
+        if not self.helper_items:
+            return
+
+        # アイテムとパドルの衝突判定
+        self._check_item_collisions()
+
+    def _spawn_helper_item(self):
+        """おたすけアイテムの生成"""
+        if len(self.helper_items) < self.max_items:  # 既定は最大3個まで
+            x = self.rng.randint(200, self.width - 200)  # 画面中央付近
+            y = self.rng.randint(100, self.height - 100)
+            item_type = self.rng.choice(self.item_types)
+            new_item = HelperItem(x, y, item_type, self.item_lifetime)
+            self.helper_items.append(new_item)
+            # 生成したティックを1ティック目として lifetime ティック後に消える
+            new_item.expires_at = self.tick + new_item.lifetime - 1
+            self.item_timers.schedule(new_item.expires_at, new_item)
+
+    def _check_item_collisions(self):
+        """アイテムとパドル・ボールの衝突判定"""
+        for item in self.helper_items[:]:
+            # ボールとの衝突判定（平方根を使わず距離の2乗で比べる）
+            owner = self._ball_touch_owner(item)
+            if owner is not None:
+                # ボールの所有者に基づいて効果を適用
+                if owner == 'left':
+                    self._apply_item_effect('left', item.item_type)
+                elif owner == 'right':
+                    self._apply_item_effect('right', item.item_type)
+                # ニュートラルの場合は効果なし
+                self._remove_helper_item(item)
+                continue
+
+            # パドルとの衝突
+            player = self._paddle_touching_item(item)
+            if player is not None:
+                self._apply_item_effect(player, item.item_type)
+                self._remove_helper_item(item)
+
+    def _paddle_touching_item(self, item):
+        """アイテムに触れているパドルのプレイヤー（触れていなければ None）"""
+        for player, paddle in (('left', self.left_paddle), ('right', self.right_paddle)):
+            if (abs(item.x - (paddle.x + paddle.width/2)) < item.radius + paddle.width/2 and
+                abs(item.y - (paddle.y + paddle.height/2)) < item.radius + paddle.height/2):
+                return player
+        return None
+
+    def _ball_touch_owner(self, item):
+        """ボールがアイテムに触れたときのボールの所有者（触れていなければ None）"""
+        ball = self.ball
+        reach = ball.radius + item.radius
+        if not self.swept_collisions:
+            dx = ball.x - item.x
+            dy = ball.y - item.y
+            return ball.owner if dx * dx + dy * dy < reach * reach else None
+        # このティックの移動線分のうち、最初に触れたものの所有者
+        for x, y, dx, dy, owner in self._ball_path:
+            if sweep_circle(x, y, dx, dy, item.x, item.y, reach) is not None:
+                return owner
+        return None
+
+    def _remove_helper_item(self, item):
+        """取得したアイテムを削除（期限イベントは発火時に無視される）"""
+        item.active = False
+        self.helper_items.remove(item)
+
+    def _apply_item_effect(self, player, item_type):
+        """アイテム効果の適用"""
+        # 適用したティックを1ティック目として effect_duration ティック後に切れる
+        expires_at = self.tick + self.effect_duration - 1
+        self.items_collected[player] += 1
+
+        if item_type == 'big_paddle':
+            if player == 'left':
+                self.left_paddle.height = int(self.left_paddle_original_height * self.big_paddle_factor)
+            else:
+                self.right_paddle.height = int(self.right_paddle_original_height * self.big_paddle_factor)
+
+        elif item_type == 'slow_ball':
+            # ボール速度を減速（既定は75%、スタックベースで管理）
+            multiplier = self.slow_ball_multiplier
+            self.ball.velocity_x *= multiplier
+            self.ball.velocity_y *= multiplier
+            speed_effect = SpeedEffect('slow', multiplier, expires_at, player)
+            self.ball_speed_effects.append(speed_effect)
+            self.effect_timers.schedule(expires_at, ('ball_speed', self._speed_effect_epoch, speed_effect))
+
+        elif item_type != 'fast_paddle':
+            return
+        # fast_paddle はそのプレイヤーのパドル移動速度アップ（_move_paddleで使用）
+
+        # 同じ効果を取り直したら期限を延ばす（古い期限イベントは無視される）
+        self.active_effects[player][item_type] = expires_at
+        self.effect_timers.schedule(expires_at, ('player', player, item_type, expires_at))
+
+    def _update_effect_timers(self):
+        """期限が来た効果の解除"""
+        for event in self.effect_timers.pop_due(self.tick):
+            if event[0] == 'player':
+                _, player, effect_type, expires_at = event
+                if self.active_effects[player].get(effect_type) != expires_at:
+                    continue  # 取り直しで延長された古い期限
+                # 効果の解除
+                if effect_type == 'big_paddle':
+                    if player == 'left':
+                        self.left_paddle.height = self.left_paddle_original_height
+                    else:
+                        self.right_paddle.height = self.right_paddle_original_height
+                del self.active_effects[player][effect_type]
+            else:
+                _, epoch, speed_effect = event
+                if epoch != self._speed_effect_epoch:
+                    continue  # ボールリセットで破棄済み
+                # 効果を逆転させて元に戻す
+                self.ball.velocity_x /= speed_effect.multiplier
+                self.ball.velocity_y /= speed_effect.multiplier
+                self.ball_speed_effects.remove(speed_effect)
+
+
+class FixedStepClock:
+    """固定タイムステップのアキュムレータ
+
+    実時間の経過をためて、固定長のティック何回分に当たるかを返す。
+    描画が遅れても物理は同じ刻みで進み、追いつき処理は1フレームあたり
+    max_steps 回で打ち切る（処理落ちの悪循環を防ぐ）。
+    """
+
+    def __init__(self, tick_rate=BASE_TICK_RATE, max_steps=5):
+        """クロックの初期化
+
+        Args:
+            tick_rate: 1秒あたりのティック数
+            max_steps: 1フレームで進める最大ティック数
+        """
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # 追いつけずに捨てた時間の累計
+
+    def advance(self, frame_time):
+        """経過時間を加え、今回進めるティック数を返す
+
+        Args:
+            frame_time: 前フレームからの経過秒数
+
+        Returns:
+            int: 進めるティック数（0 以上 max_steps 以下）
+        """
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # 追いつけない分は捨てて、端数だけを次に持ち越す
+            dropped = (steps - self.max_steps) * self.dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+        self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        """直前のティックから次のティックまでの進み具合（補間係数 0〜1）"""
+        return min(self.accumulator / self.dt, 1.0)
@@ -0,0 +1,239 @@
+"""強化学習用の Pong 環境（Gym 形式、pygame 非依存）
+
+PongEnv は PongSimulation を1試合分包み、reset() / step() の Gym 形式の
+インターフェースで左パドルを操作させる。右パドルは CPU が動かす。
+VectorPongEnv は BatchPongEngine で N 試合をまとめて進め、得点が入った
+試合だけを自動でリセットする。どちらも画面を持たないため、学習の
+スループットは物理の計算だけで決まる。
+
+行動は 0（上）、1（何もしない）、2（下）。報酬は左が得点すると +1、
+右が得点すると -1 で、1点入るとエピソードが終わる。
+
+観測は float32 の1次元配列（OBSERVATION_SIZE 要素）で、次の順に並ぶ。
+
+- ボール: X, Y（画面サイズで割る）、速度 X, Y（BALL_SPEED_SCALE で割る）、所有者（0: なし, 1: 左, 2: 右）
+- パドル: 左の Y, 高さ、右の Y, 高さ（画面の高さで割る）
+- アイテム（max_items 個分）: 有無、X, Y、種類（0: big_paddle, 1: slow_ball, 2: fast_paddle）
+- 効果の残り時間（効果時間で割る）: 左の big_paddle, fast_paddle、右の big_paddle, fast_paddle
+- ボールにかかっている減速効果の数
+"""
+import random
+
+import numpy as np
+
+from pong_batch import BatchPongEngine, ITEM_BIG_PADDLE, ITEM_FAST_PADDLE
+from pong_core import INPUT_DOWN, INPUT_NONE, INPUT_UP, PongSimulation
+
+
+ACTIONS = (INPUT_UP, INPUT_NONE, INPUT_DOWN)
+ACTION_COUNT = len(ACTIONS)
+MAX_ITEMS = 3
+ITEM_FEATURES = 4
+OBSERVATION_SIZE = 5 + 4 + MAX_ITEMS * ITEM_FEATURES + 4 + 1
+BALL_SPEED_SCALE = 10.0
+
+_ITEM_CODES = {'big_paddle': 0, 'slow_ball': 1, 'fast_paddle': 2}
+_OWNER_CODES = {'neutral': 0, 'left': 1, 'right': 2}
+_TIMED_EFFECTS = ('big_paddle', 'fast_paddle')
+
+
+class PongEnv:
+    """1試合分の Gym 形式の環境（左パドルをエージェントが操作）"""
+
+    observation_size = OBSERVATION_SIZE
+    action_count = ACTION_COUNT
+
+    def __init__(self, seed=None, max_episode_steps=10000):
+        """環境の初期化
+
+        Args:
+            seed: エピソードごとのシードを決める乱数のシード
+            max_episode_steps: 得点が入らなくても打ち切るステップ数
+        """
+        self.max_episode_steps = max_episode_steps
+        self._seeds = random.Random(seed)
+        self.sim = None
+        self.steps = 0
+
+    def reset(self, seed=None):
+        """新しいエピソードを始める
+
+        Args:
+            seed: このエピソード以降のシード（省略時は続きの乱数を使う）
+
+        Returns:
+            tuple: (観測, info)
+        """
+        if seed is not None:
+            self._seeds.seed(seed)
+        self.sim = PongSimulation(cpu_mode=True, seed=self._seeds.getrandbits(32))
+        self.sim.max_items = MAX_ITEMS
+        self.steps = 0
+        return self.observe(), {}
+
+    def step(self, action):
+        """行動を1ティック分適用する
+
+        Args:
+            action: 0（上）、1（何もしない）、2（下）
+
+        Returns:
+            tuple: (観測, 報酬, 終了したか, 打ち切られたか, info)
+
+        Raises:
+            RuntimeError: reset() の前に呼ばれた場合
+        """
+        sim = self.sim
+        if sim is None:
+            raise RuntimeError("step() の前に reset() を呼んでください")
+        left_score = sim.left_score
+        right_score = sim.right_score
+        sim.update(ACTIONS[action])
+        self.steps += 1
+
+        reward = float((sim.left_score - left_score) - (sim.right_score - right_score))
+        terminated = reward != 0.0
+        truncated = not terminated and self.steps >= self.max_episode_steps
+        info = {'paddle_hits': sim.paddle_hits, 'items_collected': dict(sim.items_collected)}
+        return self.observe(), reward, terminated, truncated, info
+
+    def observe(self):
+        """現在の状態の観測
+
+        Returns:
+            numpy.ndarray: 長さ OBSERVATION_SIZE の float32 配列
+        """
+        sim = self.sim
+        width = sim.width
+        height = sim.height
+        ball = sim.ball
+        values = [ball.x / width, ball.y / height,
+                  ball.velocity_x / BALL_SPEED_SCALE, ball.velocity_y / BALL_SPEED_SCALE,
+                  _OWNER_CODES[ball.owner],
+                  sim.left_paddle.y / height, sim.left_paddle.height / height,
+                  sim.right_paddle.y / height, sim.right_paddle.height / height]
+        items = sim.helper_items
+        for k in range(MAX_ITEMS):
+            if k < len(items):
+                item = items[k]
+                values += (1.0, item.x / width, item.y / height, _ITEM_CODES[item.item_type])
+            else:
+                values += (0.0, 0.0, 0.0, 0.0)
+        duration = sim.effect_duration
+        for player in ('left', 'right'):
+            for effect_type in _TIMED_EFFECTS:
+                values.append(sim.effect_remaining(player, effect_type) / duration)
+        values.append(len(sim.ball_speed_effects))
+        return np.array(values, dtype=np.float32)
+
+
+class VectorPongEnv:
+    """N 試合をまとめて進めるベクトル化環境
+
+    得点が入った（または打ち切られた）試合はそのステップのうちにリセット
+    するため、step() が返す観測は次のエピソードの最初の観測になる。
+    リセット前の最後の観測は info['final_observation'] に入る。
+
+    BatchPongEngine のティックとアイテムの出現タイマーは全試合で共通のため、
+    リセットした試合でも最初のアイテムは他の試合と同じティックに出現する。
+    """
+
+    observation_size = OBSERVATION_SIZE
+    action_count = ACTION_COUNT
+
+    def __init__(self, n_envs, seed=0, max_episode_steps=10000):
+        """環境の初期化
+
+        Args:
+            n_envs: 同時に進める試合数
+            seed: 乱数シード
+            max_episode_steps: 得点が入らなくても打ち切るステップ数
+        """
+        self.n_envs = n_envs
+        self.seed = seed
+        self.max_episode_steps = max_episode_steps
+        self._actions = np.array(ACTIONS, dtype=np.int64)
+        self._observation = np.zeros((n_envs, OBSERVATION_SIZE), dtype=np.float32)
+        self.engine = None
+        self.steps = np.zeros(n_envs, dtype=np.int64)
+
+    def reset(self, seed=None):
+        """すべての試合を新しく始める
+
+        Args:
+            seed: 乱数シード（省略時はコンストラクタのシード）
+
+        Returns:
+            tuple: (観測 (n_envs, OBSERVATION_SIZE), info)
+        """
+        if seed is not None:
+            self.seed = seed
+        self.engine = BatchPongEngine(self.n_envs, seed=self.seed)
+        self.steps[:] = 0
+        return self.observe().copy(), {}
+
+    def step(self, actions):
+        """試合ごとの行動を1ティック分適用する
+
+        Args:
+            actions: 長さ n_envs の行動の配列（0: 上、1: 何もしない、2: 下）
+
+        Returns:
+            tuple: (観測, 報酬, 終了したか, 打ち切られたか, info)。すべて長さ n_envs の配列
+
+        Raises:
+            RuntimeError: reset() の前に呼ばれた場合
+        """
+        engine = self.engine
+        if engine is None:
+            raise RuntimeError("step() の前に reset() を呼んでください")
+        left_score = engine.left_score.copy()
+        right_score = engine.right_score.copy()
+        engine.update(self._actions[np.asarray(actions)])
+        self.steps += 1
+
+        reward = ((engine.left_score - left_score) - (engine.right_score - right_score)).astype(np.float32)
+        terminated = reward != 0
+        truncated = ~terminated & (self.steps >= self.max_episode_steps)
+        done = terminated | truncated
+
+        info = {}
+        if done.any():
+            info['final_observation'] = self.observe()[done].copy()
+            info['done_index'] = np.flatnonzero(done)
+            engine.reset_games(done)
+            self.steps[done] = 0
+        return self.observe().copy(), reward, terminated, truncated, info
+
+    def observe(self):
+        """全試合の観測を内部のバッファに書き込む
+
+        Returns:
+            numpy.ndarray: (n_envs, OBSERVATION_SIZE) の float32 配列（次の呼び出しで上書きされる）
+        """
+        engine = self.engine
+        out = self._observation
+        width = engine.width
+        height = engine.height
+        out[:, 0] = engine.ball_x / width
+        out[:, 1] = engine.ball_y / height
+        out[:, 2] = engine.ball_vx / BALL_SPEED_SCALE
+        out[:, 3] = engine.ball_vy / BALL_SPEED_SCALE
+        out[:, 4] = engine.ball_owner
+        out[:, 5] = engine.paddle_y[0] / height
+        out[:, 6] = engine.paddle_height[0] / height
+        out[:, 7] = engine.paddle_y[1] / height
+        out[:, 8] = engine.paddle_height[1] / height
+
+        items = out[:, 9:9 + MAX_ITEMS * ITEM_FEATURES].reshape(-1, MAX_ITEMS, ITEM_FEATURES)
+        active = engine.item_active[:, :MAX_ITEMS]
+        items[:, :, 0] = active
+        items[:, :, 1] = np.where(active, engine.item_x[:, :MAX_ITEMS] / width, 0.0)
+        items[:, :, 2] = np.where(active, engine.item_y[:, :MAX_ITEMS] / height, 0.0)
+        items[:, :, 3] = np.where(active, engine.item_type[:, :MAX_ITEMS], 0)
+
+        start = 9 + MAX_ITEMS * ITEM_FEATURES
+        timers = engine.effect_timer[:, :, (ITEM_BIG_PADDLE, ITEM_FAST_PADDLE)].reshape(-1, 4)
+        out[:, start:start + 4] = timers / engine.effect_duration
+        out[:, start + 4] = engine.speed_effect_count
+        return out
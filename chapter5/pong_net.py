@@ -0,0 +1,405 @@
+"""Pong の対戦用ロールバックネットコード（pygame 非依存）
+
+シミュレーションは決定的なので、両端で同じ入力列を与えれば同じ試合になる。
+各端は自分の入力を input_delay ティック遅らせて使い、相手の入力がまだ
+届いていないティックは直前の確定入力が続くと予測して先に進める。
+予測が外れた入力が後から届いたら、そのティックの前のスナップショットへ
+戻して（ロールバック）、今のティックまで再シミュレーションする。
+
+通信路は send(bytes) / receive() -> list[bytes] を持つトランスポートで
+差し替えられる。UDP の実装と、遅延・揺らぎ・パケット損失を再現する
+プロセス内の通信路（テスト・計測用）がある。
+"""
+import argparse
+import heapq
+import random
+import socket
+import struct
+import time
+
+from pong_core import PongSimulation, INPUT_UP, INPUT_NONE, INPUT_DOWN
+
+
+# パケット: 先頭ティック, 相手の入力を確定済みのティック, 入力数, 入力 (+1 したバイト列)
+_PACKET = struct.Struct('<iiB')
+_MAX_INPUTS_PER_PACKET = 255
+
+
+def encode_packet(start, ack, inputs):
+    """入力パケットをエンコード
+
+    Args:
+        start: inputs[0] のティック
+        ack: 相手の入力を連続して受け取り済みの最後のティック
+        inputs: 入力の並び（-1, 0, 1）
+
+    Returns:
+        bytes: パケット
+    """
+    return _PACKET.pack(start, ack, len(inputs)) + bytes(value + 1 for value in inputs)
+
+
+def decode_packet(data):
+    """入力パケットをデコード
+
+    Returns:
+        tuple: (先頭ティック, ack, 入力のリスト)
+
+    Raises:
+        ValueError: パケットが壊れている場合
+    """
+    if len(data) < _PACKET.size:
+        raise ValueError("パケットが短すぎます")
+    start, ack, count = _PACKET.unpack_from(data)
+    body = data[_PACKET.size:]
+    if len(body) != count or any(byte > 2 for byte in body):
+        raise ValueError("パケットの入力が不正です")
+    return start, ack, [byte - 1 for byte in body]
+
+
+class LossyChannel:
+    """遅延・揺らぎ・パケット損失を再現するプロセス内の通信路
+
+    時間は advance() で進めるティック単位。送ったパケットは
+    latency + 0〜jitter ティック後に届く（揺らぎで順序が入れ替わることもある）。
+    """
+
+    def __init__(self, latency=0, jitter=0, loss=0.0, seed=0):
+        """通信路の初期化
+
+        Args:
+            latency: 片道の遅延（ティック数）
+            jitter: 遅延に加わる揺らぎの最大値（ティック数）
+            loss: パケットが失われる確率
+            seed: 損失と揺らぎの乱数シード
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.now = 0
+        self.sent = 0
+        self.dropped = 0
+        self._queues = ([], [])  # 受信側ごとの (届くティック, 連番, データ) のヒープ
+        self._sequence = 0
+
+    def endpoints(self):
+        """両端のトランスポートを作る
+
+        Returns:
+            tuple: (端0, 端1) の LoopbackTransport
+        """
+        return LoopbackTransport(self, 0), LoopbackTransport(self, 1)
+
+    def advance(self, ticks=1):
+        """時間を進める"""
+        self.now += ticks
+
+    def _send(self, side, data):
+        self.sent += 1
+        if self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        delay = self.latency + (self.rng.randint(0, self.jitter) if self.jitter else 0)
+        heapq.heappush(self._queues[1 - side], (self.now + delay, self._sequence, data))
+        self._sequence += 1
+
+    def _receive(self, side):
+        queue = self._queues[side]
+        received = []
+        while queue and queue[0][0] <= self.now:
+            received.append(heapq.heappop(queue)[2])
+        return received
+
+
+class LoopbackTransport:
+    """LossyChannel の片端"""
+
+    def __init__(self, channel, side):
+        self.channel = channel
+        self.side = side
+
+    def send(self, data):
+        """パケットを送る"""
+        self.channel._send(self.side, data)
+
+    def receive(self):
+        """届いているパケットをすべて受け取る（待たない）"""
+        return self.channel._receive(self.side)
+
+    def close(self):
+        """何もしない（UdpTransport と同じ使い方にするため）"""
+
+
+class UdpTransport:
+    """UDP のトランスポート（ノンブロッキング）"""
+
+    def __init__(self, local_address, remote_address):
+        """ソケットを作って待ち受ける
+
+        Args:
+            local_address: 待ち受けるアドレス (host, port)
+            remote_address: 相手のアドレス (host, port)
+        """
+        self.remote_address = remote_address
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(local_address)
+        self.socket.setblocking(False)
+
+    def send(self, data):
+        """パケットを送る（相手がまだいなくても失敗として扱わない）"""
+        try:
+            self.socket.sendto(data, self.remote_address)
+        except OSError:
+            pass
+
+    def receive(self):
+        """届いているパケットをすべて受け取る（待たない）"""
+        received = []
+        while True:
+            try:
+                data, _ = self.socket.recvfrom(2048)
+            except (BlockingIOError, InterruptedError):
+                return received
+            except ConnectionError:
+                continue  # 相手が起動前だったときの ICMP エラー
+            received.append(data)
+
+    def close(self):
+        """ソケットを閉じる"""
+        self.socket.close()
+
+
+def _sign(value):
+    """入力を -1, 0, 1 に正規化"""
+    return (value > 0) - (value < 0)
+
+
+class RollbackSession:
+    """入力遅延とロールバックで相手とシミュレーションを同期するセッション
+
+    両端は同じ設定・同じシードのシミュレーションから始めること。
+    """
+
+    def __init__(self, sim, transport, local_side='left', input_delay=2, max_prediction=8, step=None):
+        """セッションの初期化
+
+        Args:
+            sim: 進める PongSimulation（2Pモード）
+            transport: send / receive を持つトランスポート
+            local_side: 自分が操作するパドル（'left' または 'right'）
+            input_delay: 自分の入力を使うまでのティック数
+            max_prediction: 相手の確定入力からこれ以上先には進まない（待つ）
+            step: 1ティック進める関数 step(left_input, right_input)（省略時は sim.update）
+        """
+        self.sim = sim
+        self.transport = transport
+        self.local_side = local_side
+        self.input_delay = input_delay
+        self.max_prediction = max_prediction
+        self.step = step or sim.update
+
+        self.frame = sim.tick  # 次にシミュレーションするティック
+        self.local_inputs = {frame: INPUT_NONE for frame in range(self.frame, self.frame + input_delay)}
+        self.remote_inputs = {}  # 受け取った相手の入力
+        self.predicted = {}  # 予測で進めたティックの予測値
+        self.snapshots = {}  # ティック -> そのティックを進める前の状態
+        self.remote_confirmed = self.frame - 1  # 相手の入力を連続して受け取った最後のティック
+        self.remote_ack = self.frame - 1  # 相手が自分の入力を受け取った最後のティック
+        self._last_remote = INPUT_NONE
+
+        # 計測
+        self.rollbacks = 0
+        self.max_rollback_depth = 0
+        self.total_rollback_depth = 0
+        self.resimulated_ticks = 0
+        self.resimulation_time = 0.0
+        self.stalls = 0
+
+    def advance(self, local_input):
+        """届いた入力を反映し、自分の入力を送って1ティック進める
+
+        Args:
+            local_input: 自分のパドルの入力
+
+        Returns:
+            bool: 進めた場合 True（相手を待つ場合は False）
+        """
+        self.poll()
+        if self.frame - self.remote_confirmed > self.max_prediction:
+            self.stalls += 1
+            return False
+        self.local_inputs[self.frame + self.input_delay] = _sign(local_input)
+        self._send()
+        self._simulate_frame()
+        return True
+
+    def poll(self):
+        """届いたパケットを処理し、予測が外れていればロールバックする"""
+        rollback_to = None
+        for data in self.transport.receive():
+            try:
+                start, ack, inputs = decode_packet(data)
+            except ValueError:
+                continue
+            self.remote_ack = max(self.remote_ack, ack)
+            for offset, value in enumerate(inputs):
+                frame = start + offset
+                if frame <= self.remote_confirmed or frame in self.remote_inputs:
+                    continue  # 再送で重複して届いた入力
+                self.remote_inputs[frame] = value
+                predicted = self.predicted.pop(frame, None)
+                if predicted is not None and predicted != value:
+                    if rollback_to is None or frame < rollback_to:
+                        rollback_to = frame
+
+        while self.remote_confirmed + 1 in self.remote_inputs:
+            self.remote_confirmed += 1
+            self._last_remote = self.remote_inputs[self.remote_confirmed]
+
+        if rollback_to is not None:
+            self._rollback(rollback_to)
+        self._discard_history()
+
+    def _rollback(self, frame):
+        """frame の前の状態に戻して今のティックまで再シミュレーション"""
+        target = self.frame
+        depth = target - frame
+        start = time.perf_counter()
+        self.sim.restore(self.snapshots[frame])
+        self.frame = frame
+        while self.frame < target:
+            self._simulate_frame()
+        self.resimulation_time += time.perf_counter() - start
+        self.rollbacks += 1
+        self.total_rollback_depth += depth
+        self.resimulated_ticks += depth
+        self.max_rollback_depth = max(self.max_rollback_depth, depth)
+
+    def _simulate_frame(self):
+        """今のティックを（必要なら相手の入力を予測して）進める"""
+        frame = self.frame
+        self.snapshots[frame] = self.sim.snapshot()
+        local = self.local_inputs.get(frame, INPUT_NONE)
+        remote = self.remote_inputs.get(frame)
+        if remote is None:
+            remote = self._last_remote  # 直前の確定入力が続くと予測
+            self.predicted[frame] = remote
+        if self.local_side == 'left':
+            self.step(local, remote)
+        else:
+            self.step(remote, local)
+        self.frame = frame + 1
+
+    def _send(self):
+        """相手がまだ受け取っていない自分の入力をまとめて送る（損失に備えて毎回再送）"""
+        start = self.remote_ack + 1
+        end = min(max(self.local_inputs, default=start - 1) + 1, start + _MAX_INPUTS_PER_PACKET)
+        inputs = [self.local_inputs.get(frame, INPUT_NONE) for frame in range(start, end)]
+        self.transport.send(encode_packet(start, self.remote_confirmed, inputs))
+
+    def _discard_history(self):
+        """もう戻る必要のないスナップショットと入力を捨てる"""
+        # 確定した入力で進め終えたティックには戻らない
+        settled = min(self.remote_confirmed, self.frame - 1)
+        for frame in [f for f in self.snapshots if f <= settled]:
+            del self.snapshots[frame]
+        for frame in [f for f in self.remote_inputs if f <= settled]:
+            del self.remote_inputs[frame]
+        keep_local = min(settled, self.remote_ack)
+        for frame in [f for f in self.local_inputs if f <= keep_local]:
+            del self.local_inputs[frame]
+
+    def stats(self):
+        """ロールバックの計測結果
+
+        Returns:
+            dict: frames, rollbacks, max_depth, mean_depth, resimulated_ticks, resimulation_ms, stalls
+        """
+        return {
+            'frames': self.frame,
+            'rollbacks': self.rollbacks,
+            'max_depth': self.max_rollback_depth,
+            'mean_depth': self.total_rollback_depth / self.rollbacks if self.rollbacks else 0.0,
+            'resimulated_ticks': self.resimulated_ticks,
+            'resimulation_ms': self.resimulation_time * 1000,
+            'stalls': self.stalls,
+        }
+
+
+def simulate_netplay(frames=1800, latency=3, jitter=2, loss=0.05, input_delay=2, max_prediction=8, seed=0):
+    """遅延と損失のある通信路で2つのセッションを対戦させて計測する
+
+    両プレイヤーの入力はランダムに切り替える。最後に通信を続けて両端の
+    入力を確定させ、状態が一致しているか確かめる。
+
+    Args:
+        frames: 各端が進めるティック数
+        latency: 片道の遅延（ティック数）
+        jitter: 遅延の揺らぎ（ティック数）
+        loss: パケット損失率
+        input_delay: 入力遅延（ティック数）
+        max_prediction: 予測で先に進める最大ティック数
+        seed: 乱数シード
+
+    Returns:
+        dict: 'left' と 'right' の stats()、'in_sync'（状態が一致したか）、'dropped'
+    """
+    channel = LossyChannel(latency, jitter, loss, seed)
+    left_transport, right_transport = channel.endpoints()
+    sessions = {
+        'left': RollbackSession(PongSimulation(cpu_mode=False, seed=seed), left_transport, 'left',
+                                input_delay, max_prediction),
+        'right': RollbackSession(PongSimulation(cpu_mode=False, seed=seed), right_transport, 'right',
+                                 input_delay, max_prediction),
+    }
+    rng = random.Random(seed + 1)
+    held = {'left': INPUT_NONE, 'right': INPUT_NONE}
+    choices = (INPUT_UP, INPUT_NONE, INPUT_DOWN)
+
+    while min(session.frame for session in sessions.values()) < frames:
+        for side, session in sessions.items():
+            if session.frame >= frames:
+                continue
+            if rng.random() < 0.1:
+                held[side] = rng.choice(choices)
+            session.advance(held[side])
+        channel.advance()
+
+    # 残りの入力を行き渡らせる（最後の入力は input_delay 分先のティックに入っている）
+    for _ in range(1000):
+        if all(s.remote_confirmed >= frames - 1 and s.remote_ack >= frames - 1 for s in sessions.values()):
+            break
+        for session in sessions.values():
+            session.poll()
+            session._send()
+        channel.advance()
+
+    result = {side: session.stats() for side, session in sessions.items()}
+    result['in_sync'] = sessions['left'].sim.snapshot() == sessions['right'].sim.snapshot()
+    result['dropped'] = channel.dropped
+    return result
+
+
+def main(argv=None):
+    """遅延と損失を指定してロールバックの深さと再シミュレーションのコストを計測"""
+    parser = argparse.ArgumentParser(description="ロールバックネットコードの計測")
+    parser.add_argument('--frames', type=int, default=1800, help="進めるティック数")
+    parser.add_argument('--latency', type=int, default=3, help="片道の遅延（ティック数）")
+    parser.add_argument('--jitter', type=int, default=2, help="遅延の揺らぎ（ティック数）")
+    parser.add_argument('--loss', type=float, default=0.05, help="パケット損失率")
+    parser.add_argument('--delay', type=int, default=2, help="入力遅延（ティック数）")
+    parser.add_argument('--seed', type=int, default=0, help="乱数シード")
+    args = parser.parse_args(argv)
+
+    result = simulate_netplay(args.frames, args.latency, args.jitter, args.loss, args.delay, seed=args.seed)
+    for side in ('left', 'right'):
+        stats = result[side]
+        print(f"{side:>5}: rollbacks={stats['rollbacks']} max_depth={stats['max_depth']} "
+              f"mean_depth={stats['mean_depth']:.2f} resim={stats['resimulated_ticks']} ticks "
+              f"({stats['resimulation_ms']:.1f} ms) stalls={stats['stalls']}")
+    print(f"dropped packets: {result['dropped']}, in sync: {result['in_sync']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Pong のフレーム時間プロファイラ（pygame 非依存）
+
+フレームをフェーズ（events, update, draw, wait）に区切って所要時間を
+固定長のリングバッファに記録する。update や draw の内部の処理（CPU、
+アイテム、効果、衝突、テキスト描画など）は instrument() でメソッドを
+包んで計測する。無効なときは各計測点でフラグを見るだけで、メソッドも
+包まれないため、ほとんどコストがかからない。
+
+記録は Chrome のトレースイベント形式（chrome://tracing や Perfetto で
+読める JSON）に書き出せる。
+"""
+import functools
+import json
+import time
+from array import array
+
+
+PHASES = ('events', 'update', 'draw', 'wait')
+
+
+def percentile(sorted_values, p):
+    """ソート済みの値の p パーセンタイル（最近傍順位法）
+
+    Args:
+        sorted_values: 昇順にソートした値
+        p: パーセント（0〜100）
+
+    Returns:
+        float: パーセンタイル値（値がなければ 0.0）
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))  # 切り上げ
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+class FrameProfiler:
+    """フェーズごとのフレーム時間をリングバッファに記録するプロファイラ"""
+
+    def __init__(self, capacity=600, enabled=False, clock=time.perf_counter):
+        """プロファイラの初期化
+
+        Args:
+            capacity: 保持するフレーム数（古いものから上書きする）
+            enabled: 最初から計測するか
+            clock: 秒を返す時計関数
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.clock = clock
+
+        # フレームごとの記録（秒）。配列は最初に確保して使い回す
+        self._frame_start = array('d', bytes(8 * capacity))
+        self._frame_time = array('d', bytes(8 * capacity))
+        self._phase_time = {name: array('d', bytes(8 * capacity)) for name in PHASES}
+        self._section_time = {}  # instrument() した処理名 -> 配列
+        self._index = 0  # 次に書き込む位置
+        self.count = 0  # 記録済みのフレーム数（capacity で頭打ち）
+
+        # 計測中のフレームの状態
+        self._in_frame = False
+        self._start = 0.0
+        self._last = 0.0
+        self._instrumented = []
+
+    def begin_frame(self):
+        """フレームの計測を始める"""
+        if not self.enabled:
+            self._in_frame = False
+            return
+        self._in_frame = True
+        self._start = self._last = self.clock()
+        i = self._index
+        for times in self._phase_time.values():
+            times[i] = 0.0
+        for times in self._section_time.values():
+            times[i] = 0.0
+
+    def mark(self, phase):
+        """直前の区切りから今までを phase の時間として記録
+
+        Args:
+            phase: PHASES のいずれか
+        """
+        if not self._in_frame:
+            return
+        now = self.clock()
+        self._phase_time[phase][self._index] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """フレームの計測を終えてリングバッファを進める"""
+        if not self._in_frame:
+            return
+        self._in_frame = False
+        i = self._index
+        self._frame_start[i] = self._start
+        self._frame_time[i] = self.clock() - self._start
+        self._index = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def instrument(self, obj, attribute, section):
+        """obj のメソッドを包んで、呼び出しの所要時間を section に加算する
+
+        Args:
+            obj: メソッドを持つオブジェクト
+            attribute: 包むメソッド名
+            section: 記録する処理名
+        """
+        method = getattr(obj, attribute)
+        times = self._section_time.setdefault(section, array('d', bytes(8 * self.capacity)))
+        clock = self.clock
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                times[self._index] += clock() - start
+
+        setattr(obj, attribute, timed)
+        self._instrumented.append((obj, attribute))
+
+    def uninstrument(self):
+        """instrument() で包んだメソッドを元に戻す"""
+        for obj, attribute in reversed(self._instrumented):
+            delattr(obj, attribute)  # インスタンスに付けた包みを外すとクラスのメソッドに戻る
+        self._instrumented.clear()
+
+    def _order(self):
+        """記録済みのフレームの位置（古い順）"""
+        start = (self._index - self.count) % self.capacity
+        return [(start + k) % self.capacity for k in range(self.count)]
+
+    def frame_times(self, phase=None):
+        """記録済みのフレーム時間（古い順、秒）
+
+        Args:
+            phase: フェーズ名または処理名（省略時はフレーム全体）
+        """
+        if phase is None:
+            times = self._frame_time
+        else:
+            times = self._phase_time[phase] if phase in self._phase_time else self._section_time[phase]
+        return [times[i] for i in self._order()]
+
+    def summary(self):
+        """フレーム時間の統計
+
+        Returns:
+            dict: frames, fps, p50_ms, p95_ms, p99_ms, max_ms
+        """
+        times = sorted(self.frame_times())
+        total = sum(times)
+        return {
+            'frames': len(times),
+            'fps': len(times) / total if total > 0 else 0.0,
+            'p50_ms': percentile(times, 50) * 1000,
+            'p95_ms': percentile(times, 95) * 1000,
+            'p99_ms': percentile(times, 99) * 1000,
+            'max_ms': (times[-1] if times else 0.0) * 1000,
+        }
+
+    def export_chrome_trace(self, path):
+        """記録を Chrome のトレースイベント形式の JSON に書き出す
+
+        フレームとフェーズは時間幅つきのイベント（ph: 'X'）、instrument() した
+        処理はフレームごとの合計をカウンター（ph: 'C'）として書き出す。
+
+        Args:
+            path: 出力ファイルのパス
+        """
+        events = []
+        for i in self._order():
+            start = self._frame_start[i]
+            events.append({'name': 'frame', 'ph': 'X', 'pid': 0, 'tid': 0,
+                           'ts': start * 1e6, 'dur': self._frame_time[i] * 1e6})
+            offset = start
+            for name in PHASES:
+                duration = self._phase_time[name][i]
+                if duration > 0:
+                    events.append({'name': name, 'ph': 'X', 'pid': 0, 'tid': 0,
+                                   'ts': offset * 1e6, 'dur': duration * 1e6})
+                offset += duration
+            if self._section_time:
+                events.append({'name': 'sections (ms)', 'ph': 'C', 'pid': 0, 'tid': 0, 'ts': start * 1e6,
+                               'args': {name: times[i] * 1000 for name, times in self._section_time.items()}})
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,226 @@
+"""Pong の描画補助（フォント・テキストのキャッシュ、スプライトアトラス）"""
+from collections import OrderedDict
+
+import pygame
+
+from pong_core import Ball, HelperItem
+
+
+# アイテムの種類を示すマーク
+ITEM_MARKS = {'big_paddle': 'P+', 'slow_ball': 'S-', 'fast_paddle': 'F+'}
+
+# パドルの色（通常、効果が有効なとき）
+PADDLE_COLOR = (255, 255, 255)
+PADDLE_EFFECT_COLOR = (0, 255, 0)
+
+
+class TextRenderCache:
+    """フォントと描画済みテキストのキャッシュ
+
+    フォントはサイズごとに1回だけ読み込み、描画済みサーフェスは
+    (テキスト, サイズ, 色) をキーに LRU 方式で保持する。
+    """
+
+    def __init__(self, max_entries=256):
+        """キャッシュの初期化
+
+        Args:
+            max_entries: 保持する描画済みサーフェスの最大数
+        """
+        self.max_entries = max_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size):
+        """サイズに対応するフォントを取得（初回のみ読み込む）
+
+        Args:
+            size: フォントサイズ
+
+        Returns:
+            pygame.font.Font: フォント
+        """
+        font = self.fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text, size, color):
+        """テキストを描画したサーフェスを取得
+
+        Args:
+            text: 描画する文字列
+            size: フォントサイズ
+            color: 文字色 (R, G, B)
+
+        Returns:
+            pygame.Surface: 描画済みサーフェス（呼び出し側で変更しないこと）
+        """
+        key = (text, size, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # 最も長く使われていないものを捨てる
+        return surface
+
+    def stats(self):
+        """ヒット・ミスの集計
+
+        Returns:
+            dict: hits, misses, hit_rate, entries
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': len(self.surfaces),
+        }
+
+    def clear(self):
+        """キャッシュと集計を空にする"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class SpriteAtlas:
+    """ボール・アイテム・パドルの描画済みサーフェス（スプライト）
+
+    見た目の種類は少ない（ボールの色3つ、アイテム3種、パドルの色2つ×高さ2つ）
+    ため、表示サーフェスのピクセル形式に変換したスプライトを最初に作って
+    おき、毎フレームは blit するだけにする。円はカラーキー（RLE 圧縮）で
+    抜くため、ピクセルごとのアルファより速く、draw.circle と同じ画素になる。
+    アイテムのマークはアンチエイリアスのかかった文字を作成時に合成しておく。
+
+    表示サーフェスが作り直されたり大きさが変わったりしたときだけ作り直す。
+    """
+
+    COLORKEY = (255, 0, 255)
+
+    def __init__(self, text_cache=None):
+        """アトラスの初期化（スプライトは最初の ensure() で作る）
+
+        Args:
+            text_cache: マークの描画に使う TextRenderCache
+        """
+        self.text_cache = text_cache or TextRenderCache()
+        self.sprites = {}
+        self.builds = 0
+        self._target = None
+        self._size = None
+
+    def ensure(self, screen):
+        """screen 用のスプライトがなければ作る
+
+        Args:
+            screen: 描画先の表示サーフェス
+        """
+        if screen is not self._target or screen.get_size() != self._size:
+            self.build(screen)
+
+    def invalidate(self):
+        """次の ensure() で作り直させる（ウィンドウのリサイズ時など）"""
+        self._target = None
+
+    def build(self, screen, ball_radius=10, item_radius=15, paddle_width=10, paddle_heights=(80, 120)):
+        """既知の見た目のスプライトをまとめて作る
+
+        Args:
+            screen: 描画先の表示サーフェス
+            ball_radius: ボールの半径
+            item_radius: アイテムの半径
+            paddle_width: パドルの幅
+            paddle_heights: 事前に作るパドルの高さ
+        """
+        self.sprites.clear()
+        self._target = screen
+        self._size = screen.get_size()
+        self.builds += 1
+        for owner in Ball.COLORS:
+            self.ball(owner, ball_radius)
+        for item_type in HelperItem.colors:
+            self.item(item_type, item_radius)
+        for height in paddle_heights:
+            for color in (PADDLE_COLOR, PADDLE_EFFECT_COLOR):
+                self.paddle(paddle_width, height, color)
+
+    def ball(self, owner, radius):
+        """所有者の色のボール
+
+        Args:
+            owner: 'neutral', 'left', 'right'
+            radius: 半径
+
+        Returns:
+            pygame.Surface: 一辺 2 * radius のスプライト
+        """
+        key = ('ball', owner, radius)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self._circle(Ball.COLORS.get(owner, (255, 255, 255)), radius)
+            sprite = self.sprites[key] = self._colorkeyed(sprite)
+        return sprite
+
+    def item(self, item_type, radius):
+        """種類のマークつきのアイテム
+
+        Args:
+            item_type: アイテムの種類
+            radius: 半径
+
+        Returns:
+            pygame.Surface: 一辺 2 * radius のスプライト
+        """
+        key = ('item', item_type, radius)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self._circle(HelperItem.colors.get(item_type, (255, 255, 255)), radius)
+            mark = self.text_cache.render(ITEM_MARKS.get(item_type, '?'), 24, (0, 0, 0))
+            sprite.blit(mark, mark.get_rect(center=(radius, radius)))
+            sprite = self.sprites[key] = self._colorkeyed(sprite)
+        return sprite
+
+    def paddle(self, width, height, color):
+        """単色のパドル
+
+        Args:
+            width: 幅
+            height: 高さ
+            color: 色 (R, G, B)
+
+        Returns:
+            pygame.Surface: パドルのスプライト
+        """
+        key = ('paddle', width, height, color)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width, height))
+            sprite.fill(color)
+            sprite = self.sprites[key] = sprite.convert()
+        return sprite
+
+    def _circle(self, color, radius):
+        """カラーキーの背景に円を描いたサーフェス"""
+        surface = pygame.Surface((2 * radius, 2 * radius))
+        surface.fill(self.COLORKEY)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        return surface
+
+    def _colorkeyed(self, surface):
+        """表示形式に変換してカラーキーを設定する"""
+        surface = surface.convert()
+        surface.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+        return surface
@@ -0,0 +1,252 @@
+"""Pong のリプレイ記録と再生
+
+乱数シードとゲーム設定をヘッダーに書き、以降は毎ティックの入力を
+ランレングス符号化して追記する。シミュレーションは決定的なので、
+入力列さえあれば試合をそのまま再現できる。
+
+ファイル形式:
+    ヘッダー: マジック b'PREP', バージョン, フラグ, 幅, 高さ, ティックレート, シード
+    フラグは bit0 が CPUモード、bit1 がスイープ衝突判定
+    CPU の設定: 予測の有無, 予測誤差, 反応遅延の最小・最大,
+    速度, 速度のばらつき, ミスの確率, 動かない幅, 操作するパドル（0: 右, 1: 左）
+    本体: (入力コード 1バイト, 連続ティック数 LEB128 可変長整数) の繰り返し
+    入力コードは (左入力 + 1) * 3 + (右入力 + 1)
+"""
+import struct
+
+from pong_ai import CpuController
+from pong_core import PongSimulation, INPUT_NONE
+
+
+_MAGIC = b'PREP'
+_VERSION = 2
+_HEADER = struct.Struct('<4sBBHHHQ')
+_CONTROLLER = struct.Struct('<?dIIddddB')
+_SIDES = ('right', 'left')
+_FLAG_CPU_MODE = 0x01
+_FLAG_SWEPT_COLLISIONS = 0x02
+
+
+def _sign(value):
+    """入力を -1, 0, 1 に正規化"""
+    return (value > 0) - (value < 0)
+
+
+def _encode_varint(value):
+    """非負整数を LEB128 可変長整数にエンコード"""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _pack_controller(controller):
+    """CPU コントローラーの設定をバイト列にする"""
+    low, high = controller.reaction_delay
+    return _CONTROLLER.pack(controller.anticipate, controller.prediction_error, low, high,
+                            controller.speed, controller.speed_jitter, controller.miss_chance,
+                            controller.move_threshold, _SIDES.index(controller.side))
+
+
+def _unpack_controller(data, pos):
+    """バイト列から CPU コントローラーの設定を読む
+
+    Returns:
+        dict: CpuController の引数
+    """
+    (anticipate, prediction_error, low, high, speed, speed_jitter, miss_chance,
+     move_threshold, side) = _CONTROLLER.unpack_from(data, pos)
+    if side >= len(_SIDES):
+        raise ValueError("リプレイファイルの CPU の設定が正しくありません")
+    return {'anticipate': anticipate, 'prediction_error': prediction_error, 'reaction_delay': (low, high),
+            'speed': speed, 'speed_jitter': speed_jitter, 'miss_chance': miss_chance,
+            'move_threshold': move_threshold, 'side': _SIDES[side]}
+
+
+def _decode_varint(data, pos):
+    """LEB128 可変長整数をデコード
+
+    Returns:
+        tuple: (値, 次の読み取り位置)
+    """
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("リプレイデータが途中で切れています")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    """毎ティックの入力をリプレイファイルに追記するレコーダー"""
+
+    def __init__(self, path, sim):
+        """レコーダーの初期化（ヘッダーをすぐに書き込む）
+
+        Args:
+            path: 出力ファイルのパス
+            sim: 記録する PongSimulation（シードと設定、CPU の設定をヘッダーに書く）
+        """
+        if not 0 <= sim.seed < 2 ** 64:
+            raise ValueError("リプレイに記録できるシードは64ビット以下の非負整数です")
+        self.cpu_mode = sim.cpu_mode
+        flags = (_FLAG_CPU_MODE if sim.cpu_mode else 0) | (_FLAG_SWEPT_COLLISIONS if sim.swept_collisions else 0)
+        self.file = open(path, 'wb')
+        self.file.write(_HEADER.pack(_MAGIC, _VERSION, flags,
+                                     sim.width, sim.height, sim.tick_rate, sim.seed))
+        self.file.write(_pack_controller(sim.cpu_controller))
+        self.ticks = 0
+        self._code = None
+        self._run = 0
+
+    def record(self, left_input, right_input):
+        """1ティック分の入力を記録
+
+        Args:
+            left_input: 左パドルの入力
+            right_input: 右パドルの入力（CPUモードでは無視して記録する）
+        """
+        if self.cpu_mode:
+            right_input = INPUT_NONE
+        code = (_sign(left_input) + 1) * 3 + (_sign(right_input) + 1)
+        if code == self._code:
+            self._run += 1
+        else:
+            self._write_run()
+            self._code = code
+            self._run = 1
+        self.ticks += 1
+
+    def _write_run(self):
+        """確定した連続入力をファイルに追記"""
+        if self._run:
+            self.file.write(bytes((self._code,)) + _encode_varint(self._run))
+
+    def close(self):
+        """残りの入力を書き出してファイルを閉じる"""
+        if self.file.closed:
+            return
+        self._write_run()
+        self._run = 0
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_replay(path):
+    """リプレイファイルを読み込む
+
+    Args:
+        path: リプレイファイルのパス
+
+    Returns:
+        tuple: (設定の dict, 毎ティックの入力コードの bytearray)。
+        設定の 'cpu_controller' は CpuController の引数の dict
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise ValueError("リプレイファイルのヘッダーが不完全です")
+    magic, version, flags, width, height, tick_rate, seed = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("リプレイファイルの形式が正しくありません")
+    pos = _HEADER.size
+    if len(data) < pos + _CONTROLLER.size:
+        raise ValueError("リプレイファイルのヘッダーが不完全です")
+    controller = _unpack_controller(data, pos)
+    pos += _CONTROLLER.size
+    config = {'cpu_mode': bool(flags & _FLAG_CPU_MODE), 'width': width, 'height': height,
+              'tick_rate': tick_rate, 'seed': seed,
+              'swept_collisions': bool(flags & _FLAG_SWEPT_COLLISIONS),
+              'cpu_controller': controller}
+
+    codes = bytearray()
+    while pos < len(data):
+        code = data[pos]
+        if code > 8:
+            raise ValueError("リプレイファイルに不正な入力コードがあります")
+        run, pos = _decode_varint(data, pos + 1)
+        codes.extend(bytes((code,)) * run)
+    return config, codes
+
+
+class ReplayPlayer:
+    """リプレイファイルから試合を再現するプレイヤー
+
+    再生は実時間に縛られず、snapshot_interval ティックごとに状態を
+    保存しておくことで任意のティックへ素早く移動（シーク）できる。
+    スナップショットは PongSimulation.snapshot() の平坦なタプル。
+    """
+
+    def __init__(self, path, snapshot_interval=600):
+        """プレイヤーの初期化
+
+        Args:
+            path: リプレイファイルのパス
+            snapshot_interval: 状態スナップショットを取る間隔（ティック数）
+        """
+        self.config, self._codes = read_replay(path)
+        self.snapshot_interval = snapshot_interval
+        controller = CpuController(**self.config['cpu_controller'])
+        self.sim = PongSimulation(**{**self.config, 'cpu_controller': controller})
+        self.snapshots = {0: self.sim.snapshot()}
+
+    @property
+    def total_ticks(self):
+        """記録されている総ティック数"""
+        return len(self._codes)
+
+    @property
+    def tick(self):
+        """現在のティック"""
+        return self.sim.tick
+
+    def step(self, n=None):
+        """待ち時間なしで n ティック進める（省略時は最後まで）
+
+        Args:
+            n: 進めるティック数
+
+        Returns:
+            int: 実際に進めたティック数
+        """
+        sim = self.sim
+        end = self.total_ticks if n is None else min(sim.tick + n, self.total_ticks)
+        start = sim.tick
+        codes = self._codes
+        interval = self.snapshot_interval
+        while sim.tick < end:
+            code = codes[sim.tick]
+            sim.update(code // 3 - 1, code % 3 - 1)
+            if sim.tick % interval == 0 and sim.tick not in self.snapshots:
+                self.snapshots[sim.tick] = sim.snapshot()
+        return sim.tick - start
+
+    def seek(self, tick):
+        """指定ティックの状態へ移動
+
+        手前の一番近いスナップショットから再シミュレーションする。
+
+        Args:
+            tick: 移動先のティック（0 以上 total_ticks 以下）
+        """
+        if not 0 <= tick <= self.total_ticks:
+            raise ValueError("シーク先が記録の範囲外です")
+        base = max(t for t in self.snapshots if t <= tick)
+        if tick < self.sim.tick or base > self.sim.tick:
+            self.sim.restore(self.snapshots[base])
+        self.step(tick - self.sim.tick)
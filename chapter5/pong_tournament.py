@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Pong のトーナメント（パラメータ探索）の実行スクリプト
+
+CPU コントローラーとアイテムの設定をグリッドで指定し、画面なしの試合を
+プロセスプールで並列に実行して、結果を CSV に1試合1行で書き出す。
+
+使用例:
+    python pong_tournament.py --grid cpu_speed=3,4,5 --grid reaction_delay=5-15,2-6 \\
+        --matches 100 --workers 8 --output results.csv
+"""
+import argparse
+import csv
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from pong_ai import CpuController
+from pong_core import PongSimulation
+
+
+def _parse_range(text):
+    """'5-15' 形式の範囲を (5, 15) に変換"""
+    low, sep, high = text.partition('-')
+    if not sep:
+        raise ValueError(f"範囲は 'low-high' の形式で指定してください: {text}")
+    return int(low), int(high)
+
+
+def _format_value(value):
+    """CSV に書き出すためにパラメータの値を文字列にする"""
+    if isinstance(value, tuple):
+        return '-'.join(str(v) for v in value)
+    return str(value)
+
+
+# グリッドで指定できるパラメータ: 名前 -> (設定先, 属性名, 変換関数)
+PARAMETERS = {
+    'cpu_speed': ('cpu', 'speed', float),
+    'reaction_delay': ('cpu', 'reaction_delay', _parse_range),
+    'move_threshold': ('cpu', 'move_threshold', float),
+    'prediction_error': ('cpu', 'prediction_error', float),
+    'item_spawn_interval': ('sim', 'item_spawn_interval', int),
+    'slow_multiplier': ('sim', 'slow_ball_multiplier', float),
+    'big_paddle_factor': ('sim', 'big_paddle_factor', float),
+}
+
+RESULT_FIELDS = ['left_score', 'right_score', 'ticks', 'rallies', 'rally_mean', 'rally_max',
+                 'items_left', 'items_right']
+
+
+def parse_grid(specs):
+    """'name=v1,v2,...' 形式の指定をパラメータグリッドに変換
+
+    Args:
+        specs: 指定文字列のリスト
+
+    Returns:
+        dict: パラメータ名 -> 値のリスト
+
+    Raises:
+        ValueError: 未知のパラメータや不正な形式の場合
+    """
+    grid = {}
+    for spec in specs:
+        name, sep, values = spec.partition('=')
+        name = name.strip()
+        if not sep or not values:
+            raise ValueError(f"グリッドは 'name=v1,v2' の形式で指定してください: {spec}")
+        if name not in PARAMETERS:
+            raise ValueError(f"未知のパラメータです: {name}")
+        convert = PARAMETERS[name][2]
+        grid[name] = [convert(v.strip()) for v in values.split(',')]
+    return grid
+
+
+def expand_grid(grid):
+    """パラメータグリッドの全組み合わせを列挙
+
+    Args:
+        grid: パラメータ名 -> 値のリスト
+
+    Returns:
+        list: パラメータの dict のリスト（グリッドが空なら既定設定1つ）
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def match_seed(base_seed, config_index, match_index):
+    """試合ごとの乱数シードを求める
+
+    ワーカー数や実行順によらず、同じ指定なら同じ試合が再現される。
+    """
+    return random.Random(f"{base_seed}:{config_index}:{match_index}").getrandbits(64)
+
+
+def play_match(params, seed, target_score=11, max_ticks=36000, difficulty='classic', opponent='classic'):
+    """画面なしで1試合を行う
+
+    右パドルは params を適用した CPU、左パドルは opponent の CPU が操作する。
+
+    Args:
+        params: パラメータ名 -> 値（PARAMETERS のキー）
+        seed: 試合の乱数シード
+        target_score: どちらかがこの点数に達したら終了
+        max_ticks: 試合の最大ティック数
+        difficulty: 右 CPU の基本となる難易度
+        opponent: 左 CPU の難易度
+
+    Returns:
+        dict: 試合結果（RESULT_FIELDS）
+    """
+    cpu_overrides = {}
+    sim_overrides = {}
+    for name, value in params.items():
+        target, attribute, _ = PARAMETERS[name]
+        (cpu_overrides if target == 'cpu' else sim_overrides)[attribute] = value
+
+    controller = CpuController.from_difficulty(difficulty, **cpu_overrides)
+    left_controller = CpuController.from_difficulty(opponent, side='left')
+    sim = PongSimulation(cpu_mode=True, seed=seed, cpu_controller=controller)
+    for attribute, value in sim_overrides.items():
+        setattr(sim, attribute, value)
+
+    # ラリーの長さ（1点が入るまでのパドルヒット数）を記録
+    rallies = []
+    hits_before = 0
+    points = 0
+    while sim.left_score < target_score and sim.right_score < target_score and sim.tick < max_ticks:
+        left_controller.update(sim)
+        sim.update()
+        if sim.left_score + sim.right_score != points:
+            points = sim.left_score + sim.right_score
+            rallies.append(sim.paddle_hits - hits_before)
+            hits_before = sim.paddle_hits
+
+    return {
+        'left_score': sim.left_score,
+        'right_score': sim.right_score,
+        'ticks': sim.tick,
+        'rallies': len(rallies),
+        'rally_mean': round(sum(rallies) / len(rallies), 3) if rallies else 0.0,
+        'rally_max': max(rallies, default=0),
+        'items_left': sim.items_collected['left'],
+        'items_right': sim.items_collected['right'],
+    }
+
+
+def _run_task(task):
+    """ワーカープロセスで1試合を実行（プールから呼ばれる）"""
+    config_index, match_index, params, seed, options = task
+    result = play_match(params, seed, **options)
+    return config_index, match_index, seed, params, result
+
+
+def run_tournament(grid, output, matches=10, workers=None, seed=0, **options):
+    """パラメータグリッドの全組み合わせで試合を行い、結果を CSV に書き出す
+
+    結果は終わった試合から順に1行ずつ書き出すため、途中で止めても
+    それまでの結果は残る。
+
+    Args:
+        grid: パラメータ名 -> 値のリスト
+        output: 出力する CSV ファイルのパス
+        matches: 組み合わせごとの試合数
+        workers: ワーカープロセス数（省略時は CPU コア数、1 ならプールを使わない）
+        seed: 試合シードの元になる値
+        **options: play_match に渡す追加の引数
+
+    Returns:
+        int: 書き出した試合数
+    """
+    configs = expand_grid(grid)
+    tasks = [(ci, mi, params, match_seed(seed, ci, mi), options)
+             for ci, params in enumerate(configs)
+             for mi in range(matches)]
+    workers = workers or os.cpu_count() or 1
+    names = list(grid)
+
+    with open(output, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['config', 'match', 'seed'] + names + RESULT_FIELDS)
+        if workers == 1:
+            results = map(_run_task, tasks)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            # プロセス間のやりとりを減らすためにまとめて渡す
+            chunksize = max(1, len(tasks) // (workers * 4))
+            results = pool.map(_run_task, tasks, chunksize=chunksize)
+        try:
+            for config_index, match_index, match_seed_value, params, result in results:
+                writer.writerow([config_index, match_index, match_seed_value]
+                                + [_format_value(params[n]) for n in names]
+                                + [result[field] for field in RESULT_FIELDS])
+                f.flush()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+    return len(tasks)
+
+
+def main(argv=None):
+    """コマンドライン引数を読んでトーナメントを実行"""
+    parser = argparse.ArgumentParser(description="Pong の CPU・アイテム設定をまとめて対戦させて評価する")
+    parser.add_argument('--grid', action='append', default=[], metavar='NAME=V1,V2',
+                        help=f"探索するパラメータ（{', '.join(PARAMETERS)}）。複数指定可")
+    parser.add_argument('--matches', type=int, default=10, help="組み合わせごとの試合数")
+    parser.add_argument('--workers', type=int, default=None, help="ワーカープロセス数（既定は CPU コア数）")
+    parser.add_argument('--seed', type=int, default=0, help="試合シードの元になる値")
+    parser.add_argument('--output', default='tournament.csv', help="結果を書き出す CSV ファイル")
+    parser.add_argument('--target-score', type=int, default=11, help="試合終了の点数")
+    parser.add_argument('--max-ticks', type=int, default=36000, help="1試合の最大ティック数")
+    parser.add_argument('--difficulty', default='classic', choices=CpuController.DIFFICULTIES,
+                        help="評価する右 CPU の基本難易度")
+    parser.add_argument('--opponent', default='classic', choices=CpuController.DIFFICULTIES,
+                        help="対戦相手（左 CPU）の難易度")
+    args = parser.parse_args(argv)
+
+    try:
+        grid = parse_grid(args.grid)
+    except ValueError as e:
+        parser.error(str(e))
+
+    total = run_tournament(grid, args.output, matches=args.matches, workers=args.workers,
+                           seed=args.seed, target_score=args.target_score, max_ticks=args.max_ticks,
+                           difficulty=args.difficulty, opponent=args.opponent)
+    print(f"{total} 試合の結果を {args.output} に書き出しました")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,119 @@
 #!/usr/bin/env python3
-"""FizzBuzz の実行スクリプト"""
+"""FizzBuzz の実行スクリプト
 
-from fizzbuzz import fizzbuzz
+結果は "{i:3d}: {result}" の形式の行で出力する。行はブロックごとに
+まとめて文字列にしてからバイト列に変換し、1ブロックにつき1回の write で
+書き出すため、大きな範囲でもファイルやパイプの速度で出力でき、使う
+メモリは1ブロック分に収まる。
+"""
+import argparse
+import os
+import sys
 
+from fizzbuzz import BLOCK_SIZE, CYCLE, _validate_input
 
-def main():
-    """FizzBuzz を1から100まで実行して結果を表示"""
-    print("FizzBuzz (1-100):")
-    print("-" * 20)
-    
-    for i in range(1, 101):
-        result = fizzbuzz(i)
-        print(f"{i:3d}: {result}")
+
+def format_lines(start, stop):
+    """start 以上 stop 未満の結果を出力形式の行にしたバイト列
+
+    Args:
+        start: 範囲の先頭（0以上の整数）
+        stop: 範囲の終わり（0以上の整数、この値は含まない）
+
+    Returns:
+        bytes: 1行1件の ASCII のバイト列
+
+    Raises:
+        TypeError: 範囲が整数でない場合
+        ValueError: 範囲が負の数の場合
+    """
+    _validate_input(start)
+    _validate_input(stop)
+    numbers = list(map(str, range(start, stop)))
+    size = len(numbers)
+    # 結果は数字の列に周期 15 の語を上書きして作る（数字の文字列は使い回す）
+    results = numbers.copy()
+    for r, word in enumerate(CYCLE):
+        if word:
+            first = (r - start) % 15
+            results[first::15] = [word] * len(range(first, size, 15))
+    # "{i:3d}" の桁埋めが効くのは99以下だけ
+    for k in range(min(100, stop) - start):
+        numbers[k] = numbers[k].rjust(3)
+
+    parts = [": "] * (4 * size)
+    parts[0::4] = numbers
+    parts[2::4] = results
+    parts[3::4] = ["\n"] * size
+    return "".join(parts).encode('ascii')
+
+
+def iter_chunks(start, stop, chunk_size=BLOCK_SIZE):
+    """出力をブロックごとのバイト列として順に返す
+
+    Args:
+        start: 範囲の先頭
+        stop: 範囲の終わり（この値は含まない）
+        chunk_size: 1ブロックの件数
+
+    Yields:
+        bytes: ブロックの出力
+
+    Raises:
+        TypeError: 範囲が整数でない場合
+        ValueError: 範囲が負の数の場合
+    """
+    _validate_input(start)
+    _validate_input(stop)
+    for chunk_start in range(start, stop, chunk_size):
+        yield format_lines(chunk_start, min(chunk_start + chunk_size, stop))
+
+
+def write_fizzbuzz(stream, start, stop, chunk_size=BLOCK_SIZE):
+    """結果をバイナリのストリームに書き出す
+
+    Args:
+        stream: 書き込み先（バイト列を受け付けるファイルオブジェクト）
+        start: 範囲の先頭
+        stop: 範囲の終わり（この値は含まない）
+        chunk_size: 1回の write で書く件数
+    """
+    stream.writelines(iter_chunks(start, stop, chunk_size))
+
+
+def main(argv=None):
+    """FizzBuzz を実行して結果を出力（既定は1から100までを標準出力へ）"""
+    parser = argparse.ArgumentParser(description="FizzBuzz の結果を出力する")
+    parser.add_argument('--start', type=int, default=1, help="範囲の先頭")
+    parser.add_argument('--stop', type=int, default=101, help="範囲の終わり（この値は含まない）")
+    parser.add_argument('--output', '-o', help="出力ファイル（省略時は標準出力）")
+    parser.add_argument('--no-header', action='store_true', help="標準出力に見出しを出さない")
+    args = parser.parse_args(argv)
+    try:
+        _validate_input(args.start)
+        _validate_input(args.stop)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.output:
+        with open(args.output, 'wb') as f:
+            write_fizzbuzz(f, args.start, args.stop)
+        return
+
+    if not args.no_header:
+        print(f"FizzBuzz ({args.start}-{args.stop - 1}):")
+        print("-" * 20)
+    sys.stdout.flush()
+    try:
+        write_fizzbuzz(sys.stdout.buffer, args.start, args.stop)
+        sys.stdout.buffer.flush()
+    except BrokenPipeError:
+        # head などで読み手が先に終わった場合。終了時のフラッシュで再び失敗しないよう
+        # 標準出力を /dev/null に付け替える
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
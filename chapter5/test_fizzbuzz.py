@@ -1,5 +1,5 @@
 import pytest
-from fizzbuzz import fizzbuzz
+from fizzbuzz import BLOCK_SIZE, FIZZBUZZ, FizzBuzzRules, fizzbuzz, fizzbuzz_range, iter_fizzbuzz_range
 
 
 class TestFizzBuzz:
@@ -52,4 +52,101 @@ class TestFizzBuzz:
     def test_fizzbuzz_raises_error_for_non_integer(self):
         """整数以外を渡すと TypeError を発生させる"""
         with pytest.raises(TypeError, match="引数は整数である必要があります"):
-            fizzbuzz(3.14)
\ No newline at end of file
+            fizzbuzz(3.14)
+
+
+class TestFizzBuzzRange:
+    """範囲版 FizzBuzz のテストクラス"""
+    
+    def test_matches_fizzbuzz_from_0(self):
+        """0 から 100 まで fizzbuzz と同じ結果になる"""
+        assert fizzbuzz_range(0, 100) == [fizzbuzz(i) for i in range(100)]
+    
+    def test_matches_fizzbuzz_for_unaligned_range(self):
+        """15 の倍数から始まらない範囲でも fizzbuzz と同じ結果になる"""
+        assert fizzbuzz_range(7, 53) == [fizzbuzz(i) for i in range(7, 53)]
+    
+    def test_generator_spans_blocks(self):
+        """ジェネレータ版はブロックの境目をまたいでも同じ結果になる"""
+        start = BLOCK_SIZE - 20
+        stop = 2 * BLOCK_SIZE + 7
+        assert list(iter_fizzbuzz_range(start, stop)) == [fizzbuzz(i) for i in range(start, stop)]
+    
+    def test_empty_range(self):
+        """stop が start 以下なら空になる"""
+        assert fizzbuzz_range(5, 5) == []
+        assert list(iter_fizzbuzz_range(9, 3)) == []
+    
+    def test_raises_error_for_negative_number(self):
+        """負の数を渡すと ValueError を発生させる"""
+        with pytest.raises(ValueError, match="引数は0以上の整数である必要があります"):
+            fizzbuzz_range(-1, 10)
+    
+    def test_generator_validates_before_iteration(self):
+        """ジェネレータ版も呼び出した時点で TypeError を発生させる"""
+        with pytest.raises(TypeError, match="引数は整数である必要があります"):
+            iter_fizzbuzz_range(0, 10.0)
+
+
+class TestFizzBuzzRules:
+    """規則エンジンのテストクラス"""
+    
+    def test_preset_matches_fizzbuzz(self):
+        """FIZZBUZZ プリセットは fizzbuzz と同じ結果になる"""
+        assert FIZZBUZZ.period == 15
+        assert [FIZZBUZZ(i) for i in range(100)] == [fizzbuzz(i) for i in range(100)]
+    
+    def test_three_rules_use_lcm_wheel(self):
+        """3/5/7 の規則は周期 105 の表になり、語は規則の順につながる"""
+        rules = FizzBuzzRules([(3, "Fizz"), (5, "Buzz"), (7, "Bazz")])
+        assert rules.period == 105
+        assert len(rules.wheel) == 105
+        assert rules(21) == "FizzBazz"
+        assert rules(105) == "FizzBuzzBazz"
+        assert rules(0) == "FizzBuzzBazz"
+        assert rules(22) == "22"
+    
+    def test_range_matches_single_calls(self):
+        """範囲版は1件ずつ呼んだ場合と同じ結果になる"""
+        rules = FizzBuzzRules([(2, "Two"), (9, "Nine")])
+        assert rules.range(50, 400) == [rules(n) for n in range(50, 400)]
+        assert list(rules.iter_range(50, 400)) == rules.range(50, 400)
+    
+    def test_large_period_falls_back_to_cache(self):
+        """周期が上限を超えると表を作らずキャッシュで求める"""
+        rules = FizzBuzzRules([(7, "Seven"), (11, "Eleven"), (13, "Thirteen")], max_wheel_size=100,
+                              cache_size=16)
+        assert rules.wheel is None
+        assert rules(1001) == "SevenElevenThirteen"
+        assert rules._word.cache_info().currsize <= 16
+    
+    def test_large_period_range_steps_divisors(self):
+        """周期表がない場合の範囲版は規則ごとに倍数を埋め、キャッシュを使わない"""
+        rules = FizzBuzzRules([(7, "Seven"), (11, "Eleven"), (13, "Thirteen")], max_wheel_size=100)
+        expected = [rules._compute_word(n % rules.period) or str(n) for n in range(995, 3100)]
+        assert rules.range(995, 3100) == expected
+        assert list(rules.iter_range(995, 3100)) == expected
+        assert rules._word.cache_info().currsize == 0
+    
+    def test_wheel_range_wraps_period(self):
+        """周期をまたぐ範囲や語だけの周期表でも1件ずつ呼んだ場合と同じ結果になる"""
+        rules = FizzBuzzRules([(1, "One"), (4, "Four")])
+        assert rules.range(3, 30) == [rules(n) for n in range(3, 30)]
+        rules = FizzBuzzRules([(6, "Six"), (10, "Ten")])
+        assert rules.range(25, 27) == [rules(n) for n in range(25, 27)]
+        assert rules.range(29, 500) == [rules(n) for n in range(29, 500)]
+    
+    def test_invalid_rules(self):
+        """割る数が1未満なら ValueError、型が違えば TypeError を発生させる"""
+        with pytest.raises(ValueError):
+            FizzBuzzRules([(0, "Zero")])
+        with pytest.raises(TypeError):
+            FizzBuzzRules([("3", "Fizz")])
+    
+    def test_validates_numbers_like_fizzbuzz(self):
+        """引数の検証は fizzbuzz と同じ"""
+        rules = FizzBuzzRules([(3, "Fizz")])
+        with pytest.raises(ValueError, match="引数は0以上の整数である必要があります"):
+            rules(-3)
+        with pytest.raises(TypeError, match="引数は整数である必要があります"):
+            rules.range(0, 1.5)
\ No newline at end of file
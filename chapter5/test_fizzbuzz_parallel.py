@@ -0,0 +1,41 @@
+import pytest
+
+from fizzbuzz_parallel import generate_file, output_size
+from run_fizzbuzz import format_lines
+
+
+class TestOutputSize:
+    """出力バイト数の計算のテストクラス"""
+    
+    @pytest.mark.parametrize("start, stop", [(0, 1), (0, 100), (1, 101), (95, 105), (7, 12345), (99990, 100010)])
+    def test_matches_generated_output(self, start, stop):
+        """閉じた式のバイト数が実際の出力の長さと一致する"""
+        assert output_size(start, stop) == len(format_lines(start, stop))
+    
+    def test_empty_range(self):
+        """空の範囲は 0 バイト"""
+        assert output_size(10, 10) == 0
+        assert output_size(10, 3) == 0
+    
+    def test_raises_error_for_negative_number(self):
+        """負の数を渡すと ValueError を発生させる"""
+        with pytest.raises(ValueError, match="引数は0以上の整数である必要があります"):
+            output_size(-1, 10)
+
+
+class TestGenerateFile:
+    """並列ファイル生成のテストクラス"""
+    
+    def test_parallel_output_matches_serial(self, tmp_path):
+        """複数プロセスで作ったファイルが逐次版の出力と1バイトも違わない"""
+        path = tmp_path / "fizzbuzz.txt"
+        size = generate_file(str(path), 3, 20000, workers=2, task_size=15 * 100)
+        assert path.read_bytes() == format_lines(3, 20000)
+        assert size == path.stat().st_size
+    
+    def test_single_worker_overwrites_existing_file(self, tmp_path):
+        """ワーカー1つでも作れ、既存の長いファイルは切り詰める"""
+        path = tmp_path / "fizzbuzz.txt"
+        path.write_bytes(b"x" * 100000)
+        generate_file(str(path), 0, 500, workers=1, task_size=45)
+        assert path.read_bytes() == format_lines(0, 500)
@@ -0,0 +1,54 @@
+import pytest
+
+from fizzbuzz import fizzbuzz
+from fizzbuzz_query import CATEGORIES, category, count, counts, nth
+
+
+def _category_by_string(n):
+    """fizzbuzz の文字列から求めた分類"""
+    result = fizzbuzz(n)
+    return result if result in ('Fizz', 'Buzz', 'FizzBuzz') else 'number'
+
+
+class TestFizzBuzzQuery:
+    """FizzBuzz の問い合わせのテストクラス"""
+    
+    def test_category_matches_fizzbuzz(self):
+        """分類は fizzbuzz の結果と一致する（0 は FizzBuzz）"""
+        assert category(0) == 'FizzBuzz'
+        assert [category(n) for n in range(100)] == [_category_by_string(n) for n in range(100)]
+    
+    @pytest.mark.parametrize("start, stop", [(0, 1), (0, 100), (1, 101), (7, 8), (14, 46), (50, 20)])
+    def test_counts_match_brute_force(self, start, stop):
+        """範囲の件数は1件ずつ数えた場合と一致する"""
+        expected = {name: 0 for name in CATEGORIES}
+        for n in range(start, stop):
+            expected[_category_by_string(n)] += 1
+        assert counts(start, stop) == expected
+    
+    def test_count_large_range(self):
+        """大きな範囲でもすぐに答えられる"""
+        assert count('FizzBuzz', 0, 15 * 10 ** 12) == 10 ** 12
+        assert sum(counts(1, 10 ** 15).values()) == 10 ** 15 - 1
+    
+    @pytest.mark.parametrize("name", CATEGORIES)
+    def test_nth_matches_brute_force(self, name):
+        """k 番目の数は先頭から順に探した場合と一致する"""
+        for start in (0, 1, 8):
+            found = [n for n in range(start, 600) if _category_by_string(n) == name]
+            assert [nth(name, k, start) for k in range(1, 31)] == found[:30]
+    
+    def test_ten_millionth_fizzbuzz(self):
+        """1 から数えて 1000万番目の FizzBuzz は 1億5000万"""
+        assert nth('FizzBuzz', 10_000_000, start=1) == 150_000_000
+    
+    def test_invalid_arguments(self):
+        """引数の検証は fizzbuzz と同じで、分類名と k も検証する"""
+        with pytest.raises(ValueError, match="引数は0以上の整数である必要があります"):
+            counts(-1, 10)
+        with pytest.raises(TypeError, match="引数は整数である必要があります"):
+            category(1.0)
+        with pytest.raises(ValueError):
+            count('Bazz', 0, 10)
+        with pytest.raises(ValueError):
+            nth('Fizz', 0)
@@ -1,6 +1,10 @@
+import os
+import subprocess
+import sys
+
 import pytest
 import pygame
-from pong import Ball, Paddle, PongGame
+from pong import Ball, Paddle, PongGame, ChaosGame
 
 
 class TestBall:
@@ -58,4 +62,115 @@ class TestPaddle:
         """パドルが下に移動する"""
         paddle = Paddle(50, 250, 10, 80)
         paddle.move_down(5)
-        assert paddle.y == 255
\ No newline at end of file
+        assert paddle.y == 255
+
+class TestPongGameDrawing:
+    """PongGame の描画のテストクラス（ダミーのビデオドライバで実行）"""
+    
+    @pytest.fixture
+    def make_game(self, monkeypatch):
+        monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+        yield lambda **kwargs: PongGame(**kwargs)
+        pygame.quit()
+    
+    def test_dirty_rect_mode_erases_previous_ball(self, make_game):
+        """ダーティ矩形モードでボールの跡が残らない"""
+        game = make_game(dirty_rects=True)
+        game.draw()
+        old_position = (int(game.ball.x) - 8, int(game.ball.y))  # 移動後は覆われない位置
+        game.update()
+        game.draw()
+        assert game.screen.get_at(old_position)[:3] == (0, 0, 0)
+        assert game.screen.get_at((int(game.ball.x), int(game.ball.y)))[:3] == game.ball.get_color()
+    
+    def test_dirty_rect_mode_keeps_static_layer(self, make_game):
+        """ダーティ矩形モードでも中央線は描かれている"""
+        game = make_game(dirty_rects=True)
+        game.draw()
+        game.draw()
+        assert game.screen.get_at((game.width // 2, 5))[:3] != (0, 0, 0)
+        assert len(game._previous_rects) >= 5
+    
+    def test_dirty_rect_mode_matches_full_redraw(self, make_game):
+        """ダーティ矩形モードでも全画面描画と同じ位置にパドルが描かれる"""
+        game = make_game(dirty_rects=True)
+        for _ in range(30):
+            game.update()
+            game.draw()
+        paddle = game.left_paddle
+        assert game.screen.get_at((paddle.x + 1, int(paddle.y) + 1))[:3] == (255, 255, 255)
+        assert game.screen.get_at((paddle.x + 1, int(paddle.y) + paddle.height + 5))[:3] == (0, 0, 0)
+    
+    def test_draw_interpolates_between_ticks(self, make_game):
+        """補間係数に応じて前ティックと現ティックの間にボールを描く"""
+        game = make_game(cpu_mode=False)
+        game.update()
+        previous_x = game._previous_positions[0]
+        ball_x, _, _, _ = game._interpolated_positions(0.5)
+        assert ball_x == (previous_x + game.ball.x) / 2
+        assert game._interpolated_positions(1.0)[0] == game.ball.x
+    
+    def test_profiler_overlay_measures_sections(self, make_game):
+        """オーバーレイを表示すると計測が始まり、閉じると計測用の包みが外れる"""
+        game = make_game()
+        game.toggle_profiler_overlay()
+        for _ in range(3):
+            game.profiler.begin_frame()
+            game.update()
+            game.profiler.mark('update')
+            game.draw()
+            game.profiler.mark('draw')
+            game.profiler.end_frame()
+        assert game.profiler.count == 3
+        assert sum(game.profiler.frame_times('cpu')) > 0
+        assert game._profiler_lines[0].startswith("FPS")
+        game.toggle_profiler_overlay()
+        assert not game.profiler.enabled
+        assert '_update_cpu' not in vars(game)
+    
+    def test_sprites_are_rebuilt_only_on_resize(self, make_game):
+        """スプライトは最初の描画で作り、ウィンドウのリサイズでだけ作り直す"""
+        game = make_game()
+        for _ in range(3):
+            game.update()
+            game.draw()
+        assert game.sprites.builds == 1
+        pygame.event.post(pygame.event.Event(pygame.VIDEORESIZE, size=(800, 600), w=800, h=600))
+        game.handle_events()
+        game.draw()
+        assert game.sprites.builds == 2
+    
+    def test_chaos_game_draws_every_ball(self, monkeypatch):
+        """カオスモードではすべてのボールを描く"""
+        monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+        game = ChaosGame(n_balls=50, seed=3)
+        try:
+            game.update()
+            rects = game._draw_dynamic(1.0)
+            ball = game.balls[-1]
+            assert len(rects) >= 50 + 2
+            assert game.screen.get_at((int(ball.x), int(ball.y)))[:3] == ball.get_color()
+        finally:
+            pygame.quit()
+
+
+class TestStartup:
+    """起動処理のテストクラス"""
+    
+    def test_import_does_not_load_pygame(self):
+        """pong と pong_2p は pygame を読み込まずに import できる"""
+        code = "import sys, pong, pong_2p; print('pygame' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert result.stdout.strip() == 'False'
+    
+    def test_game_initializes_only_display_and_font(self, monkeypatch):
+        """PongGame は表示とフォントだけを初期化し、音声は初期化しない"""
+        monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+        PongGame()
+        try:
+            assert pygame.display.get_init()
+            assert pygame.font.get_init()
+            assert pygame.mixer.get_init() is None
+        finally:
+            pygame.quit()
@@ -0,0 +1,137 @@
+import random
+
+import pytest
+
+from pong_ai import CpuController, fold_y, predict_ball
+from pong_core import PongSimulation
+
+
+class TestFoldY:
+    """壁反射の折り返しのテストクラス"""
+
+    def test_inside_range_is_unchanged(self):
+        """区間内の値はそのまま"""
+        assert fold_y(300, 10, 590) == 300
+
+    def test_reflects_off_bottom(self):
+        """下の壁を越えた分だけ跳ね返る"""
+        assert fold_y(600, 10, 590) == 580
+
+    def test_reflects_off_top(self):
+        """上の壁を越えた分だけ跳ね返る"""
+        assert fold_y(-20, 10, 590) == 40
+
+    def test_multiple_reflections(self):
+        """何度も往復しても区間内に収まる"""
+        assert fold_y(10 + 580 * 3 + 100, 10, 590) == 490
+
+
+class TestPredictBall:
+    """ボール到達予測のテストクラス"""
+
+    def _simulate_until(self, sim, target_x):
+        """パドルに当たらない状態でボールが target_x に着くまで進める"""
+        sim.left_paddle.y = sim.right_paddle.y = -1000
+        ticks = 0
+        while sim.ball.x < target_x:
+            sim.update()
+            ticks += 1
+        return sim.ball.y, ticks
+
+    def test_matches_simulation_without_bounce(self):
+        """壁に当たらなければシミュレーションと一致する"""
+        sim = PongSimulation(cpu_mode=False)
+        target_x = sim.right_paddle.x - sim.ball.radius
+        predicted_y, predicted_ticks = predict_ball(sim, target_x)
+        actual_y, actual_ticks = self._simulate_until(sim, target_x)
+        assert predicted_y == actual_y
+        assert predicted_ticks == actual_ticks
+
+    def test_accounts_for_wall_bounces(self):
+        """壁で跳ね返る場合も近い位置を予測する"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.ball.velocity_y = 6.0
+        target_x = sim.right_paddle.x - sim.ball.radius
+        predicted_y, _ = predict_ball(sim, target_x)
+        actual_y, _ = self._simulate_until(sim, target_x)
+        assert abs(predicted_y - actual_y) < 10
+
+    @pytest.mark.parametrize('swept', [False, True])
+    def test_matches_simulation_with_bounces(self, swept):
+        """何度壁で跳ね返っても、到達したティックの位置がシミュレーションと一致する
+
+        従来の判定では壁を越えたティックにボールを壁の位置に戻す分も予測に含める。
+        """
+        trials = random.Random(0)
+        for _ in range(200):
+            sim = PongSimulation(cpu_mode=False, seed=1, swept_collisions=swept)
+            sim.item_spawn_interval = 10 ** 9
+            sim.left_paddle.y = sim.right_paddle.y = -1000
+            ball = sim.ball
+            ball.x = 100.0
+            ball.y = trials.uniform(10, 590)
+            ball.velocity_x = trials.uniform(3, 12)
+            ball.velocity_y = trials.choice((-1, 1)) * trials.uniform(2, 15)
+            ticks = int(600 // ball.velocity_x)
+            predicted_y, predicted_ticks = predict_ball(sim, ball.x + ball.velocity_x * ticks)
+            sim.step(ticks)
+            assert predicted_y == pytest.approx(sim.ball.y, abs=1e-6)
+            assert predicted_ticks == pytest.approx(ticks)
+
+    def test_bounces_while_slow_effect_expires(self):
+        """減速効果が切れる前後で壁に当たっても位置と時間が一致する"""
+        sim = PongSimulation(cpu_mode=False, seed=1)
+        sim.item_spawn_interval = 10 ** 9
+        sim.left_paddle.y = sim.right_paddle.y = -1000
+        sim.ball.x, sim.ball.y = 50.0, 300.0
+        sim.ball.velocity_x, sim.ball.velocity_y = 4.0, 9.0
+        sim.effect_duration = 37
+        sim._apply_item_effect('left', 'slow_ball')
+        # 効果が切れるまでの 36 ティックと、元の速度での 40 ティック
+        target_x = sim.ball.x + 36 * sim.ball.velocity_x + 40 * 4.0
+        predicted_y, predicted_ticks = predict_ball(sim, target_x)
+        sim.step(76)
+        assert sim.ball.x == pytest.approx(target_x)
+        assert predicted_y == pytest.approx(sim.ball.y, abs=1e-6)
+        assert predicted_ticks == pytest.approx(76)
+
+    def test_accounts_for_slow_effect_expiry(self):
+        """減速効果の期限を考慮して到達時間を求める"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.update()
+        sim.effect_duration = 20
+        sim._apply_item_effect('left', 'slow_ball')
+        target_x = sim.right_paddle.x - sim.ball.radius
+        _, predicted_ticks = predict_ball(sim, target_x)
+        _, actual_ticks = self._simulate_until(sim, target_x)
+        assert abs(predicted_ticks - actual_ticks) < 1
+
+    def test_returns_none_when_moving_away(self):
+        """遠ざかっている場合は予測しない"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.ball.velocity_x = -5.0
+        assert predict_ball(sim, sim.right_paddle.x) is None
+
+
+class TestCpuController:
+    """CPUコントローラーのテストクラス"""
+
+    def test_unknown_difficulty_raises(self):
+        """未知の難易度は ValueError"""
+        with pytest.raises(ValueError, match="未知の難易度です"):
+            CpuController.from_difficulty('impossible')
+
+    def test_simulation_accepts_difficulty_name(self):
+        """難易度名でシミュレーションを作れる"""
+        sim = PongSimulation(cpu_controller='hard')
+        assert sim.cpu_controller.anticipate
+        assert sim.cpu_controller.reaction_delay == (2, 6)
+
+    def test_harder_cpu_concedes_fewer_points(self):
+        """難しいCPUほど失点が少ない"""
+        conceded = {}
+        for difficulty in ('easy', 'hard'):
+            sim = PongSimulation(seed=3, cpu_controller=difficulty)
+            sim.step(20000)
+            conceded[difficulty] = sim.left_score
+        assert conceded['hard'] < conceded['easy']
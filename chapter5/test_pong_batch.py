@@ -0,0 +1,114 @@
+import random
+
+import numpy as np
+
+from pong_batch import BatchPongEngine, CounterRandom, scalar_rng
+from pong_core import PongSimulation
+
+
+def _scalar_state(sim):
+    """比較用にスカラー版の状態をタプルにまとめる"""
+    return (sim.ball.x, sim.ball.y, sim.ball.velocity_x, sim.ball.velocity_y,
+            sim.left_paddle.y, sim.right_paddle.y,
+            sim.left_paddle.height, sim.right_paddle.height,
+            sim.left_score, sim.right_score, len(sim.helper_items))
+
+
+def _batch_state(engine, i):
+    """比較用にバッチ版の i 番目の試合の状態をタプルにまとめる"""
+    return (engine.ball_x[i], engine.ball_y[i], engine.ball_vx[i], engine.ball_vy[i],
+            engine.paddle_y[0, i], engine.paddle_y[1, i],
+            engine.paddle_height[0, i], engine.paddle_height[1, i],
+            engine.left_score[i], engine.right_score[i], engine.item_active[i].sum())
+
+
+class TestCounterRandom:
+    """カウンタ方式乱数のテストクラス"""
+
+    def test_values_are_in_unit_interval(self):
+        """random() は [0, 1) の値を返す"""
+        rng = CounterRandom(5)
+        values = [rng.random() for _ in range(1000)]
+        assert min(values) >= 0.0
+        assert max(values) < 1.0
+
+    def test_randint_covers_both_ends(self):
+        """randint は両端を含む"""
+        rng = CounterRandom(5)
+        values = {rng.randint(5, 15) for _ in range(2000)}
+        assert values == set(range(5, 16))
+
+    def test_streams_differ_by_game_index(self):
+        """試合番号が違えば乱数列も違う"""
+        assert CounterRandom(1, 0).random() != CounterRandom(1, 1).random()
+
+    def test_snapshot_and_restore_with_counter_random(self):
+        """scalar_rng を渡したシミュレーションでも状態を巻き戻せる"""
+        sim = PongSimulation(rng=scalar_rng(0, 0))
+        sim.step(500)
+        state = sim.snapshot()
+        sim.step(1000)
+        expected = sim.snapshot()
+        sim.restore(state)
+        sim.step(1000)
+        assert sim.snapshot() == expected
+
+
+class TestBatchPongEngine:
+    """一括シミュレーションのテストクラス"""
+
+    def test_matches_scalar_simulation_in_cpu_mode(self):
+        """CPUモードで各試合がスカラー版と一致する"""
+        engine = BatchPongEngine(8, seed=7)
+        sims = [PongSimulation(rng=scalar_rng(7, i)) for i in range(8)]
+        for _ in range(6000):
+            engine.update()
+            for sim in sims:
+                sim.update()
+        for i, sim in enumerate(sims):
+            assert _batch_state(engine, i) == _scalar_state(sim)
+        assert engine.left_score.sum() + engine.right_score.sum() > 0
+
+    def test_matches_scalar_simulation_with_inputs(self):
+        """2Pモードで試合ごとに異なる入力を与えてもスカラー版と一致する"""
+        engine = BatchPongEngine(8, cpu_mode=False, seed=3)
+        sims = [PongSimulation(cpu_mode=False, rng=scalar_rng(3, i)) for i in range(8)]
+        inputs = random.Random(11)
+        for _ in range(6000):
+            left = np.array([inputs.choice((-1, 0, 1)) for _ in range(8)])
+            right = np.array([inputs.choice((-1, 0, 1)) for _ in range(8)])
+            engine.update(left, right)
+            for i, sim in enumerate(sims):
+                sim.update(int(left[i]), int(right[i]))
+        for i, sim in enumerate(sims):
+            assert _batch_state(engine, i) == _scalar_state(sim)
+
+    def test_items_and_effects_are_exercised(self):
+        """長く進めるとアイテムが生成され効果も発動する"""
+        engine = BatchPongEngine(64, seed=1)
+        saw_effect = False
+        for _ in range(3000):
+            engine.update()
+            saw_effect |= bool(engine.effect_timer.any())
+        assert engine.item_active.any()
+        assert saw_effect
+
+    def test_step_advances_all_games(self):
+        """step(n) で全試合が n ステップ進む"""
+        engine = BatchPongEngine(4)
+        engine.step(10)
+        assert engine.tick == 10
+        assert np.all(engine.ball_x == 400 + 5 * 10)
+
+    def test_reset_games_resets_only_masked_games(self):
+        """reset_games はマスクした試合だけを初期状態に戻す"""
+        engine = BatchPongEngine(4, seed=2)
+        engine.step(3000)
+        before = _batch_state(engine, 1)
+        engine.reset_games(np.array([True, False, False, True]))
+        fresh = BatchPongEngine(1)
+        for i in (0, 3):
+            assert _batch_state(engine, i) == _batch_state(fresh, 0)
+            assert not engine.effect_timer[i].any()
+            assert engine.speed_effect_count[i] == 0
+        assert _batch_state(engine, 1) == before
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from pong_chaos import SpatialHash, ChaosSimulation
+from pong_core import HelperItem
+
+
+class TestSpatialHash:
+    """空間ハッシュのテストクラス"""
+
+    def test_pairs_include_all_close_pairs(self):
+        """セルの大きさ以内の組はすべて列挙され、重複しない"""
+        rng = random.Random(0)
+        points = [(rng.uniform(0, 400), rng.uniform(0, 300)) for _ in range(300)]
+        grid = SpatialHash(20)
+        for index, (x, y) in enumerate(points):
+            grid.insert(index, x, y)
+        pairs = [tuple(sorted(pair)) for pair in grid.pairs()]
+        assert len(pairs) == len(set(pairs))
+        close = {(i, j) for i in range(len(points)) for j in range(i + 1, len(points))
+                 if (points[i][0] - points[j][0]) ** 2 + (points[i][1] - points[j][1]) ** 2 < 20 ** 2}
+        assert close <= set(pairs)
+        assert len(pairs) < len(points) * (len(points) - 1) // 2 // 10  # 総当たりよりずっと少ない
+
+    def test_query_finds_neighbors(self):
+        """周囲のセルの物体を返し、遠くの物体は返さない"""
+        grid = SpatialHash(25)
+        grid.insert('near', 110, 95)
+        grid.insert('far', 300, 300)
+        assert grid.query(100, 100) == ['near']
+        assert grid.query_rect(280, 280, 320, 320) == ['far']
+        assert len(grid) == 2
+
+
+class TestChaosSimulation:
+    """カオスモードのテストクラス"""
+
+    def test_many_balls_and_items(self):
+        """たくさんのボールが動き、アイテムは max_items まで出る"""
+        sim = ChaosSimulation(n_balls=200, max_items=50, seed=1)
+        sim.step(300)
+        assert len(sim.balls) == 200
+        assert len(sim.helper_items) <= 50
+        assert sim.left_score + sim.right_score > 0
+        assert all(0 <= ball.x <= sim.width for ball in sim.balls)
+
+    def test_balls_bounce_off_each_other(self):
+        """正面衝突したボールは速度を交換する"""
+        sim = ChaosSimulation(n_balls=2, max_items=0, seed=0)
+        a, b = sim.balls
+        a.x, a.y, a.velocity_x, a.velocity_y = 388.0, 300.0, 5.0, 0.0
+        b.x, b.y, b.velocity_x, b.velocity_y = 412.0, 300.0, -5.0, 0.0
+        sim.update()
+        assert a.velocity_x == -5.0
+        assert b.velocity_x == 5.0
+
+    def test_slow_item_slows_only_the_collecting_ball(self):
+        """ボールで取った減速アイテムはそのボールだけを遅くする"""
+        sim = ChaosSimulation(n_balls=2, max_items=1, seed=0)
+        sim.item_spawn_interval = 10 ** 9
+        a, b = sim.balls
+        a.x, a.y, a.velocity_x, a.velocity_y = 400.0, 200.0, 4.0, 0.0
+        b.x, b.y, b.velocity_x, b.velocity_y = 400.0, 450.0, 4.0, 0.0
+        a.set_owner('left')
+        sim.helper_items.append(HelperItem(410, 200, 'slow_ball'))
+        sim.update()
+        assert sim.helper_items == []
+        assert a.velocity_x == 4.0 * 0.75
+        assert b.velocity_x == 4.0
+        assert sim.items_collected['left'] == 1
+
+    def test_snapshot_restores_all_balls(self):
+        """スナップショットにすべてのボールが入り、戻すと同じ試合の続きになる"""
+        sim = ChaosSimulation(n_balls=50, max_items=20, seed=2)
+        sim.step(100)
+        state = sim.snapshot()
+        sim.step(200)
+        expected = sim.snapshot()
+        sim.restore(state)
+        assert [(ball.x, ball.y) for ball in sim.balls] == [ball[:2] for ball in state[1]]
+        sim.step(200)
+        assert sim.snapshot() == expected
+
+    def test_swept_collisions_are_rejected(self):
+        """カオスモードではスイープ判定を使えない"""
+        with pytest.raises(ValueError):
+            ChaosSimulation(n_balls=2, swept_collisions=True)
@@ -0,0 +1,90 @@
+import pytest
+
+from pong_collision import sweep_circle, sweep_walls, sweep_paddle
+from pong_core import PongSimulation, Paddle, HelperItem
+
+
+class TestSweepFunctions:
+    """スイープ判定関数のテストクラス"""
+
+    def test_circle_time_of_impact(self):
+        """円に入る時刻を正確に求める"""
+        assert sweep_circle(0.0, 0.0, 100.0, 0.0, 50.0, 0.0, 10.0) == pytest.approx(0.4)
+
+    def test_circle_miss_and_moving_away(self):
+        """届かない場合と離れていく場合は None"""
+        assert sweep_circle(0.0, 0.0, 100.0, 0.0, 50.0, 30.0, 10.0) is None
+        assert sweep_circle(0.0, 0.0, -100.0, 0.0, 50.0, 0.0, 10.0) is None
+        assert sweep_circle(0.0, 0.0, 20.0, 0.0, 50.0, 0.0, 10.0) is None
+
+    def test_circle_already_overlapping(self):
+        """開始時点で重なっていれば時刻 0"""
+        assert sweep_circle(45.0, 0.0, 0.0, 0.0, 50.0, 0.0, 10.0) == 0.0
+
+    def test_walls(self):
+        """上下の壁にボールの縁が触れる時刻"""
+        assert sweep_walls(30.0, -40.0, 10, 600) == (0.5, 'top')
+        assert sweep_walls(570.0, 40.0, 10, 600) == (0.5, 'bottom')
+        assert sweep_walls(300.0, 40.0, 10, 600) is None
+
+    def test_paddle_face(self):
+        """パドルの面に触れる時刻（Y がパドルの範囲外なら当たらない）"""
+        paddle = Paddle(10, 260, 10, 80)
+        assert sweep_paddle(60.0, 300.0, -60.0, 0.0, 10, paddle, 'left') == pytest.approx(0.5)
+        assert sweep_paddle(60.0, 100.0, -60.0, 0.0, 10, paddle, 'left') is None
+        assert sweep_paddle(60.0, 300.0, 60.0, 0.0, 10, paddle, 'left') is None
+
+
+class TestSweptSimulation:
+    """スイープ判定を使ったシミュレーションのテストクラス"""
+
+    def _fast_ball_sim(self, swept):
+        sim = PongSimulation(cpu_mode=False, swept_collisions=swept)
+        sim.item_spawn_interval = 10 ** 9
+        # パドルの面を横切るときは範囲内だが、移動後の位置は範囲外
+        sim.ball.x, sim.ball.y = 60.0, 300.0
+        sim.ball.velocity_x, sim.ball.velocity_y = -50.0, 60.0
+        return sim
+
+    def test_fast_ball_does_not_tunnel(self):
+        """高速のボールでもパドルをすり抜けない"""
+        legacy = self._fast_ball_sim(swept=False)
+        legacy.update()
+        assert legacy.ball.velocity_x < 0  # 従来の判定ではすり抜ける
+
+        sim = self._fast_ball_sim(swept=True)
+        sim.update()
+        assert sim.ball.velocity_x == 50.0
+        assert sim.ball.x == pytest.approx(50.0)
+        assert sim.ball.owner == 'left'
+        assert sim.paddle_hits == 1
+
+    def test_result_does_not_depend_on_tick_rate(self):
+        """得点が入らない間はティックレート（1ティックの移動量）を変えても同じ軌道になる
+
+        得点とリセットはティック単位で起きるため、パドルを画面の高さにして得点させない。
+        """
+        positions = []
+        for tick_rate in (20, 60, 240):
+            sim = PongSimulation(cpu_mode=False, tick_rate=tick_rate, seed=1, swept_collisions=True)
+            sim.item_spawn_interval = 10 ** 9
+            for paddle in (sim.left_paddle, sim.right_paddle):
+                paddle.y, paddle.height = 0, 600
+            sim.step(tick_rate * 10)
+            positions.append((sim.ball.x, sim.ball.y, sim.paddle_hits))
+        for x, y, hits in positions:
+            assert x == pytest.approx(positions[0][0])
+            assert y == pytest.approx(positions[0][1])
+            assert hits == positions[0][2]
+
+    def test_ball_collects_item_along_path(self):
+        """移動の途中で触れたアイテムも取得する"""
+        sim = PongSimulation(cpu_mode=False, swept_collisions=True)
+        sim.item_spawn_interval = 10 ** 9
+        sim.ball.x, sim.ball.y = 300.0, 300.0
+        sim.ball.velocity_x, sim.ball.velocity_y = 100.0, 0.0
+        sim.ball.set_owner('left')
+        sim.helper_items.append(HelperItem(350, 300, 'fast_paddle'))
+        sim.update()
+        assert sim.helper_items == []
+        assert 'fast_paddle' in sim.active_effects['left']
@@ -0,0 +1,219 @@
+import random
+import subprocess
+import sys
+
+from pong_core import PongSimulation, HelperItem, FixedStepClock, TickScheduler, INPUT_UP, INPUT_DOWN
+
+
+class TestPongSimulation:
+    """シミュレーションコアのテストクラス"""
+
+    def test_core_does_not_import_pygame(self):
+        """pong_core をインポートしても pygame は読み込まれない"""
+        code = "import sys, pong_core; print('pygame' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_step_advances_tick(self):
+        """step(n) で n ステップ進む"""
+        sim = PongSimulation(rng=random.Random(0))
+        sim.step(250)
+        assert sim.tick == 250
+
+    def test_left_input_moves_paddle(self):
+        """左パドルが入力に従って移動する"""
+        sim = PongSimulation(cpu_mode=False)
+        start_y = sim.left_paddle.y
+        sim.update(left_input=INPUT_UP)
+        assert sim.left_paddle.y == start_y - 5
+        sim.update(left_input=INPUT_DOWN)
+        assert sim.left_paddle.y == start_y
+
+    def test_paddle_stays_on_screen(self):
+        """入力を続けてもパドルは画面外に出ない"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.step(200, left_input=INPUT_UP, right_input=INPUT_DOWN)
+        assert sim.left_paddle.y <= 0
+        assert sim.left_paddle.y > -5
+        assert sim.right_paddle.y >= sim.height - sim.right_paddle.height
+
+    def test_right_input_ignored_in_cpu_mode(self):
+        """CPUモードでは右パドルの入力を無視する"""
+        cpu_sim = PongSimulation(cpu_mode=True, rng=random.Random(3))
+        input_sim = PongSimulation(cpu_mode=True, rng=random.Random(3))
+        cpu_sim.step(100)
+        input_sim.step(100, right_input=INPUT_UP)
+        assert cpu_sim.right_paddle.y == input_sim.right_paddle.y
+
+    def test_ball_passing_paddle_scores(self):
+        """ボールが右端を越えると左プレイヤーに得点が入る"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.right_paddle.y = 0
+        sim.ball.y = 500.0
+        sim.ball.velocity_y = 0.0
+        sim.step(200)
+        assert sim.left_score == 1
+        assert sim.ball.owner == 'neutral'
+
+    def test_fast_paddle_effect_speeds_up_paddle(self):
+        """fast_paddle 効果中はパドルが速く動く"""
+        sim = PongSimulation(cpu_mode=False)
+        sim._apply_item_effect('left', 'fast_paddle')
+        start_y = sim.left_paddle.y
+        sim.update(left_input=INPUT_UP)
+        assert sim.left_paddle.y == start_y - 8
+
+    def test_paddle_collects_item(self):
+        """パドルに触れたアイテムの効果がそのプレイヤーに付く"""
+        sim = PongSimulation(cpu_mode=False)
+        paddle = sim.left_paddle
+        sim.helper_items.append(HelperItem(paddle.x + 5, paddle.y + 40, 'big_paddle'))
+        sim.update()
+        assert sim.helper_items == []
+        assert sim.left_paddle.height == 120
+        assert 'big_paddle' in sim.active_effects['left']
+
+    def test_same_seed_gives_same_result(self):
+        """同じ乱数シードなら同じ結果になる"""
+        first = PongSimulation(rng=random.Random(42))
+        second = PongSimulation(rng=random.Random(42))
+        first.step(5000)
+        second.step(5000)
+        assert (first.left_score, first.right_score) == (second.left_score, second.right_score)
+        assert first.ball.x == second.ball.x
+
+    def test_tick_rate_keeps_real_time_speed(self):
+        """ティックレートを変えても1秒あたりの移動量は同じ"""
+        base = PongSimulation(cpu_mode=False)
+        fine = PongSimulation(cpu_mode=False, tick_rate=120)
+        base.step(10, left_input=INPUT_UP)
+        fine.step(20, left_input=INPUT_UP)
+        assert fine.ball.x == base.ball.x
+        assert fine.ball.y == base.ball.y
+        assert fine.left_paddle.y == base.left_paddle.y
+
+    def test_tick_rate_scales_timers(self):
+        """時間はティック数に換算される"""
+        sim = PongSimulation(tick_rate=120)
+        assert sim.item_spawn_interval == 600
+        assert sim.effect_duration == 1200
+        assert sim.seconds_to_ticks(0.5) == 60
+
+    def test_effect_expires_after_duration(self):
+        """効果は適用したティックから effect_duration ティックで切れる"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.update()
+        sim._apply_item_effect('left', 'big_paddle')
+        assert sim.effect_remaining('left', 'big_paddle') == sim.effect_duration - 1
+        sim.step(sim.effect_duration - 2)
+        assert sim.effect_remaining('left', 'big_paddle') == 1
+        assert sim.left_paddle.height == 120
+        sim.update()
+        assert 'big_paddle' not in sim.active_effects['left']
+        assert sim.left_paddle.height == 80
+
+    def test_reapplied_effect_is_extended(self):
+        """同じ効果を取り直すと期限が延びる"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.update()
+        sim._apply_item_effect('left', 'fast_paddle')
+        sim.step(300)
+        sim._apply_item_effect('left', 'fast_paddle')
+        sim.step(sim.effect_duration - 2)
+        assert 'fast_paddle' in sim.active_effects['left']
+
+    def test_slow_ball_is_reverted_on_expiry(self):
+        """ボール減速は期限が来ると元の速度に戻る"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.update()
+        sim._apply_item_effect('right', 'slow_ball')
+        assert sim.ball.velocity_x == 5 * 0.75
+        sim.step(sim.effect_duration - 1)
+        assert sim.ball_speed_effects == []
+        assert abs(sim.ball.velocity_x) == 5
+
+    def test_item_disappears_after_lifetime(self):
+        """アイテムは生成から item_lifetime ティックで消える"""
+        sim = PongSimulation(cpu_mode=False, seed=1)
+        sim.item_spawn_timer = sim.item_spawn_interval - 1
+        sim.ball.velocity_x = sim.ball.velocity_y = 0.0  # アイテムに当たらないようにする
+        sim.ball.y = 10.0
+        sim.update()
+        assert len(sim.helper_items) == 1
+        sim.item_spawn_interval = sim.item_lifetime * 2  # 次のアイテムは出さない
+        sim.step(sim.item_lifetime - 2)
+        assert len(sim.helper_items) == 1
+        sim.update()
+        assert sim.helper_items == []
+
+    def test_entities_have_no_instance_dict(self):
+        """エンティティはスロットで属性を持ち、色の表はクラスで共有する"""
+        sim = PongSimulation()
+        for entity in (sim.ball, sim.left_paddle, HelperItem(0, 0, 'slow_ball')):
+            assert not hasattr(entity, '__dict__')
+        assert HelperItem(0, 0, 'big_paddle').colors is HelperItem(1, 1, 'slow_ball').colors
+
+    def test_restore_continues_identically(self):
+        """スナップショットから戻したシミュレーションは元と同じに進む"""
+        sim = PongSimulation(seed=5)
+        sim.step(600)
+        sim._apply_item_effect('left', 'slow_ball')
+        sim._apply_item_effect('right', 'big_paddle')
+        state = sim.snapshot()
+        copy = PongSimulation(seed=99)
+        copy.restore(state)
+        assert copy.snapshot() == state
+        sim.step(3000)
+        copy.step(3000)
+        assert copy.snapshot() == sim.snapshot()
+
+    def test_restore_rewinds(self):
+        """同じシミュレーションを過去の状態に巻き戻せる"""
+        sim = PongSimulation(seed=8)
+        state = sim.snapshot()
+        sim.step(1000)
+        later = sim.snapshot()
+        sim.restore(state)
+        assert sim.tick == 0
+        sim.step(1000)
+        assert sim.snapshot() == later
+
+
+class TestTickScheduler:
+    """期限イベントスケジューラのテストクラス"""
+
+    def test_pops_only_due_events_in_order(self):
+        """期限の来たイベントだけをティック順・登録順に返す"""
+        scheduler = TickScheduler()
+        scheduler.schedule(10, 'b')
+        scheduler.schedule(5, 'a')
+        scheduler.schedule(10, 'c')
+        scheduler.schedule(20, 'd')
+        assert scheduler.pop_due(4) == []
+        assert scheduler.pop_due(10) == ['a', 'b', 'c']
+        assert len(scheduler) == 1
+
+
+class TestFixedStepClock:
+    """固定タイムステップのテストクラス"""
+
+    def test_accumulates_partial_frames(self):
+        """1ティックに満たない時間は持ち越される"""
+        clock = FixedStepClock(tick_rate=60)
+        assert clock.advance(0.01) == 0
+        assert clock.advance(0.01) == 1
+        assert 0.0 < clock.alpha < 1.0
+
+    def test_runs_several_ticks_for_long_frame(self):
+        """長いフレームでは複数ティック進める"""
+        clock = FixedStepClock(tick_rate=100)
+        assert clock.advance(0.035) == 3
+        assert abs(clock.alpha - 0.5) < 1e-9
+
+    def test_catch_up_is_capped(self):
+        """追いつき処理は max_steps で打ち切り、残りは捨てる"""
+        clock = FixedStepClock(tick_rate=60, max_steps=5)
+        assert clock.advance(1.0) == 5
+        assert clock.alpha < 1.0
+        assert clock.dropped_time > 0.9
+        assert clock.advance(0.0) == 0
@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from pong_batch import scalar_rng
+from pong_core import PongSimulation
+from pong_env import OBSERVATION_SIZE, PongEnv, VectorPongEnv
+
+
+class TestPongEnv:
+    """1試合分の環境のテストクラス"""
+
+    def test_reset_returns_observation(self):
+        """reset() は float32 の観測と info を返す"""
+        env = PongEnv(seed=1)
+        observation, info = env.reset()
+        assert observation.shape == (OBSERVATION_SIZE,)
+        assert observation.dtype == np.float32
+        assert info == {}
+
+    def test_episode_ends_with_point(self):
+        """どちらかが得点するとエピソードが終わり、報酬は ±1"""
+        env = PongEnv(seed=2)
+        env.reset()
+        for _ in range(5000):
+            _, reward, terminated, truncated, _ = env.step(1)
+            if terminated:
+                break
+        assert terminated and not truncated
+        assert reward in (1.0, -1.0)
+
+    def test_truncates_at_max_steps(self):
+        """得点がなくても max_episode_steps で打ち切る"""
+        env = PongEnv(seed=3, max_episode_steps=5)
+        env.reset()
+        results = [env.step(0)[3] for _ in range(5)]
+        assert results == [False, False, False, False, True]
+
+    def test_same_seed_same_episode(self):
+        """同じシードなら同じ観測の列になる"""
+        observations = []
+        for _ in range(2):
+            env = PongEnv()
+            env.reset(seed=4)
+            observations.append([env.step(step % 3)[0] for step in range(300)])
+        assert all((a == b).all() for a, b in zip(*observations))
+
+    def test_step_before_reset_raises(self):
+        """reset() の前の step() はエラー"""
+        with pytest.raises(RuntimeError):
+            PongEnv().step(1)
+
+
+class TestVectorPongEnv:
+    """ベクトル化環境のテストクラス"""
+
+    def test_observation_matches_scalar_env(self):
+        """各試合の観測が同じ乱数列のスカラー版の観測と一致する"""
+        vector = VectorPongEnv(4, seed=5)
+        vector.reset()
+        envs = []
+        for i in range(4):
+            env = PongEnv()
+            env.sim = PongSimulation(rng=scalar_rng(5, i))
+            envs.append(env)
+        actions = np.array([0, 1, 2, 1])
+        for _ in range(600):
+            observation, _, terminated, _, _ = vector.step(actions)
+            if terminated.any():
+                break
+            for i, env in enumerate(envs):
+                np.testing.assert_array_equal(observation[i], env.step(actions[i])[0])
+
+    def test_scored_games_are_reset(self):
+        """得点が入った試合だけがリセットされ、最後の観測は info に残る"""
+        env = VectorPongEnv(16, seed=6)
+        env.reset()
+        for _ in range(5000):
+            observation, reward, terminated, _, info = env.step(np.ones(16, dtype=int))
+            if terminated.any():
+                break
+        done = info['done_index']
+        assert (np.flatnonzero(terminated) == done).all()
+        assert (reward[done] != 0).all()
+        assert info['final_observation'].shape == (len(done), OBSERVATION_SIZE)
+        assert (env.engine.left_score[done] == 0).all()
+        assert (env.engine.right_score[done] == 0).all()
+        np.testing.assert_allclose(observation[done, 0], 0.5)
+
+    def test_does_not_import_pygame(self):
+        """環境は pygame を読み込まない"""
+        code = "import sys, pong_env; pong_env.VectorPongEnv(2).reset(); print('pygame' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert result.stdout.strip() == 'False'
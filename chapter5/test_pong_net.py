@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+from pong_core import PongSimulation, INPUT_UP, INPUT_DOWN
+from pong_net import (
+    encode_packet, decode_packet, LossyChannel, UdpTransport, RollbackSession, simulate_netplay,
+)
+
+
+class TestTransport:
+    """パケットと通信路のテストクラス"""
+
+    def test_packet_round_trip(self):
+        """エンコードしたパケットを元に戻せる"""
+        data = encode_packet(120, 98, [-1, 0, 1, 1])
+        assert decode_packet(data) == (120, 98, [-1, 0, 1, 1])
+        with pytest.raises(ValueError):
+            decode_packet(data[:-1])
+
+    def test_lossy_channel_delays_and_drops(self):
+        """遅延したティックに届き、損失率に応じて失われる"""
+        channel = LossyChannel(latency=3)
+        a, b = channel.endpoints()
+        a.send(b'x')
+        channel.advance(2)
+        assert b.receive() == []
+        channel.advance()
+        assert b.receive() == [b'x']
+        lossy = LossyChannel(loss=1.0)
+        c, d = lossy.endpoints()
+        c.send(b'y')
+        assert d.receive() == [] and lossy.dropped == 1
+
+    def test_udp_transport_on_localhost(self):
+        """UDP で自分自身の別ソケットに送れる"""
+        a = UdpTransport(('127.0.0.1', 0), None)
+        b = UdpTransport(('127.0.0.1', 0), a.socket.getsockname())
+        a.remote_address = b.socket.getsockname()
+        try:
+            a.send(b'hello')
+            received = []
+            for _ in range(100):
+                received = b.receive()
+                if received:
+                    break
+                time.sleep(0.01)
+            assert received == [b'hello']
+        finally:
+            a.close()
+            b.close()
+
+
+class TestRollbackSession:
+    """ロールバックセッションのテストクラス"""
+
+    def test_sessions_stay_in_sync_under_loss(self):
+        """遅延・揺らぎ・損失があっても両端の状態が一致する"""
+        result = simulate_netplay(frames=600, latency=4, jitter=3, loss=0.2, seed=2)
+        assert result['in_sync']
+        assert result['dropped'] > 0
+        assert result['left']['rollbacks'] > 0
+        assert result['left']['max_depth'] <= 8
+
+    def test_no_rollback_without_latency(self):
+        """遅延が入力遅延より小さければ予測は不要でロールバックしない"""
+        result = simulate_netplay(frames=300, latency=1, jitter=0, loss=0.0, input_delay=2)
+        assert result['in_sync']
+        assert result['left']['rollbacks'] == result['right']['rollbacks'] == 0
+
+    def test_misprediction_rolls_back_to_late_input(self):
+        """予測と違う入力が遅れて届くと、そのティックからやり直す"""
+        channel = LossyChannel(latency=5)
+        left_end, right_end = channel.endpoints()
+        left = RollbackSession(PongSimulation(cpu_mode=False, seed=1), left_end, 'left', input_delay=0)
+        right = RollbackSession(PongSimulation(cpu_mode=False, seed=1), right_end, 'right', input_delay=0)
+        for _ in range(3):
+            left.advance(INPUT_UP)
+            right.advance(INPUT_DOWN)
+            channel.advance()
+        assert left.rollbacks == 0
+        channel.advance(5)
+        left.poll()
+        assert left.rollbacks == 1
+        assert left.max_rollback_depth == 3
+        reference = PongSimulation(cpu_mode=False, seed=1)
+        reference.step(3, left_input=INPUT_UP, right_input=INPUT_DOWN)
+        assert left.sim.snapshot() == reference.snapshot()
+
+    def test_stalls_when_too_far_ahead(self):
+        """相手の入力が来ないと max_prediction ティック先で止まる"""
+        channel = LossyChannel()
+        session = RollbackSession(PongSimulation(cpu_mode=False, seed=0), channel.endpoints()[0],
+                                  input_delay=0, max_prediction=4)
+        advanced = sum(session.advance(INPUT_UP) for _ in range(10))
+        assert advanced == 4
+        assert session.stalls == 6
+
+    def test_netplay_games_share_one_match(self, monkeypatch):
+        """ネット対戦の PongGame 2つが同じ試合を進める"""
+        monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+        import pygame
+        from pong_2p import NetplayGame
+        channel = LossyChannel(latency=2)
+        left_end, right_end = channel.endpoints()
+        try:
+            left = NetplayGame(left_end, 'left', seed=4)
+            right = NetplayGame(right_end, 'right', seed=4)
+            left.left_input = INPUT_UP
+            right.left_input = INPUT_DOWN  # 自分のパドルはどちらも W/S
+            for _ in range(60):
+                left.update()
+                right.update()
+                channel.advance()
+            for _ in range(10):
+                left.session.poll()
+                left.session._send()
+                right.session.poll()
+                right.session._send()
+                channel.advance()
+            assert left.tick == right.tick == 60
+            assert left.snapshot() == right.snapshot()
+            assert left.left_paddle.y < 260 < left.right_paddle.y
+        finally:
+            pygame.quit()
@@ -0,0 +1,90 @@
+import json
+
+from pong_profiler import FrameProfiler, percentile
+
+
+class FakeClock:
+    """呼ぶたびに決まった時間だけ進む時計"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.step = 0.001
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class Worker:
+    def work(self):
+        return 'done'
+
+
+class TestFrameProfiler:
+    """フレーム時間プロファイラのテストクラス"""
+
+    def _run_frames(self, profiler, n):
+        for _ in range(n):
+            profiler.begin_frame()
+            profiler.mark('events')
+            profiler.mark('update')
+            profiler.mark('draw')
+            profiler.end_frame()
+
+    def test_disabled_records_nothing(self):
+        """無効なときは何も記録しない"""
+        profiler = FrameProfiler(clock=FakeClock())
+        self._run_frames(profiler, 5)
+        assert profiler.count == 0
+        assert profiler.summary()['fps'] == 0.0
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        """容量を超えると古いフレームから上書きする"""
+        clock = FakeClock()
+        profiler = FrameProfiler(capacity=4, enabled=True, clock=clock)
+        self._run_frames(profiler, 3)
+        clock.step = 0.002
+        self._run_frames(profiler, 3)
+        times = profiler.frame_times()
+        assert profiler.count == 4
+        assert times[0] < times[1]  # 最も古いのは 1ms 刻みのフレーム
+        assert times[1:] == [times[-1]] * 3
+        assert abs(profiler.frame_times('update')[-1] - 0.002) < 1e-9
+
+    def test_summary_percentiles(self):
+        """パーセンタイルと FPS を求める"""
+        values = [i / 1000 for i in range(1, 101)]
+        assert percentile(values, 50) == 0.05
+        assert percentile(values, 99) == 0.099
+        profiler = FrameProfiler(enabled=True, clock=FakeClock())
+        self._run_frames(profiler, 10)
+        stats = profiler.summary()
+        assert stats['frames'] == 10
+        assert abs(stats['p50_ms'] - 4.0) < 1e-6
+        assert abs(stats['fps'] - 250.0) < 1e-6
+
+    def test_instrument_and_uninstrument(self):
+        """包んだメソッドの所要時間を記録し、外すと元に戻る"""
+        profiler = FrameProfiler(enabled=True, clock=FakeClock())
+        worker = Worker()
+        profiler.instrument(worker, 'work', 'work')
+        profiler.begin_frame()
+        assert worker.work() == 'done'
+        profiler.end_frame()
+        assert abs(profiler.frame_times('work')[0] - 0.001) < 1e-9
+        profiler.uninstrument()
+        assert 'work' not in vars(worker)
+
+    def test_export_chrome_trace(self, tmp_path):
+        """Chrome のトレースイベント形式で書き出す"""
+        profiler = FrameProfiler(enabled=True, clock=FakeClock())
+        profiler.instrument(Worker(), 'work', 'work')
+        self._run_frames(profiler, 2)
+        path = tmp_path / 'trace.json'
+        profiler.export_chrome_trace(path)
+        with open(path) as f:
+            events = json.load(f)['traceEvents']
+        names = [e['name'] for e in events if e['ph'] == 'X']
+        assert names == ['frame', 'events', 'update', 'draw'] * 2
+        assert all(e['dur'] > 0 for e in events if e['ph'] == 'X')
+        assert sum(e['ph'] == 'C' for e in events) == 2
@@ -0,0 +1,93 @@
+import pygame
+import pytest
+
+from pong_render import SpriteAtlas, TextRenderCache
+
+
+class TestTextRenderCache:
+    """テキスト描画キャッシュのテストクラス"""
+
+    def test_same_text_is_rendered_once(self):
+        """同じ (テキスト, サイズ, 色) は2回目からキャッシュを返す"""
+        cache = TextRenderCache()
+        first = cache.render("12", 74, (255, 255, 255))
+        second = cache.render("12", 74, (255, 255, 255))
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_color_and_size_are_part_of_key(self):
+        """色やサイズが違えば別のサーフェスになる"""
+        cache = TextRenderCache()
+        cache.render("P+", 24, (0, 0, 0))
+        cache.render("P+", 24, (255, 0, 0))
+        cache.render("P+", 18, (0, 0, 0))
+        assert cache.misses == 3
+
+    def test_font_is_loaded_once_per_size(self):
+        """フォントはサイズごとに1回だけ読み込む"""
+        cache = TextRenderCache()
+        assert cache.font(24) is cache.font(24)
+        assert isinstance(cache.font(24), pygame.font.Font)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """上限を超えると最も長く使われていないものから捨てる"""
+        cache = TextRenderCache(max_entries=2)
+        cache.render("a", 24, (0, 0, 0))
+        cache.render("b", 24, (0, 0, 0))
+        cache.render("a", 24, (0, 0, 0))  # a を最近使ったことにする
+        cache.render("c", 24, (0, 0, 0))
+        assert ("a", 24, (0, 0, 0)) in cache.surfaces
+        assert ("b", 24, (0, 0, 0)) not in cache.surfaces
+
+    def test_stats_reports_hit_rate(self):
+        """stats でヒット率を確認できる"""
+        cache = TextRenderCache()
+        for _ in range(4):
+            cache.render("0", 74, (255, 255, 255))
+        stats = cache.stats()
+        assert stats['hits'] == 3
+        assert stats['hit_rate'] == 0.75
+        assert stats['entries'] == 1
+
+
+class TestSpriteAtlas:
+    """スプライトアトラスのテストクラス（ダミーのビデオドライバで実行）"""
+
+    @pytest.fixture
+    def screen(self, monkeypatch):
+        monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        yield pygame.display.set_mode((200, 100))
+        pygame.quit()
+
+    def test_ball_sprite_matches_drawn_circle(self, screen):
+        """ボールのスプライトは draw.circle と同じ画素になる"""
+        atlas = SpriteAtlas()
+        atlas.ensure(screen)
+        screen.fill((0, 0, 0))
+        pygame.draw.circle(screen, (255, 100, 100), (50, 50), 10)
+        expected = pygame.image.tobytes(screen, 'RGB')
+        screen.fill((0, 0, 0))
+        screen.blit(atlas.ball('left', 10), (40, 40))
+        assert pygame.image.tobytes(screen, 'RGB') == expected
+
+    def test_known_states_are_built_once(self, screen):
+        """既知の見た目は最初に作られ、以降は同じサーフェスを返す"""
+        atlas = SpriteAtlas()
+        atlas.ensure(screen)
+        count = len(atlas.sprites)
+        sprite = atlas.paddle(10, 120, (0, 255, 0))
+        atlas.ensure(screen)
+        assert atlas.paddle(10, 120, (0, 255, 0)) is sprite
+        assert atlas.item('slow_ball', 15) is atlas.item('slow_ball', 15)
+        assert (len(atlas.sprites), atlas.builds) == (count, 1)
+
+    def test_rebuilt_when_display_changes(self, screen):
+        """表示サーフェスの大きさが変わるか invalidate() すると作り直す"""
+        atlas = SpriteAtlas()
+        atlas.ensure(screen)
+        atlas.ensure(pygame.display.set_mode((300, 100)))
+        assert atlas.builds == 2
+        atlas.invalidate()
+        atlas.ensure(pygame.display.get_surface())
+        assert atlas.builds == 3
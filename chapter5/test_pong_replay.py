@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from pong_ai import CpuController
+from pong_core import PongSimulation, INPUT_UP, INPUT_DOWN
+from pong_replay import ReplayRecorder, ReplayPlayer, read_replay
+
+
+def _record_match(path, ticks, cpu_mode=True, seed=1234, cpu_controller=None):
+    """ランダムな入力で試合を記録し、最終状態のシミュレーションを返す"""
+    sim = PongSimulation(cpu_mode=cpu_mode, seed=seed, cpu_controller=cpu_controller)
+    inputs = random.Random(99)
+    left = right = 0
+    with ReplayRecorder(path, sim) as recorder:
+        for _ in range(ticks):
+            if inputs.random() < 0.05:  # 入力はときどきしか変わらない
+                left = inputs.choice((INPUT_UP, 0, INPUT_DOWN))
+                right = inputs.choice((INPUT_UP, 0, INPUT_DOWN))
+            recorder.record(left, right)
+            sim.update(left, right)
+    return sim
+
+
+def _state(sim):
+    """比較用の状態"""
+    return (sim.tick, sim.ball.x, sim.ball.y, sim.left_paddle.y, sim.right_paddle.y,
+            sim.left_score, sim.right_score, len(sim.helper_items))
+
+
+class TestSeededSimulation:
+    """シード付き乱数のテストクラス"""
+
+    def test_seed_makes_match_reproducible(self):
+        """同じシードなら同じ試合になる"""
+        first = PongSimulation(seed=5)
+        second = PongSimulation(seed=5)
+        first.step(3000)
+        second.step(3000)
+        assert _state(first) == _state(second)
+
+    def test_games_do_not_share_random_state(self):
+        """別のゲームの乱数消費に影響されない"""
+        first = PongSimulation(seed=5)
+        other = PongSimulation(seed=6)
+        second = PongSimulation(seed=5)
+        for _ in range(2000):
+            first.update()
+            other.update()
+        second.step(2000)
+        assert _state(first) == _state(second)
+
+
+class TestReplay:
+    """リプレイ記録・再生のテストクラス"""
+
+    def test_replay_reconstructs_final_state(self, tmp_path):
+        """再生すると記録時と同じ状態になる"""
+        path = tmp_path / "match.prep"
+        original = _record_match(path, 5000, cpu_mode=False)
+        player = ReplayPlayer(path)
+        assert player.step() == 5000
+        assert _state(player.sim) == _state(original)
+
+    def test_replay_keeps_cpu_controller(self, tmp_path):
+        """classic 以外の CPU で記録しても同じ試合を再現できる"""
+        path = tmp_path / "match.prep"
+        original = _record_match(path, 5000, seed=3, cpu_controller='hard')
+        player = ReplayPlayer(path)
+        player.step()
+        assert vars(CpuController(**player.config['cpu_controller'])) == vars(CpuController.from_difficulty('hard'))
+        assert player.sim.snapshot() == original.snapshot()
+
+    def test_recording_is_compact(self, tmp_path):
+        """連続した同じ入力はまとめて記録される"""
+        path = tmp_path / "match.prep"
+        _record_match(path, 5000)
+        config, codes = read_replay(path)
+        assert len(codes) == 5000
+        assert config['seed'] == 1234
+        assert path.stat().st_size < 1000
+
+    def test_seek_backwards_uses_snapshots(self, tmp_path):
+        """巻き戻しても同じ状態を再現できる"""
+        path = tmp_path / "match.prep"
+        _record_match(path, 4000)
+        player = ReplayPlayer(path, snapshot_interval=500)
+        player.seek(2500)
+        expected = _state(player.sim)
+        player.step()
+        player.seek(2500)
+        assert _state(player.sim) == expected
+        assert 2500 in player.snapshots
+
+    def test_rejects_broken_file(self, tmp_path):
+        """形式の違うファイルは読み込まない"""
+        path = tmp_path / "broken.prep"
+        path.write_bytes(b"not a replay file at all")
+        with pytest.raises(ValueError):
+            read_replay(path)
@@ -0,0 +1,81 @@
+import csv
+
+import pytest
+
+from pong_ai import CpuController
+from pong_core import PongSimulation
+from pong_tournament import parse_grid, expand_grid, play_match, run_tournament
+
+
+class TestGrid:
+    """パラメータグリッドのテストクラス"""
+
+    def test_parse_grid_converts_values(self):
+        """指定文字列をパラメータごとの型に変換する"""
+        grid = parse_grid(['cpu_speed=3,4', 'reaction_delay=5-15,2-6', 'item_spawn_interval=150'])
+        assert grid == {'cpu_speed': [3.0, 4.0], 'reaction_delay': [(5, 15), (2, 6)],
+                        'item_spawn_interval': [150]}
+
+    def test_unknown_parameter_raises(self):
+        """未知のパラメータはエラーになる"""
+        with pytest.raises(ValueError):
+            parse_grid(['paddle_color=red'])
+
+    def test_expand_grid_gives_all_combinations(self):
+        """全組み合わせを列挙する"""
+        configs = expand_grid({'cpu_speed': [3, 4], 'move_threshold': [10, 20, 30]})
+        assert len(configs) == 6
+        assert {'cpu_speed': 4, 'move_threshold': 30} in configs
+        assert expand_grid({}) == [{}]
+
+
+class TestMatches:
+    """試合の実行と集計のテストクラス"""
+
+    def test_match_is_reproducible(self):
+        """同じシードなら同じ結果になる"""
+        params = {'cpu_speed': 5.0, 'slow_multiplier': 0.5}
+        assert play_match(params, 7, max_ticks=3000) == play_match(params, 7, max_ticks=3000)
+
+    def test_match_stops_at_target_score(self):
+        """どちらかが目標点に達すると終わる"""
+        result = play_match({}, 1, target_score=2)
+        assert max(result['left_score'], result['right_score']) == 2
+        assert result['rallies'] == result['left_score'] + result['right_score']
+
+    def test_left_controller_moves_left_paddle(self):
+        """side='left' のコントローラーは左パドルを動かす"""
+        sim = PongSimulation(seed=0)
+        controller = CpuController(side='left', miss_chance=0.0)
+        controller.target_y = 0
+        controller.delay_remaining = 100
+        start_y = sim.left_paddle.y
+        controller.update(sim)
+        assert sim.left_paddle.y < start_y
+        assert sim.right_paddle.y == sim.height // 2 - 40
+
+    def test_item_settings_are_applied(self):
+        """アイテムの倍率を設定で変えられる"""
+        sim = PongSimulation(cpu_mode=False)
+        sim.big_paddle_factor = 2.0
+        sim.slow_ball_multiplier = 0.5
+        sim._apply_item_effect('left', 'big_paddle')
+        sim._apply_item_effect('left', 'slow_ball')
+        assert sim.left_paddle.height == 160
+        assert sim.ball.velocity_x == 2.5
+        assert sim.items_collected == {'left': 2, 'right': 0}
+
+    def test_results_do_not_depend_on_workers(self, tmp_path):
+        """ワーカー数を変えても同じ結果が書き出される"""
+        grid = {'cpu_speed': [3.0, 6.0], 'reaction_delay': [(2, 6)]}
+        serial = tmp_path / 'serial.csv'
+        parallel = tmp_path / 'parallel.csv'
+        assert run_tournament(grid, serial, matches=2, workers=1, max_ticks=2000) == 4
+        run_tournament(grid, parallel, matches=2, workers=2, max_ticks=2000)
+        with open(serial, newline='') as f:
+            rows = list(csv.DictReader(f))
+        with open(parallel, newline='') as f:
+            assert list(csv.DictReader(f)) == rows
+        assert len(rows) == 4
+        assert rows[0]['reaction_delay'] == '2-6'
+        assert int(rows[0]['ticks']) <= 2000
@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+from fizzbuzz import fizzbuzz
+from run_fizzbuzz import format_lines, iter_chunks, main, write_fizzbuzz
+
+
+def _expected(start, stop):
+    """1行ずつ書式化した場合の出力"""
+    return "".join(f"{i:3d}: {fizzbuzz(i)}\n" for i in range(start, stop)).encode('ascii')
+
+
+class TestFormatLines:
+    """出力の書式化のテストクラス"""
+    
+    def test_matches_per_line_format(self):
+        """1行ずつ f-string で書いた場合と同じバイト列になる"""
+        assert format_lines(0, 1000) == _expected(0, 1000)
+    
+    def test_chunks_join_to_same_output(self):
+        """ブロックに分けても、つなげると同じ出力になる"""
+        assert b"".join(iter_chunks(90, 1234, chunk_size=7)) == _expected(90, 1234)
+    
+    def test_empty_range(self):
+        """stop が start 以下なら何も出力しない"""
+        assert list(iter_chunks(10, 10)) == []
+    
+    def test_raises_error_for_negative_start(self):
+        """負の数を渡すと ValueError を発生させる"""
+        with pytest.raises(ValueError, match="引数は0以上の整数である必要があります"):
+            list(iter_chunks(-5, -1))
+
+
+class TestWriter:
+    """書き出しのテストクラス"""
+    
+    def test_write_to_stream(self):
+        """バイナリのストリームに書き出せる"""
+        stream = io.BytesIO()
+        write_fizzbuzz(stream, 1, 500, chunk_size=64)
+        assert stream.getvalue() == _expected(1, 500)
+    
+    def test_main_writes_output_file(self, tmp_path):
+        """--output を指定するとファイルに結果だけを書く"""
+        path = tmp_path / "fizzbuzz.txt"
+        main(['--start', '5', '--stop', '300', '--output', str(path)])
+        assert path.read_bytes() == _expected(5, 300)
+    
+    def test_main_default_output(self, capfd):
+        """引数なしでは見出しと1から100までを標準出力に出す"""
+        main([])
+        out = capfd.readouterr().out
+        assert out == "FizzBuzz (1-100):\n" + "-" * 20 + "\n" + _expected(1, 101).decode()
+    
+    def test_main_rejects_negative_range(self, capsys):
+        """負の範囲は使い方のエラーにする（トレースバックを出さない）"""
+        with pytest.raises(SystemExit) as excinfo:
+            main(['--start', '-5'])
+        assert excinfo.value.code == 2
+        assert "引数は0以上の整数である必要があります" in capsys.readouterr().err